@@ -70,15 +70,21 @@ setup(
         'src/scs_mfr/aws_group_setup.py',
         'src/scs_mfr/aws_identity.py',
         'src/scs_mfr/aws_project.py',
+        'src/scs_mfr/baseline_colocation.py',
+        'src/scs_mfr/baseline_drift.py',
+        'src/scs_mfr/baseline_history.py',
         'src/scs_mfr/configuration.py',
         'src/scs_mfr/csv_logger_conf.py',
         'src/scs_mfr/csv_reader.py',
         'src/scs_mfr/csv_writer.py',
         'src/scs_mfr/dfe_id.py',
+        'src/scs_mfr/dfe_station.py',
         'src/scs_mfr/dfe_test.py',
+        'src/scs_mfr/dfe_test_summary.py',
         'src/scs_mfr/display_conf.py',
         'src/scs_mfr/eeprom_read.py',
         'src/scs_mfr/eeprom_write.py',
+        'src/scs_mfr/fleet_configuration.py',
         'src/scs_mfr/fuel_gauge_calib.py',
         'src/scs_mfr/gas_baseline.py',
         'src/scs_mfr/gas_model_conf.py',
@@ -103,6 +109,7 @@ setup(
         'src/scs_mfr/scd30_conf.py',
         'src/scs_mfr/schedule.py',
         'src/scs_mfr/shared_secret.py',
+        'src/scs_mfr/socket_sender.py',
         'src/scs_mfr/sht_conf.py',
         'src/scs_mfr/system_id.py',
         'src/scs_mfr/timezone.py'
@@ -17,12 +17,27 @@ an ozone sensor is identified as Ox.
 
 Note that the scs_dev/gasses_sampler process must be restarted for changes to take effect.
 
+Every change is also appended to the baseline history, so that the offset in force at any past time can be found
+with the baseline_history utility. AFE sensors are recorded by gas name where the AFE calibration is available.
+
+If the --file flag is set, the corrections listed in the given JSON or CSV file are applied together - the baseline
+document is loaded and saved once, however many corrections are listed. Corrections that name another device tag are
+ignored, so that one list may be used for a fleet. Each correction gives a gas and exactly one of set, offset or
+correct and reported values, and may give the rec, hmd and tmp of its sample. If any correction cannot be applied,
+no change is saved. The old and new offset of each corrected gas are written to stdout.
+
 SYNOPSIS
 afe_baseline.py [{ -b GAS  | { { -s | -o } GAS VALUE | -c GAS CORRECT REPORTED }
-[-r SAMPLE_REC -t SAMPLE_TEMP -m SAMPLE_HUMID] | -z | -d }] [-i INDENT] [-v]
+[-r SAMPLE_REC -t SAMPLE_TEMP -m SAMPLE_HUMID] | -f FILE | -z | -d }] [-i INDENT] [-v]
 
 EXAMPLES
 ./baseline.py -c NO2 10 23
+./afe_baseline.py -v -f ~/colocation/corrections.csv
+
+CORRECTIONS EXAMPLE
+tag,gas,correct,reported
+scs-bgx-431,NO2,10,23
+scs-bgx-431,Ox,15,9
 
 DOCUMENT EXAMPLE
 {"sn1": {"calibrated-on": "2022-03-21T11:46:43Z", "offset": -1,
@@ -34,11 +49,14 @@ DOCUMENT EXAMPLE
 "env": {"rec": "2022-03-16T06:30:00Z", "hmd": 48.2, "tmp": 21.9}}}
 
 FILES
-~/SCS/conf/baseline.json
+~/SCS/conf/afe_baseline.json
+~/SCS/conf/baseline_history.json
 
 SEE ALSO
 scs_dev/gases_sampler
 scs_mfr/afe_calib
+scs_mfr/baseline_colocation
+scs_mfr/baseline_history
 """
 
 import sys
@@ -51,19 +69,30 @@ from scs_core.gas.afe_calib import AFECalib
 from scs_core.gas.sensor_baseline import SensorBaseline, SensorBaselineSample
 
 from scs_core.sys.logging import Logging
+from scs_core.sys.system_id import SystemID
 
-from scs_host.bus.i2c import I2C
 from scs_host.sys.host import Host
 
+from scs_mfr.baseline.baseline_correction import BaselineCorrection, BaselineCorrectionReport
+from scs_mfr.baseline.baseline_history import BaselineHistory
+
 from scs_mfr.cmd.cmd_baseline import CmdBaseline
 
 
 # --------------------------------------------------------------------------------------------------------------------
 
-if __name__ == '__main__':
+def sensor_baselines_by_gas(afe_baseline):
+    afe_calib = AFECalib.load(Host)
+    gas_names = {} if afe_calib is None else \
+        dict((afe_calib.sensor_index(gas_name), gas_name) for gas_name in afe_calib.gas_names())
 
-    sht = None
-    barometer = None
+    return dict((gas_names.get(index, 'sn' + str(index + 1)), afe_baseline.sensor_baseline(index))
+                for index in range(len(afe_baseline)))
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
 
     now = LocalizedDatetime.now().utc()
 
@@ -86,12 +115,17 @@ if __name__ == '__main__':
     logger.info(cmd)
 
     try:
-        I2C.Sensors.open()
-
         # ------------------------------------------------------------------------------------------------------------
         # resources...
 
         baseline = AFEBaseline.load(Host, skeleton=True)
+        history = BaselineHistory(BaselineHistory.filename(Host))
+
+        try:
+            corrections = None if cmd.file is None else BaselineCorrection.load_file(cmd.file)
+        except (OSError, ValueError) as ex:
+            logger.error("corrections: %s" % ex)
+            exit(1)
 
 
         # ------------------------------------------------------------------------------------------------------------
@@ -132,8 +166,49 @@ if __name__ == '__main__':
             baseline.set_sensor_baseline(index, SensorBaseline(now, new_offset, sample=sample))
             baseline.save(Host)
 
+            history.record(now, 'afe', {gas_name: baseline.sensor_baseline(index)})
+
             logger.info("%s: was: %s now: %s" % (cmd.gas_name(), old_offset, new_offset))
 
+        # batch...
+        if corrections is not None:
+            calib = AFECalib.load(Host)
+
+            if calib is None:
+                logger.error("no AFE calibration document available.")
+                exit(1)
+
+            system_id = SystemID.load(Host)
+            report = BaselineCorrectionReport(None if system_id is None else system_id.message_tag())
+
+            for correction in corrections:
+                if not correction.applies_to(report.tag):
+                    report.skip()
+                    continue
+
+                index = calib.sensor_index(correction.gas)
+
+                if index is None:
+                    logger.error("%s is not included in the AFE calibration document." % correction.gas)
+                    exit(1)
+
+                old_offset = baseline.sensor_baseline(index).offset
+                new_offset = correction.new_offset(old_offset)
+
+                baseline.set_sensor_baseline(index, SensorBaseline(now, new_offset, sample=correction.sample))
+                report.add(correction.gas, old_offset, new_offset)
+
+                logger.info("%s: was: %s now: %s" % (correction.gas, old_offset, new_offset))
+
+            if len(report) > 0:
+                baseline.save(Host)
+
+                history.record(now, 'afe', dict((gas, baseline.sensor_baseline(calib.sensor_index(gas)))
+                                                for gas in report.gases()))
+
+            print(JSONify.dumps(report, indent=cmd.indent))
+            baseline = None
+
         # baseline...
         if cmd.baseline:
             calib = AFECalib.load(Host)
@@ -154,8 +229,14 @@ if __name__ == '__main__':
 
             baseline.save(Host)
 
+            history.record(now, 'afe', sensor_baselines_by_gas(baseline))
+
         # delete...
         if cmd.delete:
+            history.record(now, 'afe', dict((gas, None) for gas, sensor_baseline in
+                                            sensor_baselines_by_gas(baseline).items()
+                                            if sensor_baseline.calibrated_on is not None))
+
             AFEBaseline.delete(Host)
             baseline = None
 
@@ -169,6 +250,3 @@ if __name__ == '__main__':
 
     except KeyboardInterrupt:
         print(file=sys.stderr)
-
-    finally:
-        I2C.Sensors.close()
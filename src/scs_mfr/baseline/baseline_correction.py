@@ -0,0 +1,337 @@
+"""
+Created on 18 Oct 2026
+
+@author: South Coast Science (contact@southcoastscience.com)
+
+A list of baseline corrections, as applied by the batch mode of the baseline utilities. Each correction names a gas,
+and gives exactly one of:
+set: the new offset
+offset: a change to the current offset
+correct and reported: a change to the current offset of (correct - reported)
+
+A correction may also give the tag of the device to which it applies - corrections for other devices are ignored,
+so that one list can be used across a fleet - and the rec, hmd, tmp and pA of the sample on which it is based.
+
+Corrections are read from a JSON array, from a sequence of JSON documents separated by newlines, or from CSV with
+a header row. Empty CSV cells are ignored. The set, offset, correct and reported values must be integral, in either
+form - 10 and 10.0 are accepted, 10.5 is rejected.
+
+example JSON:
+[{"tag": "scs-bgx-431", "gas": "NO2", "correct": 10, "reported": 23, "rec": "2023-02-08T12:00:00Z", "hmd": 51.6,
+"tmp": 21.8},
+{"tag": "scs-bgx-431", "gas": "Ox", "offset": -4}]
+
+example CSV:
+tag,gas,set,offset,correct,reported
+scs-bgx-431,NO2,,,10,23
+scs-bgx-432,NO2,-12,,,
+"""
+
+import csv
+import json
+import sys
+
+from collections import OrderedDict
+
+from scs_core.data.datetime import LocalizedDatetime
+from scs_core.data.json import JSONable
+
+from scs_core.gas.sensor_baseline import SensorBaselineSample
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class BaselineCorrection(JSONable):
+    """
+    classdocs
+    """
+
+    __INTEGER_FIELDS = ('set', 'offset', 'correct', 'reported')
+    __SAMPLE_FIELDS = ('hmd', 'tmp', 'pA')
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def load_file(cls, filename):
+        """
+        Return the list of corrections in the named file, or in stdin if the filename is '-'.
+        """
+        if filename == '-':
+            return cls.load(sys.stdin)
+
+        with open(filename) as f:
+            return cls.load(f)
+
+
+    @classmethod
+    def load(cls, file):
+        """
+        Return the list of corrections in the file. Raise ValueError if any correction is malformed.
+        """
+        text = file.read()
+
+        if text.lstrip().startswith(('[', '{')):
+            try:
+                jdicts = json.loads(text)
+                jdicts = jdicts if isinstance(jdicts, list) else [jdicts]
+
+            except ValueError:
+                jdicts = [json.loads(line) for line in text.splitlines() if line.strip()]
+
+        else:
+            jdicts = [OrderedDict((key, value) for key, value in row.items() if value not in (None, ''))
+                      for row in csv.DictReader(text.splitlines())]
+
+        corrections = []
+
+        for number, jdict in enumerate(jdicts, start=1):
+            try:
+                corrections.append(cls.construct_from_jdict(jdict))
+            except (TypeError, ValueError) as ex:
+                raise ValueError("correction %d: %s" % (number, ex))
+
+        return corrections
+
+
+    @classmethod
+    def construct_from_jdict(cls, jdict):
+        if not jdict:
+            raise ValueError("empty correction")
+
+        if not isinstance(jdict, dict):
+            raise ValueError("not a JSON object: %s" % jdict)
+
+        gas = jdict.get('gas')
+
+        if not gas:
+            raise ValueError("no gas")
+
+        values = OrderedDict()
+
+        for field in cls.__INTEGER_FIELDS:
+            value = jdict.get(field)
+            values[field] = None if value is None else cls.__integer(field, value)
+
+        setters = [values['set'] is not None, values['offset'] is not None,
+                   values['correct'] is not None or values['reported'] is not None]
+
+        if setters.count(True) != 1:
+            raise ValueError("exactly one of set, offset or correct / reported is required")
+
+        if setters[2] and (values['correct'] is None or values['reported'] is None):
+            raise ValueError("correct and reported are both required")
+
+        sample = None
+
+        if any(jdict.get(field) is not None for field in ('rec',) + cls.__SAMPLE_FIELDS):
+            rec = LocalizedDatetime.construct_from_iso8601(jdict.get('rec'))
+
+            if jdict.get('rec') is not None and rec is None:
+                raise ValueError("invalid rec: %s" % jdict.get('rec'))
+
+            humid, temp, press = (None if jdict.get(field) is None else float(jdict.get(field))
+                                  for field in cls.__SAMPLE_FIELDS)
+
+            sample = SensorBaselineSample(rec, humid, temp, press)
+
+        return cls(jdict.get('tag'), gas, set_value=values['set'], offset_value=values['offset'],
+                   correct_value=values['correct'], reported_value=values['reported'], sample=sample)
+
+
+    @staticmethod
+    def __integer(field, value):
+        if isinstance(value, bool):
+            raise ValueError("%s is not an integer: %s" % (field, value))
+
+        if isinstance(value, int):
+            return value
+
+        if isinstance(value, str):
+            try:
+                return int(value)                                   # a CSV cell
+            except ValueError:
+                pass
+
+        try:
+            number = float(value)
+        except (TypeError, ValueError):
+            number = None
+
+        if number is None or not number.is_integer():
+            raise ValueError("%s is not an integer: %s" % (field, value))
+
+        return int(number)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, tag, gas, set_value=None, offset_value=None, correct_value=None, reported_value=None,
+                 sample=None):
+        """
+        Constructor
+        """
+        self.__tag = tag                                            # string or None (any device)
+        self.__gas = gas                                            # string
+        self.__set_value = set_value                                # int
+        self.__offset_value = offset_value                          # int
+        self.__correct_value = correct_value                        # int
+        self.__reported_value = reported_value                      # int
+        self.__sample = sample                                      # SensorBaselineSample
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def applies_to(self, tag):
+        return self.tag is None or self.tag == tag
+
+
+    def new_offset(self, old_offset):
+        if self.set_value is not None:
+            return self.set_value
+
+        if self.offset_value is not None:
+            return old_offset + self.offset_value
+
+        return old_offset + (self.correct_value - self.reported_value)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        if self.tag is not None:
+            jdict['tag'] = self.tag
+
+        jdict['gas'] = self.gas
+
+        if self.set_value is not None:
+            jdict['set'] = self.set_value
+
+        if self.offset_value is not None:
+            jdict['offset'] = self.offset_value
+
+        if self.correct_value is not None:
+            jdict['correct'] = self.correct_value
+            jdict['reported'] = self.reported_value
+
+        if self.sample is not None:
+            jdict.update(self.sample.as_json())
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def tag(self):
+        return self.__tag
+
+
+    @property
+    def gas(self):
+        return self.__gas
+
+
+    @property
+    def set_value(self):
+        return self.__set_value
+
+
+    @property
+    def offset_value(self):
+        return self.__offset_value
+
+
+    @property
+    def correct_value(self):
+        return self.__correct_value
+
+
+    @property
+    def reported_value(self):
+        return self.__reported_value
+
+
+    @property
+    def sample(self):
+        return self.__sample
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "BaselineCorrection:{tag:%s, gas:%s, set_value:%s, offset_value:%s, correct_value:%s, " \
+               "reported_value:%s, sample:%s}" % \
+               (self.tag, self.gas, self.set_value, self.offset_value, self.correct_value,
+                self.reported_value, self.sample)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class BaselineCorrectionReport(JSONable):
+    """
+    the old and new offsets of the gases changed by a batch of corrections
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, tag):
+        """
+        Constructor
+        """
+        self.__tag = tag                                            # string
+        self.__changes = OrderedDict()                              # dict of gas: [old_offset, new_offset]
+        self.__skipped = 0                                          # int
+
+
+    def __len__(self):
+        return len(self.__changes)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def add(self, gas, old_offset, new_offset):
+        if gas in self.__changes:
+            self.__changes[gas][1] = new_offset                     # a gas corrected twice keeps its first old value
+        else:
+            self.__changes[gas] = [old_offset, new_offset]
+
+
+    def skip(self):
+        self.__skipped += 1
+
+
+    def gases(self):
+        return list(self.__changes.keys())
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        jdict['tag'] = self.tag
+        jdict['changes'] = OrderedDict((gas, OrderedDict([('was', old), ('now', new)]))
+                                       for gas, (old, new) in self.__changes.items())
+        jdict['skipped'] = self.skipped
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def tag(self):
+        return self.__tag
+
+
+    @property
+    def skipped(self):
+        return self.__skipped
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "BaselineCorrectionReport:{tag:%s, changes:%s, skipped:%s}" % (self.tag, len(self), self.skipped)
@@ -0,0 +1,417 @@
+"""
+Created on 18 Oct 2026
+
+@author: South Coast Science (contact@southcoastscience.com)
+
+The drift of sensor baselines, estimated from baseline histories. For each device, source and gas, the offsets set
+since the baseline was last deleted are regressed on time by least squares. The slope gives the rate at which the
+offset has had to change, in offset units per day - the sensor's own drift has the opposite sign - and the
+coefficient of determination gives the consistency of the trend.
+
+The time of each offset is the rec of its env sample, where one was recorded, otherwise the time that the offset was
+set. Where numpy is installed, the regressions of all series are computed together.
+
+A series whose rate exceeds a threshold with a sufficiently consistent trend is flagged. If an offset budget is given,
+the date on which drift since the last rebaselining is expected to reach the budget is also reported, and the series
+is flagged once that date has passed.
+
+example document:
+{"tag": "scs-bgx-431", "src": "afe", "gas": "NO2", "count": 6, "start": "2022-03-16T07:45:00Z",
+"end": "2022-09-12T08:10:00Z", "offset": -19, "rate": -0.098, "r2": 0.962, "due": "2022-12-14T17:03:00Z",
+"flags": ["due"]}
+"""
+
+import statistics
+
+from collections import OrderedDict
+from datetime import timedelta
+
+from scs_core.data.datetime import LocalizedDatetime
+from scs_core.data.json import JSONable
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class BaselineDriftSeries(object):
+    """
+    the offsets of one baseline of one device, since the baseline was last deleted, in order of time
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_all_from_history(cls, tag, history, source=None, gas=None):
+        return [cls.construct_from_history(tag, history, key[0], key[1]) for key in history.keys()
+                if (source is None or key[0] == source) and (gas is None or key[1] == gas)]
+
+
+    @classmethod
+    def construct_from_history(cls, tag, history, source, gas):
+        points = []
+
+        for entry in history.entries(source=source, gas=gas):
+            if entry.offset is None:
+                points = []                                         # the baseline was deleted
+                continue
+
+            points.append((cls.__sample_time(entry), entry.offset))
+
+        points.sort(key=lambda point: point[0])
+
+        return cls(tag, source, gas, [point[0] for point in points], [point[1] for point in points])
+
+
+    @staticmethod
+    def __sample_time(entry):
+        env_rec = None if not isinstance(entry.env, dict) else entry.env.get('rec')
+        rec = None if env_rec is None else LocalizedDatetime.construct_from_iso8601(env_rec)
+
+        return (entry.rec if rec is None else rec).timestamp()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, tag, source, gas, times, offsets):
+        """
+        Constructor
+        """
+        self.__tag = tag                                            # string
+        self.__source = source                                      # string
+        self.__gas = gas                                            # string
+        self.__times = times                                        # list of float (POSIX timestamp)
+        self.__offsets = offsets                                    # list of int
+
+
+    def __len__(self):
+        return len(self.__times)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def days(self):
+        return [(time - self.__times[0]) / 86400.0 for time in self.__times]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def tag(self):
+        return self.__tag
+
+
+    @property
+    def source(self):
+        return self.__source
+
+
+    @property
+    def gas(self):
+        return self.__gas
+
+
+    @property
+    def times(self):
+        return self.__times
+
+
+    @property
+    def offsets(self):
+        return self.__offsets
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "BaselineDriftSeries:{tag:%s, source:%s, gas:%s, points:%s}" % \
+               (self.tag, self.source, self.gas, len(self))
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class BaselineDrift(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_all(cls, series):
+        """
+        Return the drift of each series that has at least two points, in the order of the series.
+        """
+        series = [item for item in series if len(item) > 1]
+
+        if not series:
+            return []
+
+        if numpy is not None:
+            fits = cls.__vector_fits(series)
+        else:
+            fits = [cls.__scalar_fit(item.days(), item.offsets) for item in series]
+
+        return [cls(item, rate, r2) for item, (rate, r2) in zip(series, fits)]
+
+
+    @staticmethod
+    def __vector_fits(series):
+        counts = numpy.array([len(item) for item in series])
+        groups = numpy.repeat(numpy.arange(len(series)), counts)
+
+        x = numpy.concatenate([numpy.asarray(item.days(), dtype=float) for item in series])
+        y = numpy.concatenate([numpy.asarray(item.offsets, dtype=float) for item in series])
+
+        # centre each series on its own means...
+        dx = x - (numpy.bincount(groups, x) / counts)[groups]
+        dy = y - (numpy.bincount(groups, y) / counts)[groups]
+
+        sxx = numpy.bincount(groups, dx * dx)
+        sxy = numpy.bincount(groups, dx * dy)
+        syy = numpy.bincount(groups, dy * dy)
+
+        fits = []
+
+        for i in range(len(series)):
+            rate = None if sxx[i] == 0 else float(sxy[i] / sxx[i])
+            r2 = None if sxx[i] == 0 or syy[i] == 0 else float(sxy[i] ** 2 / (sxx[i] * syy[i]))
+
+            fits.append((rate, r2))
+
+        return fits
+
+
+    @staticmethod
+    def __scalar_fit(x, y):
+        mx = statistics.mean(x)
+        my = statistics.mean(y)
+
+        sxx = sum((xi - mx) ** 2 for xi in x)
+        sxy = sum((xi - mx) * (yi - my) for xi, yi in zip(x, y))
+        syy = sum((yi - my) ** 2 for yi in y)
+
+        rate = None if sxx == 0 else sxy / sxx
+        r2 = None if sxx == 0 or syy == 0 else sxy ** 2 / (sxx * syy)
+
+        return rate, r2
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, series, rate, r2):
+        """
+        Constructor
+        """
+        self.__series = series                                      # BaselineDriftSeries
+        self.__rate = rate                                          # float or None - offset units per day
+        self.__r2 = r2                                              # float or None - None if the offset is constant
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        jdict['tag'] = self.tag
+        jdict['src'] = self.source
+        jdict['gas'] = self.gas
+        jdict['count'] = self.count
+        jdict['start'] = self.start.as_iso8601()
+        jdict['end'] = self.end.as_iso8601()
+        jdict['offset'] = self.offset
+        jdict['rate'] = None if self.rate is None else round(self.rate, 3)
+        jdict['r2'] = None if self.r2 is None else round(self.r2, 3)
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def tag(self):
+        return self.__series.tag
+
+
+    @property
+    def source(self):
+        return self.__series.source
+
+
+    @property
+    def gas(self):
+        return self.__series.gas
+
+
+    @property
+    def count(self):
+        return len(self.__series)
+
+
+    @property
+    def start(self):
+        return LocalizedDatetime.construct_from_timestamp(self.__series.times[0]).utc()
+
+
+    @property
+    def end(self):
+        return LocalizedDatetime.construct_from_timestamp(self.__series.times[-1]).utc()
+
+
+    @property
+    def offset(self):
+        return self.__series.offsets[-1]
+
+
+    @property
+    def rate(self):
+        return self.__rate
+
+
+    @property
+    def r2(self):
+        return self.__r2
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "BaselineDrift:{tag:%s, source:%s, gas:%s, count:%s, offset:%s, rate:%s, r2:%s}" % \
+               (self.tag, self.source, self.gas, self.count, self.offset, self.rate, self.r2)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class BaselineDriftCriteria(object):
+    """
+    the thresholds at which a baseline is flagged for rebaselining
+    """
+
+    DEFAULT_MAX_RATE = 0.5                                          # offset units per day
+    DEFAULT_MIN_R2 = 0.5
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, max_rate=DEFAULT_MAX_RATE, min_r2=DEFAULT_MIN_R2, budget=None):
+        """
+        Constructor
+        """
+        self.__max_rate = max_rate                                  # float
+        self.__min_r2 = min_r2                                      # float
+        self.__budget = budget                                      # float or None - offset units
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_trend(self, drift):
+        return drift.rate is not None and drift.r2 is not None and drift.r2 >= self.min_r2
+
+
+    def due(self, drift):
+        """
+        Return the datetime at which drift since the last offset is expected to reach the budget, or None.
+        """
+        if self.budget is None or not self.is_trend(drift) or drift.rate == 0:
+            return None
+
+        try:
+            return drift.end + timedelta(days=self.budget / abs(drift.rate))
+
+        except OverflowError:
+            return None                                             # not in any foreseeable future
+
+
+    def assess(self, drift, now):
+        flags = []
+
+        if self.is_trend(drift) and abs(drift.rate) > self.max_rate:
+            flags.append('rate')
+
+        due = self.due(drift)
+
+        if due is not None and due <= now:
+            flags.append('due')
+
+        return BaselineDriftAssessment(drift, due, flags)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def max_rate(self):
+        return self.__max_rate
+
+
+    @property
+    def min_r2(self):
+        return self.__min_r2
+
+
+    @property
+    def budget(self):
+        return self.__budget
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "BaselineDriftCriteria:{max_rate:%s, min_r2:%s, budget:%s}" % (self.max_rate, self.min_r2, self.budget)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class BaselineDriftAssessment(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, drift, due, flags):
+        """
+        Constructor
+        """
+        self.__drift = drift                                        # BaselineDrift
+        self.__due = due                                            # LocalizedDatetime or None
+        self.__flags = flags                                        # list of string
+
+
+    def __bool__(self):
+        return bool(self.__flags)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = self.drift.as_json()
+
+        jdict['due'] = None if self.due is None else self.due.as_iso8601()
+        jdict['flags'] = self.flags
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def drift(self):
+        return self.__drift
+
+
+    @property
+    def due(self):
+        return self.__due
+
+
+    @property
+    def flags(self):
+        return self.__flags
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "BaselineDriftAssessment:{drift:%s, due:%s, flags:%s}" % (self.drift, self.due, self.flags)
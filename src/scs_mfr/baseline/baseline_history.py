@@ -0,0 +1,330 @@
+"""
+Created on 18 Oct 2026
+
+@author: South Coast Science (contact@southcoastscience.com)
+
+An append-only history of sensor baseline offsets. Each time a baseline utility changes an offset, an entry is
+appended to the history file, which holds one compact JSON document per line. Earlier entries are never rewritten,
+so the offset in force at any past time can be recovered.
+
+On load, entries are indexed by source (afe, gas, vcal or scd30) and gas, each in order of time, so that the offset
+in force at a given time is found by bisection. An entry with a null offset records the deletion of a baseline.
+
+The history is held in the host's conf directory, alongside the baseline documents.
+
+example document:
+{"rec": "2022-03-21T11:46:43Z", "src": "afe", "gas": "NO2", "offset": -1,
+"env": {"rec": "2022-03-16T07:45:00Z", "hmd": 51.6, "tmp": 21.8}}
+"""
+
+import json
+import os
+
+from bisect import bisect_right
+from collections import OrderedDict
+
+from scs_core.data.datetime import LocalizedDatetime
+from scs_core.data.json import JSONable, JSONify, PersistentJSONable
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class BaselineHistory(object):
+    """
+    classdocs
+    """
+
+    SOURCES = ('afe', 'gas', 'vcal', 'scd30')
+
+    __FILENAME = "baseline_history.json"
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def filename(cls, manager):
+        return os.path.join(manager.scs_path(), PersistentJSONable.conf_dir(), cls.__FILENAME)
+
+
+    @classmethod
+    def load(cls, path):
+        history = cls(path)
+
+        try:
+            with open(path) as f:
+                for line in f:
+                    line = line.strip()
+
+                    if not line:
+                        continue
+
+                    try:
+                        history.insert(BaselineHistoryEntry.construct_from_jdict(json.loads(line)))
+                    except (TypeError, ValueError):
+                        history.__rejected_count += 1                   # e.g. a line truncated by power loss
+
+        except FileNotFoundError:
+            pass
+
+        return history
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, path):
+        """
+        Constructor
+        """
+        self.__path = path                                          # string
+        self.__series = OrderedDict()                               # dict of (source, gas): BaselineHistorySeries
+
+        self.__rejected_count = 0                                   # int
+
+
+    def __len__(self):
+        return sum(len(series) for series in self.__series.values())
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def append(self, entries):
+        """
+        Index the entries, and append them to the history file.
+        """
+        lines = []
+
+        for entry in entries:
+            self.insert(entry)
+            lines.append(JSONify.dumps(entry, separators=(',', ':')))
+
+        if not lines:
+            return
+
+        os.makedirs(os.path.dirname(self.__path), exist_ok=True)
+
+        with open(self.__path, 'a') as f:
+            f.write('\n'.join(lines) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+
+    def record(self, rec, source, sensor_baselines):
+        """
+        Append an entry for each item of a dict of gas: SensorBaseline (or None, for a deleted baseline).
+        """
+        self.append([BaselineHistoryEntry.construct_from_sensor_baseline(rec, source, gas, sensor_baseline)
+                     for gas, sensor_baseline in sensor_baselines.items()])
+
+
+    def insert(self, entry):
+        key = (entry.source, entry.gas)
+
+        if key not in self.__series:
+            self.__series[key] = BaselineHistorySeries()
+
+        self.__series[key].insert(entry)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def entry_at(self, source, gas, rec):
+        """
+        Return the entry in force at rec, or None if there was none.
+        """
+        series = self.__series.get((source, gas))
+
+        return None if series is None else series.entry_at(rec)
+
+
+    def offset_at(self, source, gas, rec):
+        entry = self.entry_at(source, gas, rec)
+
+        return None if entry is None else entry.offset
+
+
+    def entries(self, source=None, gas=None, start=None, end=None):
+        for (series_source, series_gas), series in self.__series.items():
+            if source is not None and series_source != source:
+                continue
+
+            if gas is not None and series_gas != gas:
+                continue
+
+            yield from series.entries(start=start, end=end)
+
+
+    def keys(self):
+        return list(self.__series.keys())
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def path(self):
+        return self.__path
+
+
+    @property
+    def rejected_count(self):
+        return self.__rejected_count
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "BaselineHistory:{path:%s, series:%s, entries:%s, rejected_count:%s}" % \
+               (self.path, len(self.__series), len(self), self.rejected_count)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class BaselineHistorySeries(object):
+    """
+    the entries for one source and gas, in order of time
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__times = []                                           # list of float (POSIX timestamp)
+        self.__entries = []                                         # list of BaselineHistoryEntry
+
+
+    def __len__(self):
+        return len(self.__entries)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def insert(self, entry):
+        time = entry.rec.timestamp()
+
+        if not self.__times or time >= self.__times[-1]:
+            index = len(self.__times)                               # the usual case - the file is in time order
+        else:
+            index = bisect_right(self.__times, time)
+
+        self.__times.insert(index, time)
+        self.__entries.insert(index, entry)
+
+
+    def entry_at(self, rec):
+        index = bisect_right(self.__times, rec.timestamp())
+
+        return None if index == 0 else self.__entries[index - 1]
+
+
+    def entries(self, start=None, end=None):
+        first = 0 if start is None else bisect_right(self.__times, start.timestamp())
+        last = len(self.__entries) if end is None else bisect_right(self.__times, end.timestamp())
+
+        if start is not None and first > 0:
+            first -= 1                                              # include the entry in force at start
+
+        return iter(self.__entries[first:last])
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class BaselineHistoryEntry(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_jdict(cls, jdict):
+        if not jdict or not isinstance(jdict, dict):
+            raise ValueError(jdict)                                 # an entry is never empty
+
+        rec = LocalizedDatetime.construct_from_iso8601(jdict.get('rec'))
+
+        if rec is None:
+            raise ValueError(jdict.get('rec'))
+
+        return cls(rec, jdict.get('src'), jdict.get('gas'), jdict.get('offset'), env=jdict.get('env'))
+
+
+    @classmethod
+    def construct_from_sensor_baseline(cls, rec, source, gas, sensor_baseline):
+        if sensor_baseline is None:
+            return cls(rec, source, gas, None)                      # the baseline was deleted
+
+        env = None if sensor_baseline.sample is None else json.loads(JSONify.dumps(sensor_baseline.sample))
+
+        return cls(rec, source, gas, sensor_baseline.offset, env=env)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, rec, source, gas, offset, env=None):
+        """
+        Constructor
+        """
+        self.__rec = rec                                            # LocalizedDatetime
+        self.__source = source                                      # string
+        self.__gas = gas                                            # string
+        self.__offset = offset                                      # int or None
+        self.__env = env                                            # dict or None
+
+
+    def __eq__(self, other):
+        try:
+            return self.rec == other.rec and self.source == other.source and self.gas == other.gas and \
+                   self.offset == other.offset and self.env == other.env
+
+        except (TypeError, AttributeError):
+            return False
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        jdict['rec'] = self.rec.as_iso8601()
+        jdict['src'] = self.source
+        jdict['gas'] = self.gas
+        jdict['offset'] = self.offset
+
+        if self.env is not None:
+            jdict['env'] = self.env
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def rec(self):
+        return self.__rec
+
+
+    @property
+    def source(self):
+        return self.__source
+
+
+    @property
+    def gas(self):
+        return self.__gas
+
+
+    @property
+    def offset(self):
+        return self.__offset
+
+
+    @property
+    def env(self):
+        return self.__env
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "BaselineHistoryEntry:{rec:%s, source:%s, gas:%s, offset:%s, env:%s}" % \
+               (self.rec, self.source, self.gas, self.offset, self.env)
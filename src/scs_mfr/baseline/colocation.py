@@ -0,0 +1,353 @@
+"""
+Created on 18 Oct 2026
+
+@author: South Coast Science (contact@southcoastscience.com)
+
+The computation of a baseline offset from co-location data. A time series from the device, and one from a reference
+instrument, are aligned by rec: each device point is paired with the nearest reference point, if that point is
+within TOLERANCE seconds. Pairs whose device temperature or humidity fall outside the given windows are discarded.
+
+The offset is the median of the differences (reference - device) over the remaining pairs, and its spread is given
+by the median absolute deviation, so that a few outliers - for example, short plumes seen by only one instrument -
+do not move the result. The offset is a change to the offset in force when the device data were recorded.
+
+Series are read from a sequence of JSON documents separated by newlines, or from CSV with a header row. Values are
+found by path: dictionary fields are separated by '.', as in the csv_writer header. Where numpy is installed, the
+alignment and statistics are vectorised.
+"""
+
+import csv
+import json
+import statistics
+
+from bisect import bisect_left
+from collections import OrderedDict
+
+from scs_core.data.datetime import LocalizedDatetime
+from scs_core.data.json import JSONable
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ColocationSeries(object):
+    """
+    a time series of values, with the temperature and humidity of each point, in order of rec
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def load(cls, file, value_path, temp_path=None, humid_path=None):
+        text = file.read()
+
+        if text.lstrip().startswith('{'):
+            documents = (json.loads(line) for line in text.splitlines() if line.strip())
+        else:
+            documents = csv.DictReader(text.splitlines())
+
+        return cls.construct_from_documents(documents, value_path, temp_path=temp_path, humid_path=humid_path)
+
+
+    @classmethod
+    def construct_from_documents(cls, documents, value_path, temp_path=None, humid_path=None):
+        points = []
+        rejected_count = 0
+
+        for document in documents:
+            try:
+                rec = LocalizedDatetime.construct_from_iso8601(cls.node(document, 'rec'))
+                value = float(cls.node(document, value_path))
+
+                temp = None if temp_path is None else cls.__float(cls.node(document, temp_path))
+                humid = None if humid_path is None else cls.__float(cls.node(document, humid_path))
+
+            except (TypeError, ValueError):
+                rejected_count += 1
+                continue
+
+            if rec is None:
+                rejected_count += 1
+                continue
+
+            points.append((rec.timestamp(), value, temp, humid))
+
+        points.sort(key=lambda point: point[0])
+
+        return cls([point[0] for point in points], [point[1] for point in points],
+                   [point[2] for point in points], [point[3] for point in points], rejected_count=rejected_count)
+
+
+    @staticmethod
+    def node(document, path):
+        if path in document:
+            return document[path]                                   # a flat CSV row
+
+        node = document
+
+        for key in path.split('.'):
+            node = node.get(key) if isinstance(node, dict) else None
+
+        return node
+
+
+    @staticmethod
+    def __float(value):
+        return None if value in (None, '') else float(value)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, times, values, temps, humids, rejected_count=0):
+        """
+        Constructor
+        """
+        self.__times = times                                        # list of float (POSIX timestamp)
+        self.__values = values                                      # list of float
+        self.__temps = temps                                        # list of float or None
+        self.__humids = humids                                      # list of float or None
+
+        self.__rejected_count = rejected_count                      # int
+
+
+    def __len__(self):
+        return len(self.__times)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def times(self):
+        return self.__times
+
+
+    @property
+    def values(self):
+        return self.__values
+
+
+    @property
+    def temps(self):
+        return self.__temps
+
+
+    @property
+    def humids(self):
+        return self.__humids
+
+
+    @property
+    def rejected_count(self):
+        return self.__rejected_count
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "ColocationSeries:{points:%s, rejected_count:%s}" % (len(self), self.rejected_count)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ColocationOffset(JSONable):
+    """
+    classdocs
+    """
+
+    DEFAULT_TOLERANCE = 60.0                                        # seconds
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct(cls, device, reference, tolerance=DEFAULT_TOLERANCE, temp_window=None, humid_window=None):
+        """
+        Return the offset computed from the aligned series, or None if no pairs remain.
+        """
+        if numpy is not None:
+            pairs = cls.__vector_pairs(device, reference, tolerance, temp_window, humid_window)
+        else:
+            pairs = cls.__scalar_pairs(device, reference, tolerance, temp_window, humid_window)
+
+        times, diffs, temps, humids = pairs
+
+        if len(diffs) == 0:
+            return None
+
+        if numpy is not None:
+            offset = float(numpy.median(diffs))
+            mad = float(numpy.median(numpy.abs(diffs - offset)))
+
+        else:
+            offset = statistics.median(diffs)
+            mad = statistics.median(abs(diff - offset) for diff in diffs)
+
+        rec = LocalizedDatetime.construct_from_timestamp(float(times[-1])).utc()
+
+        return cls(offset, mad, len(diffs), rec, cls.__median(temps), cls.__median(humids))
+
+
+    @staticmethod
+    def __in_window(value, window):
+        return window is None or (value is not None and window[0] <= value <= window[1])
+
+
+    @classmethod
+    def __scalar_pairs(cls, device, reference, tolerance, temp_window, humid_window):
+        times, diffs, temps, humids = [], [], [], []
+        ref_times = reference.times
+
+        for time, value, temp, humid in zip(device.times, device.values, device.temps, device.humids):
+            if not cls.__in_window(temp, temp_window) or not cls.__in_window(humid, humid_window):
+                continue
+
+            index = bisect_left(ref_times, time)
+            candidates = [i for i in (index - 1, index) if 0 <= i < len(ref_times)]
+
+            if not candidates:
+                continue
+
+            nearest = min(candidates, key=lambda i: abs(ref_times[i] - time))
+
+            if abs(ref_times[nearest] - time) > tolerance:
+                continue
+
+            times.append(time)
+            diffs.append(reference.values[nearest] - value)
+            temps.append(temp)
+            humids.append(humid)
+
+        return times, diffs, temps, humids
+
+
+    @staticmethod
+    def __vector_pairs(device, reference, tolerance, temp_window, humid_window):
+        dev_times = numpy.asarray(device.times, dtype=float)
+        ref_times = numpy.asarray(reference.times, dtype=float)
+
+        if len(dev_times) == 0 or len(ref_times) == 0:
+            return [], [], [], []
+
+        temps = numpy.array(device.temps, dtype=float)              # None becomes NaN
+        humids = numpy.array(device.humids, dtype=float)
+
+        # nearest reference point...
+        index = numpy.searchsorted(ref_times, dev_times)
+        before = numpy.clip(index - 1, 0, len(ref_times) - 1)
+        after = numpy.clip(index, 0, len(ref_times) - 1)
+
+        nearest = numpy.where(numpy.abs(ref_times[before] - dev_times) <= numpy.abs(ref_times[after] - dev_times),
+                              before, after)
+
+        mask = numpy.abs(ref_times[nearest] - dev_times) <= tolerance
+
+        # env windows...
+        if temp_window is not None:
+            mask &= (temps >= temp_window[0]) & (temps <= temp_window[1])
+
+        if humid_window is not None:
+            mask &= (humids >= humid_window[0]) & (humids <= humid_window[1])
+
+        diffs = numpy.asarray(reference.values, dtype=float)[nearest] - numpy.asarray(device.values, dtype=float)
+
+        return dev_times[mask], diffs[mask], temps[mask], humids[mask]
+
+
+    @staticmethod
+    def __median(values):
+        present = [float(value) for value in values if value is not None and value == value]    # excludes NaN
+
+        return round(statistics.median(present), 1) if present else None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, offset, mad, count, rec, temp, humid):
+        """
+        Constructor
+        """
+        self.__offset = offset                                      # float
+        self.__mad = mad                                            # float
+        self.__count = count                                        # int
+        self.__rec = rec                                            # LocalizedDatetime - the last aligned point
+        self.__temp = temp                                          # float or None - median
+        self.__humid = humid                                        # float or None - median
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_correction(self, gas, tag=None):
+        """
+        Return the offset as a correction document, as read by the batch mode of the baseline utilities.
+        """
+        jdict = OrderedDict()
+
+        if tag is not None:
+            jdict['tag'] = tag
+
+        jdict['gas'] = gas
+        jdict['offset'] = int(round(self.offset))
+        jdict['rec'] = self.rec.as_iso8601()
+
+        if self.humid is not None:
+            jdict['hmd'] = self.humid
+
+        if self.temp is not None:
+            jdict['tmp'] = self.temp
+
+        return jdict
+
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        jdict['offset'] = round(self.offset, 1)
+        jdict['mad'] = round(self.mad, 1)
+        jdict['count'] = self.count
+        jdict['rec'] = self.rec.as_iso8601()
+        jdict['hmd'] = self.humid
+        jdict['tmp'] = self.temp
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def offset(self):
+        return self.__offset
+
+
+    @property
+    def mad(self):
+        return self.__mad
+
+
+    @property
+    def count(self):
+        return self.__count
+
+
+    @property
+    def rec(self):
+        return self.__rec
+
+
+    @property
+    def temp(self):
+        return self.__temp
+
+
+    @property
+    def humid(self):
+        return self.__humid
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "ColocationOffset:{offset:%s, mad:%s, count:%s, rec:%s, temp:%s, humid:%s}" % \
+               (self.offset, self.mad, self.count, self.rec, self.temp, self.humid)
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: South Coast Science (contact@southcoastscience.com)
+
+DESCRIPTION
+The baseline_colocation utility is used to compute the zero offset correction for a gas sensor from co-location
+data, instead of from a single pair of correct and reported values.
+
+The utility reads a time series from the device and one from a reference instrument, either as JSON documents
+separated by newlines, or as CSV with a header row. Each device point is paired with the nearest reference point,
+if their recs differ by no more than TOLERANCE seconds. Points may be restricted to a window of device temperature
+and / or humidity, as recorded by the SensorBaselineSample of a baseline.
+
+The correction is the median of the differences (reference - device) over all pairs, so that short excursions seen
+by only one instrument have little effect. It is written to stdout as a correction document, which can be applied
+with the --file flag of the afe_baseline or gas_baseline utilities. The sample of the correction is given by the
+rec of the last pair, and the median temperature and humidity. In verbose mode, the median absolute deviation of the
+differences and the number of pairs are reported to stderr.
+
+The device data should have been recorded under a single baseline offset. The utility exits with status 1 if fewer
+than COUNT pairs are found.
+
+SYNOPSIS
+baseline_colocation.py -g GAS [-d DEVICE_PATH] [-r REFERENCE_PATH] [-e TEMP_PATH HUMID_PATH] [-w TOLERANCE]
+[-t MIN MAX] [-m MIN MAX] [-n COUNT] [-a TAG] [-i INDENT] [-v] DEVICE_FILE REFERENCE_FILE
+
+EXAMPLES
+./baseline_colocation.py -v -g NO2 -r NO2 -t 15 25 -a scs-bgx-431 gases.json reference.csv | ./afe_baseline.py -f -
+
+DOCUMENT EXAMPLE - OUTPUT
+{"tag": "scs-bgx-431", "gas": "NO2", "offset": -13, "rec": "2023-02-08T12:00:00Z", "hmd": 51.6, "tmp": 21.8}
+
+SEE ALSO
+scs_mfr/afe_baseline
+scs_mfr/gas_baseline
+"""
+
+import sys
+
+from scs_core.data.json import JSONify
+
+from scs_core.sys.logging import Logging
+
+from scs_mfr.baseline.colocation import ColocationOffset, ColocationSeries
+
+from scs_mfr.cmd.cmd_baseline_colocation import CmdBaselineColocation
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # cmd...
+
+    cmd = CmdBaselineColocation()
+
+    if not cmd.is_valid():
+        cmd.print_help(sys.stderr)
+        exit(2)
+
+    Logging.config('baseline_colocation', verbose=cmd.verbose)
+    logger = Logging.getLogger()
+
+    logger.info(cmd)
+
+    try:
+        # ------------------------------------------------------------------------------------------------------------
+        # resources...
+
+        try:
+            with open(cmd.device_file) as f:
+                device = ColocationSeries.load(f, cmd.device_path, temp_path=cmd.temp_path,
+                                               humid_path=cmd.humid_path)
+
+            with open(cmd.reference_file) as f:
+                reference = ColocationSeries.load(f, cmd.reference_path)
+
+        except (OSError, ValueError) as ex:
+            logger.error(ex)
+            exit(1)
+
+        logger.info("device: %s" % device)
+        logger.info("reference: %s" % reference)
+
+
+        # ------------------------------------------------------------------------------------------------------------
+        # run...
+
+        offset = ColocationOffset.construct(device, reference, tolerance=cmd.tolerance, temp_window=cmd.temp,
+                                            humid_window=cmd.humid)
+
+        count = 0 if offset is None else offset.count
+
+        if count < cmd.min_count:
+            logger.error("%d aligned points found - at least %d are required." % (count, cmd.min_count))
+            exit(1)
+
+        logger.info(JSONify.dumps(offset))
+
+        print(JSONify.dumps(offset.as_correction(cmd.gas, tag=cmd.tag), indent=cmd.indent))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # end...
+
+    except KeyboardInterrupt:
+        print(file=sys.stderr)
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: South Coast Science (contact@southcoastscience.com)
+
+DESCRIPTION
+The baseline_drift utility is used to find sensors whose baselines are drifting, so that rebaselining visits can be
+scheduled by need. It reads the baseline histories written by the afe_baseline, gas_baseline, vcal_baseline and
+scd30_baseline utilities, either for the host device or for any number of devices whose history files are named on
+the command line. The tag of each named device is taken from the name of the directory that holds its file.
+
+For each device, source and gas, the offsets set since the baseline was last deleted are regressed on time. The time
+of each offset is the rec of the sample on which it was based, where one was recorded. The rate is the change of
+offset per day - the sensor itself drifts in the opposite direction - and r2 gives the consistency of the trend.
+Where numpy is installed, the regressions of the whole fleet are computed together.
+
+A baseline is flagged "rate" if its trend has an r2 of at least MIN_R2 and a rate greater than MAX_RATE in magnitude.
+If a BUDGET of offset units is given, the date on which drift since the last offset is expected to reach the budget
+is reported as "due", and the baseline is flagged "due" once that date has passed. Baselines with fewer than COUNT
+offsets are not reported.
+
+One document is written to stdout for each baseline. The utility exits with status 1 if any baseline is flagged.
+
+SYNOPSIS
+baseline_drift.py [-s SOURCE] [-g GAS] [-d MAX_RATE] [-r MIN_R2] [-b BUDGET] [-n COUNT] [-x] [-i INDENT] [-v]
+[FILE_1 .. FILE_N]
+
+EXAMPLES
+./baseline_drift.py -v -s afe -b 10 -x ~/archive/*/baseline_history.json
+
+DOCUMENT EXAMPLE - OUTPUT
+{"tag": "scs-bgx-431", "src": "afe", "gas": "NO2", "count": 6, "start": "2022-03-16T07:45:00Z",
+"end": "2022-09-12T08:10:00Z", "offset": -19, "rate": -0.098, "r2": 0.962, "due": "2022-12-14T17:03:00Z",
+"flags": ["due"]}
+
+FILES
+~/SCS/conf/baseline_history.json
+
+SEE ALSO
+scs_mfr/baseline_history
+scs_mfr/afe_baseline
+scs_mfr/gas_baseline
+"""
+
+import os
+import sys
+
+from scs_core.data.datetime import LocalizedDatetime
+from scs_core.data.json import JSONify
+
+from scs_core.sys.logging import Logging
+from scs_core.sys.system_id import SystemID
+
+from scs_host.sys.host import Host
+
+from scs_mfr.baseline.baseline_drift import BaselineDrift, BaselineDriftCriteria, BaselineDriftSeries
+from scs_mfr.baseline.baseline_history import BaselineHistory
+
+from scs_mfr.cmd.cmd_baseline_drift import CmdBaselineDrift
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    flagged_count = 0
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # cmd...
+
+    cmd = CmdBaselineDrift()
+
+    if not cmd.is_valid():
+        cmd.print_help(sys.stderr)
+        exit(2)
+
+    Logging.config('baseline_drift', verbose=cmd.verbose)
+    logger = Logging.getLogger()
+
+    logger.info(cmd)
+
+    try:
+        # ------------------------------------------------------------------------------------------------------------
+        # resources...
+
+        if cmd.files:
+            sources = [(os.path.basename(os.path.dirname(os.path.abspath(file))), file) for file in cmd.files]
+
+        else:
+            system_id = SystemID.load(Host)
+            sources = [(None if system_id is None else system_id.message_tag(), BaselineHistory.filename(Host))]
+
+        series = []
+
+        for tag, filename in sources:
+            if not os.path.exists(filename):
+                logger.error("history not found: %s" % filename)
+                continue
+
+            history = BaselineHistory.load(filename)
+            logger.info("%s: %s" % (tag, history))
+
+            if history.rejected_count:
+                logger.error("%s: %d malformed entries were ignored." % (tag, history.rejected_count))
+
+            series.extend(BaselineDriftSeries.construct_all_from_history(tag, history, source=cmd.source,
+                                                                         gas=cmd.gas))
+
+        criteria = BaselineDriftCriteria(max_rate=cmd.max_rate, min_r2=cmd.min_r2, budget=cmd.budget)
+        logger.info(criteria)
+
+
+        # ------------------------------------------------------------------------------------------------------------
+        # run...
+
+        drifts = BaselineDrift.construct_all([item for item in series if len(item) >= cmd.min_count])
+        logger.info("baselines: %d assessed: %d" % (len(series), len(drifts)))
+
+        now = LocalizedDatetime.now().utc()
+
+        for drift in drifts:
+            assessment = criteria.assess(drift, now)
+
+            if assessment:
+                flagged_count += 1
+
+            elif cmd.flagged:
+                continue
+
+            print(JSONify.dumps(assessment, indent=cmd.indent))
+
+        logger.info("flagged: %d" % flagged_count)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # end...
+
+    except KeyboardInterrupt:
+        print(file=sys.stderr)
+
+    exit(1 if flagged_count else 0)
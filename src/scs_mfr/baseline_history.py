@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: South Coast Science (contact@southcoastscience.com)
+
+DESCRIPTION
+The baseline_history utility is used to find the sensor baseline offsets that were in force at past times. The
+afe_baseline, gas_baseline, vcal_baseline and scd30_baseline utilities append an entry to the baseline history each
+time that they change an offset - the history is never rewritten, so no earlier offset is lost.
+
+Each baseline is identified by its source - afe, gas, vcal or scd30 - and by its gas name. If the --at flag is set,
+the entry in force at the given datetime is written to stdout, or nothing if there was none. Otherwise, the entries
+that match the source and gas filters are written to stdout, one document per line. If --start is given, the listing
+begins with the entry that was in force at that time. An entry with a null offset records a deleted baseline.
+
+The history is indexed when it is loaded, so that each look-up takes time proportional to the logarithm of the
+number of entries. A history file from another device may be named with the --file flag.
+
+SYNOPSIS
+baseline_history.py [-f FILE] [-s SOURCE] [-g GAS] { -a DATETIME | [-t START] [-e END] | -k } [-i INDENT] [-v]
+
+EXAMPLES
+./baseline_history.py -s afe -g NO2 -a 2023-02-08T12:00:00Z
+./baseline_history.py -f ~/archive/scs-bgx-431/baseline_history.json -s gas -t 2023-01-01T00:00:00Z
+
+DOCUMENT EXAMPLE
+{"rec": "2022-03-21T11:46:43Z", "src": "afe", "gas": "NO2", "offset": -1,
+"env": {"rec": "2022-03-16T07:45:00Z", "hmd": 51.6, "tmp": 21.8}}
+
+FILES
+~/SCS/conf/baseline_history.json
+
+SEE ALSO
+scs_mfr/afe_baseline
+scs_mfr/baseline_drift
+scs_mfr/gas_baseline
+scs_mfr/scd30_baseline
+scs_mfr/vcal_baseline
+"""
+
+import sys
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONify
+
+from scs_core.sys.logging import Logging
+
+from scs_host.sys.host import Host
+
+from scs_mfr.baseline.baseline_history import BaselineHistory
+
+from scs_mfr.cmd.cmd_baseline_history import CmdBaselineHistory
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # cmd...
+
+    cmd = CmdBaselineHistory()
+
+    if not cmd.is_valid():
+        cmd.print_help(sys.stderr)
+        exit(2)
+
+    Logging.config('baseline_history', verbose=cmd.verbose)
+    logger = Logging.getLogger()
+
+    if not cmd.is_valid_datetimes():
+        logger.error("invalid format for datetime.")
+        exit(2)
+
+    logger.info(cmd)
+
+    try:
+        # ------------------------------------------------------------------------------------------------------------
+        # resources...
+
+        history = BaselineHistory.load(BaselineHistory.filename(Host) if cmd.file is None else cmd.file)
+        logger.info(history)
+
+        if history.rejected_count:
+            logger.error("%d malformed entries were ignored." % history.rejected_count)
+
+
+        # ------------------------------------------------------------------------------------------------------------
+        # run...
+
+        if cmd.at is not None:
+            entry = history.entry_at(cmd.source, cmd.gas, cmd.at)
+
+            if entry is not None:
+                print(JSONify.dumps(entry, indent=cmd.indent))
+
+        elif cmd.keys:
+            for source, gas in history.keys():
+                if cmd.source is not None and source != cmd.source:
+                    continue
+
+                print(JSONify.dumps(OrderedDict([('src', source), ('gas', gas)]), indent=cmd.indent))
+
+        else:
+            for entry in history.entries(source=cmd.source, gas=cmd.gas, start=cmd.start, end=cmd.end):
+                print(JSONify.dumps(entry, indent=cmd.indent))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # end...
+
+    except KeyboardInterrupt:
+        print(file=sys.stderr)
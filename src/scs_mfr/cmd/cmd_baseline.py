@@ -35,7 +35,8 @@ class CmdBaseline(object):
         """
         self.__parser = optparse.OptionParser(usage="%prog [{ -b GAS  | "
                                                     "{ { -s | -o } GAS VALUE | -c GAS CORRECT REPORTED } "
-                                                    "[-r SAMPLE_REC -t SAMPLE_TEMP -m SAMPLE_HUMID] | -z | -d }] "
+                                                    "[-r SAMPLE_REC -t SAMPLE_TEMP -m SAMPLE_HUMID] | -f FILE | "
+                                                    "-z | -d }] "
                                                     "[-i INDENT] [-v]", version="%prog 1.0")
 
         # functions...
@@ -51,6 +52,9 @@ class CmdBaseline(object):
         self.__parser.add_option("--correct", "-c", type="string", nargs=3, action="store", dest="correct",
                                  help="change offset for GAS, by the difference between CORRECT and REPORTED values")
 
+        self.__parser.add_option("--file", "-f", type="string", nargs=1, action="store", dest="file",
+                                 help="apply the corrections listed in JSON or CSV FILE ('-' for stdin)")
+
         self.__parser.add_option("--zero", "-z", action="store_true", dest="zero", default=False,
                                  help="zero all offsets")
 
@@ -95,6 +99,9 @@ class CmdBaseline(object):
         if self.correct is not None:
             count += 1
 
+        if self.file is not None:
+            count += 1
+
         if self.zero:
             count += 1
 
@@ -207,6 +214,11 @@ class CmdBaseline(object):
         return int(self.correct[2]) if self.correct else None
 
 
+    @property
+    def file(self):
+        return self.__opts.file
+
+
     @property
     def zero(self):
         return self.__opts.zero
@@ -249,7 +261,7 @@ class CmdBaseline(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdBaseline:{baseline:%s, set:%s, offset:%s, correct:%s, zero:%s, delete:%s, " \
+        return "CmdBaseline:{baseline:%s, set:%s, offset:%s, correct:%s, file:%s, zero:%s, delete:%s, " \
                "sample_rec:%s, sample_temp:%s, sample_humid:%s, indent:%s, verbose:%s}" % \
-               (self.baseline, self.set, self.offset, self.correct, self.zero, self.delete,
+               (self.baseline, self.set, self.offset, self.correct, self.file, self.zero, self.delete,
                 self.sample_rec, self.sample_temp, self.sample_humid, self.indent, self.verbose)
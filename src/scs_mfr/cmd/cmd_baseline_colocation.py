@@ -0,0 +1,176 @@
+"""
+Created on 18 Oct 2026
+
+@author: South Coast Science (contact@southcoastscience.com)
+"""
+
+import optparse
+
+from scs_mfr.baseline.colocation import ColocationOffset
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CmdBaselineColocation(object):
+    """unix command line handler"""
+
+    __DEFAULT_MIN_COUNT = 30
+    __DEFAULT_ENV_PATHS = ('val.sht.tmp', 'val.sht.hmd')
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__parser = optparse.OptionParser(usage="%prog -g GAS [-d DEVICE_PATH] [-r REFERENCE_PATH] "
+                                                    "[-e TEMP_PATH HUMID_PATH] [-w TOLERANCE] [-t MIN MAX] "
+                                                    "[-m MIN MAX] [-n COUNT] [-a TAG] [-i INDENT] [-v] "
+                                                    "DEVICE_FILE REFERENCE_FILE", version="%prog 1.0")
+
+        # compulsory...
+        self.__parser.add_option("--gas", "-g", type="string", nargs=1, action="store", dest="gas",
+                                 help="the gas name, e.g. NO2")
+
+        # paths...
+        self.__parser.add_option("--device-path", "-d", type="string", nargs=1, action="store", dest="device_path",
+                                 help="path of the device value (default val.GAS.cnc)")
+
+        self.__parser.add_option("--reference-path", "-r", type="string", nargs=1, action="store",
+                                 dest="reference_path", help="path of the reference value (default val.GAS.cnc)")
+
+        self.__parser.add_option("--env-paths", "-e", type="string", nargs=2, action="store", dest="env_paths",
+                                 default=self.__DEFAULT_ENV_PATHS,
+                                 help="paths of the device temperature and humidity (default %s %s)" %
+                                      self.__DEFAULT_ENV_PATHS)
+
+        # filters...
+        self.__parser.add_option("--tolerance", "-w", type="float", nargs=1, action="store", dest="tolerance",
+                                 default=ColocationOffset.DEFAULT_TOLERANCE,
+                                 help="maximum rec difference of aligned points, in seconds (default %s)" %
+                                      ColocationOffset.DEFAULT_TOLERANCE)
+
+        self.__parser.add_option("--temp", "-t", type="float", nargs=2, action="store", dest="temp",
+                                 help="use only points with temperature between MIN and MAX")
+
+        self.__parser.add_option("--humid", "-m", type="float", nargs=2, action="store", dest="humid",
+                                 help="use only points with humidity between MIN and MAX")
+
+        self.__parser.add_option("--min-count", "-n", type="int", nargs=1, action="store", dest="min_count",
+                                 default=self.__DEFAULT_MIN_COUNT,
+                                 help="minimum number of aligned points (default %s)" % self.__DEFAULT_MIN_COUNT)
+
+        # output...
+        self.__parser.add_option("--tag", "-a", type="string", nargs=1, action="store", dest="tag",
+                                 help="the device tag, to be included in the correction")
+
+        self.__parser.add_option("--indent", "-i", action="store", dest="indent", type=int,
+                                 help="pretty-print the output with INDENT")
+
+        self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
+                                 help="report narrative to stderr")
+
+        self.__opts, self.__args = self.__parser.parse_args()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_valid(self):
+        if self.gas is None or len(self.__args) != 2:
+            return False
+
+        if self.tolerance < 0 or self.min_count < 1:
+            return False
+
+        for window in (self.temp, self.humid):
+            if window is not None and window[0] > window[1]:
+                return False
+
+        return True
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def gas(self):
+        return self.__opts.gas
+
+
+    @property
+    def device_path(self):
+        return 'val.%s.cnc' % self.gas if self.__opts.device_path is None else self.__opts.device_path
+
+
+    @property
+    def reference_path(self):
+        return 'val.%s.cnc' % self.gas if self.__opts.reference_path is None else self.__opts.reference_path
+
+
+    @property
+    def temp_path(self):
+        return self.__opts.env_paths[0]
+
+
+    @property
+    def humid_path(self):
+        return self.__opts.env_paths[1]
+
+
+    @property
+    def tolerance(self):
+        return self.__opts.tolerance
+
+
+    @property
+    def temp(self):
+        return self.__opts.temp
+
+
+    @property
+    def humid(self):
+        return self.__opts.humid
+
+
+    @property
+    def min_count(self):
+        return self.__opts.min_count
+
+
+    @property
+    def tag(self):
+        return self.__opts.tag
+
+
+    @property
+    def indent(self):
+        return self.__opts.indent
+
+
+    @property
+    def verbose(self):
+        return self.__opts.verbose
+
+
+    @property
+    def device_file(self):
+        return self.__args[0] if len(self.__args) > 0 else None
+
+
+    @property
+    def reference_file(self):
+        return self.__args[1] if len(self.__args) > 1 else None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def print_help(self, file):
+        self.__parser.print_help(file)
+
+
+    def __str__(self, *args, **kwargs):
+        return "CmdBaselineColocation:{gas:%s, device_path:%s, reference_path:%s, temp_path:%s, humid_path:%s, " \
+               "tolerance:%s, temp:%s, humid:%s, min_count:%s, tag:%s, indent:%s, verbose:%s, " \
+               "device_file:%s, reference_file:%s}" % \
+                    (self.gas, self.device_path, self.reference_path, self.temp_path, self.humid_path,
+                     self.tolerance, self.temp, self.humid, self.min_count, self.tag, self.indent, self.verbose,
+                     self.device_file, self.reference_file)
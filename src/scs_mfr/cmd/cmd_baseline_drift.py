@@ -0,0 +1,142 @@
+"""
+Created on 18 Oct 2026
+
+@author: South Coast Science (contact@southcoastscience.com)
+"""
+
+import optparse
+
+from scs_mfr.baseline.baseline_drift import BaselineDriftCriteria
+from scs_mfr.baseline.baseline_history import BaselineHistory
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CmdBaselineDrift(object):
+    """unix command line handler"""
+
+    __DEFAULT_MIN_COUNT = 3
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__parser = optparse.OptionParser(usage="%prog [-s SOURCE] [-g GAS] [-d MAX_RATE] [-r MIN_R2] "
+                                                    "[-b BUDGET] [-n COUNT] [-x] [-i INDENT] [-v] [FILE_1 .. FILE_N]",
+                                              version="%prog 1.0")
+
+        # filters...
+        self.__parser.add_option("--source", "-s", type="choice", choices=BaselineHistory.SOURCES, action="store",
+                                 dest="source", help="afe, gas, vcal or scd30")
+
+        self.__parser.add_option("--gas", "-g", type="string", nargs=1, action="store", dest="gas",
+                                 help="the gas name, e.g. NO2")
+
+        # criteria...
+        self.__parser.add_option("--max-rate", "-d", type="float", nargs=1, action="store", dest="max_rate",
+                                 default=BaselineDriftCriteria.DEFAULT_MAX_RATE,
+                                 help="flag offsets changing faster than MAX_RATE per day (default %s)" %
+                                      BaselineDriftCriteria.DEFAULT_MAX_RATE)
+
+        self.__parser.add_option("--min-r2", "-r", type="float", nargs=1, action="store", dest="min_r2",
+                                 default=BaselineDriftCriteria.DEFAULT_MIN_R2,
+                                 help="minimum coefficient of determination of a trend (default %s)" %
+                                      BaselineDriftCriteria.DEFAULT_MIN_R2)
+
+        self.__parser.add_option("--budget", "-b", type="float", nargs=1, action="store", dest="budget",
+                                 help="report when drift since the last offset is expected to reach BUDGET")
+
+        self.__parser.add_option("--min-count", "-n", type="int", nargs=1, action="store", dest="min_count",
+                                 default=self.__DEFAULT_MIN_COUNT,
+                                 help="minimum number of offsets in a series (default %s)" % self.__DEFAULT_MIN_COUNT)
+
+        # output...
+        self.__parser.add_option("--flagged", "-x", action="store_true", dest="flagged", default=False,
+                                 help="report only flagged baselines")
+
+        self.__parser.add_option("--indent", "-i", action="store", dest="indent", type=int,
+                                 help="pretty-print the output with INDENT")
+
+        self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
+                                 help="report narrative to stderr")
+
+        self.__opts, self.__args = self.__parser.parse_args()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_valid(self):
+        if self.max_rate < 0 or not 0 <= self.min_r2 <= 1 or self.min_count < 2:
+            return False
+
+        if self.budget is not None and self.budget <= 0:
+            return False
+
+        return True
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def source(self):
+        return self.__opts.source
+
+
+    @property
+    def gas(self):
+        return self.__opts.gas
+
+
+    @property
+    def max_rate(self):
+        return self.__opts.max_rate
+
+
+    @property
+    def min_r2(self):
+        return self.__opts.min_r2
+
+
+    @property
+    def budget(self):
+        return self.__opts.budget
+
+
+    @property
+    def min_count(self):
+        return self.__opts.min_count
+
+
+    @property
+    def flagged(self):
+        return self.__opts.flagged
+
+
+    @property
+    def indent(self):
+        return self.__opts.indent
+
+
+    @property
+    def verbose(self):
+        return self.__opts.verbose
+
+
+    @property
+    def files(self):
+        return self.__args
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def print_help(self, file):
+        self.__parser.print_help(file)
+
+
+    def __str__(self, *args, **kwargs):
+        return "CmdBaselineDrift:{source:%s, gas:%s, max_rate:%s, min_r2:%s, budget:%s, min_count:%s, " \
+               "flagged:%s, indent:%s, verbose:%s, files:%s}" % \
+                    (self.source, self.gas, self.max_rate, self.min_r2, self.budget, self.min_count,
+                     self.flagged, self.indent, self.verbose, self.files)
@@ -0,0 +1,142 @@
+"""
+Created on 18 Oct 2026
+
+@author: South Coast Science (contact@southcoastscience.com)
+"""
+
+import optparse
+
+from scs_core.data.datetime import LocalizedDatetime
+
+from scs_mfr.baseline.baseline_history import BaselineHistory
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CmdBaselineHistory(object):
+    """unix command line handler"""
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__parser = optparse.OptionParser(usage="%prog [-f FILE] [-s SOURCE] [-g GAS] "
+                                                    "{ -a DATETIME | [-t START] [-e END] | -k } [-i INDENT] [-v]",
+                                              version="%prog 1.0")
+
+        # input...
+        self.__parser.add_option("--file", "-f", type="string", nargs=1, action="store", dest="file",
+                                 help="read the history from FILE (default the host's history)")
+
+        # filters...
+        self.__parser.add_option("--source", "-s", type="choice", choices=BaselineHistory.SOURCES, action="store",
+                                 dest="source", help="afe, gas, vcal or scd30")
+
+        self.__parser.add_option("--gas", "-g", type="string", nargs=1, action="store", dest="gas",
+                                 help="the gas name, e.g. NO2")
+
+        # functions...
+        self.__parser.add_option("--at", "-a", type="string", nargs=1, action="store", dest="at",
+                                 help="report the baseline in force at ISO 8601 DATETIME (requires source and gas)")
+
+        self.__parser.add_option("--start", "-t", type="string", nargs=1, action="store", dest="start",
+                                 help="list changes from the baseline in force at ISO 8601 START")
+
+        self.__parser.add_option("--end", "-e", type="string", nargs=1, action="store", dest="end",
+                                 help="list changes up to ISO 8601 END")
+
+        self.__parser.add_option("--keys", "-k", action="store_true", dest="keys", default=False,
+                                 help="list the source and gas of each baseline in the history")
+
+        # output...
+        self.__parser.add_option("--indent", "-i", action="store", dest="indent", type=int,
+                                 help="pretty-print the output with INDENT")
+
+        self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
+                                 help="report narrative to stderr")
+
+        self.__opts, self.__args = self.__parser.parse_args()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_valid(self):
+        if self.at is not None:
+            if self.source is None or self.gas is None:
+                return False
+
+            if self.start is not None or self.end is not None or self.keys:
+                return False
+
+        if self.keys and (self.start is not None or self.end is not None):
+            return False
+
+        return True
+
+
+    def is_valid_datetimes(self):
+        for datetime_str in (self.__opts.at, self.__opts.start, self.__opts.end):
+            if datetime_str is not None and LocalizedDatetime.construct_from_iso8601(datetime_str) is None:
+                return False
+
+        return True
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def file(self):
+        return self.__opts.file
+
+
+    @property
+    def source(self):
+        return self.__opts.source
+
+
+    @property
+    def gas(self):
+        return self.__opts.gas
+
+
+    @property
+    def at(self):
+        return LocalizedDatetime.construct_from_iso8601(self.__opts.at)
+
+
+    @property
+    def start(self):
+        return LocalizedDatetime.construct_from_iso8601(self.__opts.start)
+
+
+    @property
+    def end(self):
+        return LocalizedDatetime.construct_from_iso8601(self.__opts.end)
+
+
+    @property
+    def keys(self):
+        return self.__opts.keys
+
+
+    @property
+    def indent(self):
+        return self.__opts.indent
+
+
+    @property
+    def verbose(self):
+        return self.__opts.verbose
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def print_help(self, file):
+        self.__parser.print_help(file)
+
+
+    def __str__(self, *args, **kwargs):
+        return "CmdBaselineHistory:{file:%s, source:%s, gas:%s, at:%s, start:%s, end:%s, keys:%s, indent:%s, " \
+               "verbose:%s}" % \
+                    (self.file, self.source, self.gas, self.__opts.at, self.__opts.start, self.__opts.end,
+                     self.keys, self.indent, self.verbose)
@@ -16,8 +16,9 @@ class CmdConfiguration(object):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog [-s CONFIGURATION] [-x] [{ -i INDENT | -t }] [-v]",
-                                              version="%prog 1.0")
+        self.__parser = optparse.OptionParser(usage="%prog [-s CONFIGURATION] [-x] [-a AGE] [-p TIMEOUT] [-c] "
+                                                    "[{ -i INDENT | -t | { -d | -b HASH } [-i INDENT] | -n [-t] }] "
+                                                    "[-v]", version="%prog 1.0")
 
         # optional...
         self.__parser.add_option("--save", "-s", type="string", nargs=1, action="store", dest="configuration",
@@ -27,9 +28,27 @@ class CmdConfiguration(object):
         self.__parser.add_option("--exclude-sim", "-x", action="store_true", dest="exclude_sim", default=False,
                                  help="exclude SIM information from output")
 
+        self.__parser.add_option("--psu-age", "-a", type="float", nargs=1, action="store", dest="psu_age",
+                                 help="use the PSU version report if it is no more than AGE seconds old")
+
+        self.__parser.add_option("--parallel", "-p", type="float", nargs=1, action="store", dest="parallel",
+                                 help="gather sections concurrently, allowing TIMEOUT seconds for each")
+
+        self.__parser.add_option("--cache", "-c", action="store_true", dest="cache", default=False,
+                                 help="re-read file-backed sections only when their files have changed")
+
         self.__parser.add_option("--indent", "-i", action="store", dest="indent", type=int,
                                  help="pretty-print the output with INDENT")
 
+        self.__parser.add_option("--diff", "-d", action="store_true", dest="diff", default=False,
+                                 help="output a patch against the last document emitted")
+
+        self.__parser.add_option("--since", "-b", type="string", nargs=1, action="store", dest="since",
+                                 help="output a patch against the last document emitted, if its hash is HASH")
+
+        self.__parser.add_option("--stream", "-n", action="store_true", dest="stream", default=False,
+                                 help="output each section as soon as it is gathered")
+
         self.__parser.add_option("--table", "-t", action="store_true", dest="table", default=False,
                                  help="output in comma-separated format")
 
@@ -45,6 +64,18 @@ class CmdConfiguration(object):
         if self.indent and self.table:
             return False
 
+        if self.psu_age is not None and self.psu_age < 0:
+            return False
+
+        if self.parallel is not None and self.parallel <= 0:
+            return False
+
+        if self.patch() and self.table:
+            return False
+
+        if self.stream and (self.patch() or self.indent is not None):
+            return False
+
         return True
 
 
@@ -52,6 +83,14 @@ class CmdConfiguration(object):
         return self.__opts.configuration is not None
 
 
+    def patch(self):
+        return self.diff or self.since is not None
+
+
+    def by_section(self):
+        return self.parallel is not None or self.cache or self.stream
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     @property
@@ -64,11 +103,41 @@ class CmdConfiguration(object):
         return self.__opts.exclude_sim
 
 
+    @property
+    def psu_age(self):
+        return self.__opts.psu_age
+
+
+    @property
+    def parallel(self):
+        return self.__opts.parallel
+
+
+    @property
+    def cache(self):
+        return self.__opts.cache
+
+
     @property
     def indent(self):
         return self.__opts.indent
 
 
+    @property
+    def diff(self):
+        return self.__opts.diff
+
+
+    @property
+    def since(self):
+        return self.__opts.since
+
+
+    @property
+    def stream(self):
+        return self.__opts.stream
+
+
     @property
     def table(self):
         return self.__opts.table
@@ -86,5 +155,7 @@ class CmdConfiguration(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdConfiguration:{configuration:%s, exclude_sim:%s, indent:%s, table:%s, verbose:%s}" % \
-               (self.configuration, self.exclude_sim, self.indent, self.table, self.verbose)
+        return "CmdConfiguration:{configuration:%s, exclude_sim:%s, psu_age:%s, parallel:%s, cache:%s, indent:%s, " \
+               "diff:%s, since:%s, stream:%s, table:%s, verbose:%s}" % \
+               (self.configuration, self.exclude_sim, self.psu_age, self.parallel, self.cache, self.indent,
+                self.diff, self.since, self.stream, self.table, self.verbose)
@@ -18,8 +18,8 @@ class CmdCSVReader(object):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog [-s] [-n] [-l LIMIT] [-a] [-v] [FILENAME_1 .. FILENAME_N]",
-                                              version="%prog 1.0")
+        self.__parser = optparse.OptionParser(usage="%prog [-s] [-n] [-l LIMIT] [-a] [{ -b | -j JOBS [-u] }] [-v] "
+                                                    "[FILENAME_1 .. FILENAME_N]", version="%prog 1.0")
 
         # optional...
         self.__parser.add_option("--string", "-s", action="store_true", dest="string", default=False,
@@ -34,12 +34,33 @@ class CmdCSVReader(object):
         self.__parser.add_option("--array", "-a", action="store_true", dest="array", default=False,
                                  help="output JSON documents as array instead of a sequence")
 
+        self.__parser.add_option("--line-buffered", "-b", action="store_true", dest="line_buffered", default=False,
+                                 help="convert rows one at a time, flushing stdout after each document")
+
+        self.__parser.add_option("--jobs", "-j", type="int", nargs=1, action="store", dest="jobs",
+                                 help="convert files concurrently, using JOBS worker processes")
+
+        self.__parser.add_option("--unordered", "-u", action="store_true", dest="unordered", default=False,
+                                 help="with --jobs, output each file as soon as its conversion completes")
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
         self.__opts, self.__args = self.__parser.parse_args()
 
 
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_valid(self):
+        if self.jobs is not None and (self.jobs < 1 or self.line_buffered or len(self.__args) == 0):
+            return False
+
+        if self.unordered and self.jobs is None:
+            return False
+
+        return True
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     @property
@@ -69,6 +90,21 @@ class CmdCSVReader(object):
         return self.__opts.array
 
 
+    @property
+    def line_buffered(self):
+        return self.__opts.line_buffered
+
+
+    @property
+    def jobs(self):
+        return self.__opts.jobs
+
+
+    @property
+    def unordered(self):
+        return self.__opts.unordered
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -86,5 +122,7 @@ class CmdCSVReader(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdCSVReader:{string:%s, nullify:%s, limit:%s, array:%s, verbose:%s, filenames:%s}" % \
-               (self.string, self.nullify, self.limit, self.array, self.verbose, self.filenames)
+        return "CmdCSVReader:{string:%s, nullify:%s, limit:%s, array:%s, line_buffered:%s, jobs:%s, " \
+               "unordered:%s, verbose:%s, filenames:%s}" % \
+               (self.string, self.nullify, self.limit, self.array, self.line_buffered, self.jobs,
+                self.unordered, self.verbose, self.filenames)
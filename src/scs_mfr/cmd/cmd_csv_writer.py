@@ -8,6 +8,9 @@ source repo: scs_analysis
 
 import optparse
 
+from scs_mfr.tabular.batched_output import BatchedOutput
+from scs_mfr.tabular.columnar_writer import ColumnarWriter
+
 
 # --------------------------------------------------------------------------------------------------------------------
 
@@ -18,7 +21,9 @@ class CmdCSVWriter(object):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog [{ -a | -x | -s }] [-q] [-e] [-v] [FILENAME]",
+        self.__parser = optparse.OptionParser(usage="%prog { [{ -a | -x | -s [-p] }] [-q] "
+                                                    "[-b ROWS] [-i INTERVAL] [-f { never | batch | close }] | "
+                                                    "-c [-g ROWS] [-z COMPRESSION] } [-e] [-v] [FILENAME]",
                                               version="%prog 1.0")
 
         # functions...
@@ -31,10 +36,35 @@ class CmdCSVWriter(object):
         self.__parser.add_option("--header-scan", "-s", action="store_true", dest="header_scan", default=False,
                                  help="scan all documents before building the header row")
 
+        self.__parser.add_option("--spool", "-p", action="store_true", dest="spool", default=False,
+                                 help="in header-scan mode, hold documents in a temporary file")
+
         # output...
         self.__parser.add_option("--quote-all", "-q", action="store_true", dest="quote_all", default=False,
                                  help="wrap all CSV cell values in quotes")
 
+        self.__parser.add_option("--batch-rows", "-b", type="int", action="store", dest="batch_rows",
+                                 help="write rows in batches of ROWS")
+
+        self.__parser.add_option("--flush-interval", "-i", type="float", action="store", dest="flush_interval",
+                                 help="write held rows at least every INTERVAL seconds")
+
+        self.__parser.add_option("--fsync", "-f", type="choice", choices=BatchedOutput.FSYNC_POLICIES,
+                                 action="store", dest="fsync", default=BatchedOutput.FSYNC_NEVER,
+                                 help="synchronise to storage: never, after each batch or on close (default never)")
+
+        self.__parser.add_option("--columnar", "-c", action="store_true", dest="columnar", default=False,
+                                 help="write a columnar (Parquet) file instead of CSV - FILENAME is required")
+
+        self.__parser.add_option("--row-group", "-g", type="int", action="store", dest="row_group",
+                                 help="in columnar mode, rows per row group (default %s)" %
+                                      ColumnarWriter.DEFAULT_ROW_GROUP_SIZE)
+
+        self.__parser.add_option("--compression", "-z", type="choice", choices=ColumnarWriter.COMPRESSIONS,
+                                 action="store", dest="compression", default=ColumnarWriter.DEFAULT_COMPRESSION,
+                                 help="in columnar mode, snappy, gzip, zstd or none (default %s)" %
+                                      ColumnarWriter.DEFAULT_COMPRESSION)
+
         self.__parser.add_option("--echo", "-e", action="store_true", dest="echo", default=False,
                                  help="echo stdin to stdout")
 
@@ -61,9 +91,33 @@ class CmdCSVWriter(object):
         if count > 1:
             return False
 
+        if self.spool and not self.header_scan:
+            return False
+
+        if self.batch_rows is not None and self.batch_rows < 1:
+            return False
+
+        if self.flush_interval is not None and self.flush_interval <= 0:
+            return False
+
+        if self.header_scan and self.is_batched():
+            return False
+
+        if self.columnar:
+            if self.filename is None or count > 0 or self.quote_all or self.is_batched():
+                return False
+
+        if self.row_group is not None and (not self.columnar or self.row_group < 1):
+            return False
+
         return True
 
 
+    def is_batched(self):
+        return self.batch_rows is not None or self.flush_interval is not None or \
+               self.fsync != BatchedOutput.FSYNC_NEVER
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     @property
@@ -81,11 +135,46 @@ class CmdCSVWriter(object):
         return self.__opts.header_scan
 
 
+    @property
+    def spool(self):
+        return self.__opts.spool
+
+
     @property
     def quote_all(self):
         return self.__opts.quote_all
 
 
+    @property
+    def batch_rows(self):
+        return self.__opts.batch_rows
+
+
+    @property
+    def flush_interval(self):
+        return self.__opts.flush_interval
+
+
+    @property
+    def fsync(self):
+        return self.__opts.fsync
+
+
+    @property
+    def columnar(self):
+        return self.__opts.columnar
+
+
+    @property
+    def row_group(self):
+        return self.__opts.row_group
+
+
+    @property
+    def compression(self):
+        return self.__opts.compression
+
+
     @property
     def echo(self):
         return self.__opts.echo
@@ -108,7 +197,9 @@ class CmdCSVWriter(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdCSVWriter:{append:%s, exclude_header:%s, header_scan:%s, quote_all:%s, echo:%s, " \
-               "verbose:%s, filename:%s}" % \
-                    (self.append, self.exclude_header, self.header_scan, self.quote_all, self.echo,
-                     self.verbose, self.filename)
+        return "CmdCSVWriter:{append:%s, exclude_header:%s, header_scan:%s, spool:%s, quote_all:%s, " \
+               "batch_rows:%s, flush_interval:%s, fsync:%s, columnar:%s, row_group:%s, compression:%s, " \
+               "echo:%s, verbose:%s, filename:%s}" % \
+                    (self.append, self.exclude_header, self.header_scan, self.spool, self.quote_all,
+                     self.batch_rows, self.flush_interval, self.fsync, self.columnar, self.row_group,
+                     self.compression, self.echo, self.verbose, self.filename)
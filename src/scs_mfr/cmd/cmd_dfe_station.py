@@ -0,0 +1,161 @@
+"""
+Created on 18 Oct 2026
+
+@author: South Coast Science (contact@southcoastscience.com)
+"""
+
+import optparse
+
+from scs_mfr.station.dfe_station import DFEJig, DFEStation
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CmdDFEStation(object):
+    """unix command line handler"""
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__parser = optparse.OptionParser(usage="%prog [-f FILE] [-c COMMAND] [-e] [-g] [-r] [-s] "
+                                                    "[-w WORKERS] [-t TIMEOUT] [-v] [JIG_1 .. JIG_N]",
+                                              version="%prog 1.0")
+
+        # jigs...
+        self.__parser.add_option("--file", "-f", type="string", nargs=1, action="store", dest="file",
+                                 help="read jigs from FILE, one per line")
+
+        self.__parser.add_option("--command", "-c", type="string", nargs=1, action="store", dest="command",
+                                 default=DFEStation.DEFAULT_COMMAND,
+                                 help="the dfe_test command on each host (default %s)" % DFEStation.DEFAULT_COMMAND)
+
+        # dfe_test...
+        self.__parser.add_option("--eeprom", "-e", action="store_true", dest="ignore_eeprom", default=False,
+                                 help="ignore EEPROM")
+
+        self.__parser.add_option("--gps", "-g", action="store_true", dest="ignore_gps", default=False,
+                                 help="ignore GPS module")
+
+        self.__parser.add_option("--rtc", "-r", action="store_true", dest="ignore_rtc", default=False,
+                                 help="ignore real-time clock")
+
+        self.__parser.add_option("--sequential", "-s", action="store_true", dest="sequential", default=False,
+                                 help="run the tests on each board one at a time")
+
+        # station...
+        self.__parser.add_option("--workers", "-w", type="int", nargs=1, action="store", dest="workers",
+                                 help="maximum number of jigs tested at once (default all)")
+
+        self.__parser.add_option("--timeout", "-t", type="float", nargs=1, action="store", dest="timeout",
+                                 default=DFEStation.DEFAULT_TIMEOUT,
+                                 help="seconds allowed for each run (default %s)" % DFEStation.DEFAULT_TIMEOUT)
+
+        self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
+                                 help="report narrative to stderr")
+
+        self.__opts, self.__args = self.__parser.parse_args()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_valid(self):
+        if self.workers is not None and self.workers < 1:
+            return False
+
+        if self.timeout <= 0:
+            return False
+
+        if self.file is None and not self.__args:
+            return False
+
+        return True
+
+
+    def jigs(self):
+        """
+        Return the jigs, from FILE and the command line. Raise ValueError if any is malformed or a host is repeated.
+        """
+        specs = []
+
+        if self.file is not None:
+            with open(self.file) as f:
+                specs.extend(line.strip() for line in f if line.strip() and not line.startswith('#'))
+
+        specs.extend(self.__args)
+
+        jigs = [DFEJig.construct_from_spec(spec) for spec in specs]
+        hosts = [jig.host for jig in jigs]
+
+        for host in hosts:
+            if hosts.count(host) > 1:
+                raise ValueError("host %s is repeated" % ('localhost' if host is None else host))
+
+        return jigs
+
+
+    def test_args(self):
+        flags = (('-e', self.ignore_eeprom), ('-g', self.ignore_gps), ('-r', self.ignore_rtc),
+                 ('-s', self.sequential))
+
+        return [flag for flag, is_set in flags if is_set]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def file(self):
+        return self.__opts.file
+
+
+    @property
+    def command(self):
+        return self.__opts.command
+
+
+    @property
+    def ignore_eeprom(self):
+        return self.__opts.ignore_eeprom
+
+
+    @property
+    def ignore_gps(self):
+        return self.__opts.ignore_gps
+
+
+    @property
+    def ignore_rtc(self):
+        return self.__opts.ignore_rtc
+
+
+    @property
+    def sequential(self):
+        return self.__opts.sequential
+
+
+    @property
+    def workers(self):
+        return self.__opts.workers
+
+
+    @property
+    def timeout(self):
+        return self.__opts.timeout
+
+
+    @property
+    def verbose(self):
+        return self.__opts.verbose
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def print_help(self, file):
+        self.__parser.print_help(file)
+
+
+    def __str__(self, *args, **kwargs):
+        return "CmdDFEStation:{file:%s, command:%s, ignore_eeprom:%s, ignore_gps:%s, ignore_rtc:%s, " \
+               "sequential:%s, workers:%s, timeout:%s, verbose:%s, jigs:%s}" % \
+                    (self.file, self.command, self.ignore_eeprom, self.ignore_gps, self.ignore_rtc,
+                     self.sequential, self.workers, self.timeout, self.verbose, self.__args)
@@ -16,7 +16,7 @@ class CmdDFETest(object):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog [-e] [-g] [-r] [-v] DFE_SERIAL_NUMBER",
+        self.__parser = optparse.OptionParser(usage="%prog [-e] [-g] [-r] [-s] [-v] DFE_SERIAL_NUMBER",
                                               version="%prog 1.0")
 
         # optional...
@@ -29,6 +29,9 @@ class CmdDFETest(object):
         self.__parser.add_option("--rtc", "-r", action="store_true", dest="ignore_rtc", default=False,
                                  help="ignore real-time clock")
 
+        self.__parser.add_option("--sequential", "-s", action="store_true", dest="sequential", default=False,
+                                 help="run the tests one at a time")
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
@@ -66,6 +69,11 @@ class CmdDFETest(object):
         return self.__opts.ignore_rtc
 
 
+    @property
+    def sequential(self):
+        return self.__opts.sequential
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -78,5 +86,7 @@ class CmdDFETest(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdDFETest:{dfe_serial_number:%s, ignore_eeprom:%s, ignore_gps:%s, ignore_rtc:%s, verbose:%s}" % \
-                    (self.dfe_serial_number, self.ignore_eeprom, self.ignore_gps, self.ignore_rtc, self.verbose)
+        return "CmdDFETest:{dfe_serial_number:%s, ignore_eeprom:%s, ignore_gps:%s, ignore_rtc:%s, " \
+               "sequential:%s, verbose:%s}" % \
+                    (self.dfe_serial_number, self.ignore_eeprom, self.ignore_gps, self.ignore_rtc,
+                     self.sequential, self.verbose)
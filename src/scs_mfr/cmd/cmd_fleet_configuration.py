@@ -0,0 +1,82 @@
+"""
+Created on 18 Oct 2026
+
+@author: South Coast Science (contact@southcoastscience.com)
+"""
+
+import optparse
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CmdFleetConfiguration(object):
+    """unix command line handler"""
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__parser = optparse.OptionParser(usage="%prog [-f STORE] [-s] [-q EXPRESSION [-q EXPRESSION ...]] [-v] "
+                                                    "[PATH_1 .. PATH_N]", version="%prog 1.0")
+
+        # optional...
+        self.__parser.add_option("--file", "-f", type="string", nargs=1, action="store", dest="file",
+                                 help="load and save the indexed store using FILE")
+
+        self.__parser.add_option("--stdin", "-s", action="store_true", dest="stdin", default=False,
+                                 help="read configuration documents from stdin")
+
+        self.__parser.add_option("--query", "-q", type="string", action="append", dest="queries",
+                                 help="report devices matching EXPRESSION, of the form PATH OPERATOR VALUE")
+
+        self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
+                                 help="report narrative to stderr")
+
+        self.__opts, self.__args = self.__parser.parse_args()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_valid(self):
+        if not self.stdin and not self.paths and self.file is None:
+            return False
+
+        return True
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def file(self):
+        return self.__opts.file
+
+
+    @property
+    def stdin(self):
+        return self.__opts.stdin
+
+
+    @property
+    def queries(self):
+        return [] if self.__opts.queries is None else self.__opts.queries
+
+
+    @property
+    def verbose(self):
+        return self.__opts.verbose
+
+
+    @property
+    def paths(self):
+        return self.__args
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def print_help(self, file):
+        self.__parser.print_help(file)
+
+
+    def __str__(self, *args, **kwargs):
+        return "CmdFleetConfiguration:{file:%s, stdin:%s, queries:%s, verbose:%s, paths:%s}" % \
+               (self.file, self.stdin, self.queries, self.verbose, self.paths)
@@ -31,7 +31,7 @@ class CmdSCD30Baseline(object):
         Constructor
         """
         self.__parser = optparse.OptionParser(usage="%prog [{ { { -s | -o } VALUE | -c CORRECT REPORTED } "
-                                                    "[-t TEMP -m HUMID [-p PRESS]] | -z  | -d }] [-v]",
+                                                    "[-t TEMP -m HUMID [-p PRESS]] | -f FILE | -z  | -d }] [-v]",
                                               version="%prog 1.0")
 
         # function...
@@ -44,6 +44,9 @@ class CmdSCD30Baseline(object):
         self.__parser.add_option("--correct", "-c", type="int", nargs=2, action="store", dest="correct",
                                  help="change offset by the difference between CORRECT and REPORTED values")
 
+        self.__parser.add_option("--file", "-f", type="string", nargs=1, action="store", dest="file",
+                                 help="apply the corrections listed in JSON or CSV FILE ('-' for stdin)")
+
         self.__parser.add_option("--zero", "-z", action="store_true", dest="zero",
                                  help="zero all offsets")
 
@@ -88,12 +91,18 @@ class CmdSCD30Baseline(object):
         if self.zero is not None:
             param_count += 1
 
+        if self.file is not None:
+            param_count += 1
+
         if self.delete:
             param_count += 1
 
         if param_count > 1:
             return False
 
+        if self.file is not None and self.has_sample():
+            return False
+
         # environment...
         if bool(self.humid is None) != bool(self.temp is None):
             return False
@@ -152,6 +161,11 @@ class CmdSCD30Baseline(object):
         return self.__opts.press
 
 
+    @property
+    def file(self):
+        return self.__opts.file
+
+
     @property
     def zero(self):
         return self.__opts.zero
@@ -179,7 +193,7 @@ class CmdSCD30Baseline(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdSCD30Baseline:{set:%s, offset:%s, correct:%s, temp:%s, humid:%s, press:%s, zero:%s, " \
-               "delete:%s, indent:%s, verbose:%s}" % \
-               (self.set_value, self.offset_value, self.__opts.correct, self.temp, self.humid, self.press, self.zero,
-                self.delete, self.indent, self.verbose)
+        return "CmdSCD30Baseline:{set:%s, offset:%s, correct:%s, temp:%s, humid:%s, press:%s, file:%s, " \
+               "zero:%s, delete:%s, indent:%s, verbose:%s}" % \
+               (self.set_value, self.offset_value, self.__opts.correct, self.temp, self.humid, self.press,
+                self.file, self.zero, self.delete, self.indent, self.verbose)
@@ -6,6 +6,8 @@ Created on 13 Jul 2016
 
 import optparse
 
+from scs_mfr.comms.buffered_socket_sender import BufferedSocketSender
+
 
 # --------------------------------------------------------------------------------------------------------------------
 
@@ -13,12 +15,24 @@ class CmdSocketSender(object):
     """unix command line handler"""
 
     def __init__(self):
-        self.__parser = optparse.OptionParser(usage="%prog HOSTNAME [-p PORT] [-e] [-v]", version="%prog 1.0")
+        self.__parser = optparse.OptionParser(usage="%prog HOSTNAME [-p PORT] [-q SIZE] [-d] [-t TIMEOUT] [-e] [-v]",
+                                              version="%prog 1.0")
 
         # optional
         self.__parser.add_option("--port", "-p", type="int", nargs=1, action="store", default=2000, dest="port",
                                  help="socket port [default 2000]")
 
+        self.__parser.add_option("--queue", "-q", type="int", nargs=1, action="store",
+                                 default=BufferedSocketSender.DEFAULT_QUEUE_SIZE, dest="queue",
+                                 help="documents held while the link is down [default %d]" %
+                                      BufferedSocketSender.DEFAULT_QUEUE_SIZE)
+
+        self.__parser.add_option("--discard-oldest", "-d", action="store_true", dest="discard_oldest", default=False,
+                                 help="when the queue is full, discard the oldest document instead of waiting")
+
+        self.__parser.add_option("--timeout", "-t", type="float", nargs=1, action="store", default=10.0,
+                                 dest="timeout", help="on end of input, wait for queued documents [default 10.0]")
+
         self.__parser.add_option("--echo", "-e", action="store_true", dest="echo", default=False,
                                  help="echo stdin to stdout")
 
@@ -34,6 +48,9 @@ class CmdSocketSender(object):
         if self.hostname is None:
             return False
 
+        if self.queue < 1 or self.timeout < 0:
+            return False
+
         return True
 
 
@@ -49,6 +66,21 @@ class CmdSocketSender(object):
         return self.__opts.port
 
 
+    @property
+    def queue(self):
+        return self.__opts.queue
+
+
+    @property
+    def discard_oldest(self):
+        return self.__opts.discard_oldest
+
+
+    @property
+    def timeout(self):
+        return self.__opts.timeout
+
+
     @property
     def echo(self):
         return self.__opts.echo
@@ -66,5 +98,7 @@ class CmdSocketSender(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdSocketSender:{hostname:%s, port:%d, echo:%s, verbose:%s}" % \
-                    (self.hostname, self.port, self.echo, self.verbose)
+        return "CmdSocketSender:{hostname:%s, port:%d, queue:%s, discard_oldest:%s, timeout:%s, echo:%s, " \
+               "verbose:%s}" % \
+                    (self.hostname, self.port, self.queue, self.discard_oldest, self.timeout, self.echo,
+                     self.verbose)
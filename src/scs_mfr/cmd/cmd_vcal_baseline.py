@@ -35,7 +35,7 @@ class CmdVCalBaseline(object):
         """
         self.__parser = optparse.OptionParser(usage="%prog [{ -b GAS  | { { -s | -o } GAS VALUE "
                                                     "[-r SAMPLE_REC -t SAMPLE_TEMP -m SAMPLE_HUMID] } "
-                                                    "| -d }] [-i INDENT] [-v]", version="%prog 1.0")
+                                                    "| -f FILE | -d }] [-i INDENT] [-v]", version="%prog 1.0")
 
         # functions...
         self.__parser.add_option("--baseline", "-b", type="string", nargs=1, action="store", dest="baseline",
@@ -47,6 +47,9 @@ class CmdVCalBaseline(object):
         self.__parser.add_option("--offset", "-o", type="string", nargs=2, action="store", dest="offset",
                                  help="change offset for GAS, by integer VALUE")
 
+        self.__parser.add_option("--file", "-f", type="string", nargs=1, action="store", dest="file",
+                                 help="apply the corrections listed in JSON or CSV FILE ('-' for stdin)")
+
         self.__parser.add_option("--delete", "-d", action="store_true", dest="delete", default=False,
                                  help="delete the baseline configuration")
 
@@ -85,6 +88,9 @@ class CmdVCalBaseline(object):
         if self.offset is not None:
             count += 1
 
+        if self.file is not None:
+            count += 1
+
         if self.delete:
             count += 1
 
@@ -174,6 +180,11 @@ class CmdVCalBaseline(object):
         return int(self.offset[1]) if self.offset else None
 
 
+    @property
+    def file(self):
+        return self.__opts.file
+
+
     @property
     def delete(self):
         return self.__opts.delete
@@ -211,7 +222,7 @@ class CmdVCalBaseline(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdVCalBaseline:{baseline:%s, set:%s, offset:%s, delete:%s, " \
+        return "CmdVCalBaseline:{baseline:%s, set:%s, offset:%s, file:%s, delete:%s, " \
                "sample_rec:%s, sample_temp:%s, sample_humid:%s, indent:%s, verbose:%s}" % \
-               (self.baseline, self.set, self.offset, self.delete,
+               (self.baseline, self.set, self.offset, self.file, self.delete,
                 self.sample_rec, self.sample_temp, self.sample_humid, self.indent, self.verbose)
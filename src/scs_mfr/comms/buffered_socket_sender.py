@@ -0,0 +1,262 @@
+"""
+Created on 18 Oct 2026
+
+@author: South Coast Science (contact@southcoastscience.com)
+
+A sender of newline-delimited documents over one persistent TCP connection. Documents are held in a bounded queue,
+and a sender thread writes all the documents that are waiting - up to BATCH_BYTES - in a single operation, so that
+the number of writes falls as the input rate rises.
+
+If the connection cannot be made, or is lost, the sender reconnects with an exponential backoff, and documents are
+held in the queue meanwhile. When the queue is full, the producer is blocked until there is space, unless
+discard_oldest is set, in which case the oldest waiting document is discarded and counted.
+
+Before each write, the connection is checked for closure by the receiver, so that documents are not written to a
+connection that is known to be dead. A batch that fails part-way is sent again in full on reconnection, so a receiver
+may see a document twice. Note that TCP gives no confirmation of delivery: documents that were accepted by the
+operating system before a connection was lost may be lost with it.
+"""
+
+import select
+import socket
+import threading
+
+from collections import deque
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class BufferedSocketSender(object):
+    """
+    classdocs
+    """
+
+    DEFAULT_QUEUE_SIZE =        10000               # documents
+    DEFAULT_BATCH_BYTES =       65536               # bytes
+
+    CONNECT_TIMEOUT =           10.0                # seconds
+    MIN_BACKOFF =               0.5                 # seconds
+    MAX_BACKOFF =               30.0                # seconds
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, hostname, port, queue_size=DEFAULT_QUEUE_SIZE, batch_bytes=DEFAULT_BATCH_BYTES,
+                 discard_oldest=False):
+        """
+        Constructor
+        """
+        self.__hostname = hostname                                  # string
+        self.__port = port                                          # int
+        self.__queue_size = queue_size                              # int
+        self.__batch_bytes = batch_bytes                            # int
+        self.__discard_oldest = discard_oldest                      # bool
+
+        self.__queue = deque()                                      # deque of bytes
+        self.__pending = None                                       # bytes - a batch awaiting retry
+        self.__pending_count = 0                                    # int
+
+        self.__socket = None                                        # socket.socket
+        self.__backoff = 0.0                                        # float
+
+        self.__sent_count = 0                                       # int
+        self.__batch_count = 0                                      # int
+        self.__discarded_count = 0                                  # int
+        self.__connection_count = 0                                 # int
+
+        self.__closing = False                                      # bool - no more writes
+        self.__stopped = False                                      # bool - stop sending
+        self.__condition = threading.Condition()
+
+        self.__thread = threading.Thread(target=self.__run, daemon=True)
+        self.__thread.start()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def write(self, message):
+        document = (message + '\n').encode()
+
+        with self.__condition:
+            if self.__closing:
+                raise ValueError("write to closed sender")
+
+            while len(self.__queue) >= self.__queue_size:
+                if self.__discard_oldest:
+                    self.__queue.popleft()
+                    self.__discarded_count += 1
+                    break
+
+                self.__condition.wait()
+
+            self.__queue.append(document)
+            self.__condition.notify_all()
+
+
+    def close(self, timeout=None):
+        """
+        Wait up to timeout seconds for waiting documents to be sent, then stop the sender thread, which closes the
+        connection. A write in progress may delay the stop by up to CONNECT_TIMEOUT seconds. Return the number of
+        documents that were not sent.
+        """
+        with self.__condition:
+            self.__closing = True
+            self.__condition.notify_all()
+
+        self.__thread.join(timeout)
+
+        with self.__condition:
+            self.__stopped = True                                   # the sender thread stops at its next check
+            self.__condition.notify_all()
+
+        self.__thread.join()
+
+        with self.__condition:
+            return len(self.__queue) + self.__pending_count
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __run(self):
+        try:
+            self.__send_all()
+
+        finally:
+            self.__disconnect()                                     # only the sender thread uses the socket
+
+
+    def __send_all(self):
+        while True:
+            with self.__condition:
+                while not self.__queue and self.__pending is None and not self.__closing:
+                    self.__condition.wait()
+
+                if self.__stopped:
+                    return
+
+                if self.__pending is None:
+                    if not self.__queue:
+                        return                                      # closing, and nothing left to send
+
+                    self.__pending, self.__pending_count = self.__batch()
+                    self.__condition.notify_all()                   # producers may be waiting for space
+
+            if self.__send(self.__pending):
+                with self.__condition:
+                    self.__sent_count += self.__pending_count
+                    self.__batch_count += 1
+
+                    self.__pending = None
+                    self.__pending_count = 0
+
+                continue
+
+            # wait before reconnecting...
+            with self.__condition:
+                self.__condition.wait_for(lambda: self.__stopped, self.__backoff)
+
+
+    def __batch(self):
+        documents = [self.__queue.popleft()]
+        size = len(documents[0])
+
+        while self.__queue and size + len(self.__queue[0]) <= self.__batch_bytes:
+            document = self.__queue.popleft()
+
+            documents.append(document)
+            size += len(document)
+
+        return b''.join(documents), len(documents)
+
+
+    def __send(self, payload):
+        try:
+            if self.__socket is not None and self.__is_closed_by_peer():
+                self.__disconnect()
+
+            if self.__socket is None:
+                self.__connect()
+
+            self.__socket.sendall(payload)
+            self.__backoff = 0.0
+
+            return True
+
+        except OSError:
+            self.__disconnect()
+            self.__backoff = min(max(self.__backoff * 2, self.MIN_BACKOFF), self.MAX_BACKOFF)
+
+            return False
+
+
+    def __connect(self):
+        self.__socket = socket.create_connection((self.__hostname, self.__port), timeout=self.CONNECT_TIMEOUT)
+        self.__socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)      # batches are already coalesced
+
+        self.__connection_count += 1
+
+
+    def __is_closed_by_peer(self):
+        readable, _, _ = select.select([self.__socket], [], [], 0)
+
+        if not readable:
+            return False
+
+        return self.__socket.recv(4096) == b''                      # any data from the receiver is discarded
+
+
+    def __disconnect(self):
+        if self.__socket is None:
+            return
+
+        try:
+            self.__socket.close()
+        except OSError:
+            pass
+
+        self.__socket = None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def hostname(self):
+        return self.__hostname
+
+
+    @property
+    def port(self):
+        return self.__port
+
+
+    @property
+    def queued_count(self):
+        return len(self.__queue) + self.__pending_count
+
+
+    @property
+    def sent_count(self):
+        return self.__sent_count
+
+
+    @property
+    def batch_count(self):
+        return self.__batch_count
+
+
+    @property
+    def discarded_count(self):
+        return self.__discarded_count
+
+
+    @property
+    def connection_count(self):
+        return self.__connection_count
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "BufferedSocketSender:{hostname:%s, port:%s, queue_size:%s, batch_bytes:%s, discard_oldest:%s, " \
+               "queued_count:%s, sent_count:%s, batch_count:%s, discarded_count:%s, connection_count:%s}" % \
+               (self.hostname, self.port, self.__queue_size, self.__batch_bytes, self.__discard_oldest,
+                self.queued_count, self.sent_count, self.batch_count, self.discarded_count, self.connection_count)
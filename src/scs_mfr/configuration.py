@@ -15,11 +15,53 @@ of the configuration document must be supplied on the command line. Any fields t
 Note that the hostname field cannot be updated by the configuration utility. If this field is included in the
 update JSON specification, it is silently ignored.
 
+Updates are applied as a single transaction. Only the sections whose content differs from the saved version are
+written, and each written section is verified by reading it back. If any section cannot be applied, no changes are
+made. In verbose mode, a report giving the status of each section - applied, unchanged, failed or aborted - is
+written to stderr.
+
+By default, the sections of the configuration document are gathered one after another. If the --parallel flag is
+set, independent sections are gathered concurrently, and the document is complete in approximately the time taken by
+the slowest section. Any section that does not complete within TIMEOUT seconds is given the null value. In verbose
+mode, the status and elapsed time of each section are reported to stderr.
+
+If the --cache flag is set, sections that are backed by files in the ~/SCS directory are only re-read when the
+modification time or size of their file has changed. Otherwise, they are taken from a snapshot that is held in the
+host's tmp directory between runs.
+
+If the --diff flag is set, the output is a patch: a list of RFC 6902 JSON patch operations that carry the last
+document emitted in --diff mode to the current document, together with the SHA-256 hashes of the base and current
+documents. Only the sections that have changed are included. If the --since flag is used, the patch is only made
+against the last document if its hash matches HASH. Where no matching base document is available, the patch replaces
+the whole document. The last document emitted is held in the host's tmp directory.
+
+If the --stream flag is set, each section is written as soon as it has been gathered, rather than when the whole
+document is complete. Sections are written in the order in which they complete. Each section is written either as a
+self-contained JSON line carrying the rec, tag and ver fields or, if the --table flag is also set, as path,value rows.
+Output is flushed after each section, and the complete document is never held in memory. The --stream flag may be
+combined with --parallel and --cache.
+
+If a PSU is configured, its version is normally read from the PSU itself, or from the report written by psu_monitor
+if the PSU is locked. If the --psu-age flag is set, the psu_monitor report is used without opening the PSU, provided
+that it was written no more than AGE seconds ago. In verbose mode, the source of the PSU version is reported to stderr.
+
 SYNOPSIS
-configuration.py [-s CONFIGURATION] [-x] [{ -i INDENT | -t }] [-v]
+configuration.py [-s CONFIGURATION] [-x] [-a AGE] [-p TIMEOUT] [-c]
+[{ -i INDENT | -t | { -d | -b HASH } [-i INDENT] | -n [-t] }] [-v]
 
 EXAMPLES
 ./configuration.py -i4 -s '{"timezone-conf": {"name": "Europe/London"}}'
+./configuration.py -p 5 -c -v
+./configuration.py -a 300 -v
+./configuration.py -p 5 -n -t
+./configuration.py -b 9f3a0c6a5d1c2e8f7b44d21a6b0e3c7d95a1e2f4c8b6d0a3e5f7c9b1d3a5e7f9
+
+DOCUMENT EXAMPLE - PATCH
+{"tag": "scs-bgx-431", "rec": "2023-02-28T12:30:24Z",
+"base": "9f3a0c6a5d1c2e8f7b44d21a6b0e3c7d95a1e2f4c8b6d0a3e5f7c9b1d3a5e7f9",
+"hash": "0b1c0a8e4f6d2b9c7e5a3f1d8b6c4e2a0f9d7b5c3e1a8f6d4b2c0e9a7f5d3b1c",
+"patch": [{"op": "replace", "path": "/timezone-conf", "value": {"set-on": "2023-02-28T12:29:02Z",
+"name": "Europe/Paris"}}]}
 
 DOCUMENT EXAMPLE
 {
@@ -285,7 +327,12 @@ SEE ALSO
 scs_mfr/modem
 """
 
+import json
+import os
 import sys
+import time
+
+from collections import OrderedDict
 
 from scs_core.data.datetime import LocalizedDatetime
 from scs_core.data.json import JSONify
@@ -306,6 +353,13 @@ from scs_host.sys.host import Host
 
 from scs_mfr.cmd.cmd_configuration import CmdConfiguration
 
+from scs_mfr.estate.configuration_cache import ConfigurationCache
+from scs_mfr.estate.configuration_collector import ConfigurationCollector
+from scs_mfr.estate.configuration_patch import ConfigurationPatch, EmittedConfiguration
+from scs_mfr.estate.configuration_section import ConfigurationSection
+from scs_mfr.estate.configuration_stream import ConfigurationStream
+from scs_mfr.estate.configuration_update import ConfigurationUpdate, ConfigurationUpdateReport
+
 try:
     from scs_psu.psu.psu_conf import PSUConf
 except ImportError:
@@ -317,6 +371,8 @@ except ImportError:
 if __name__ == '__main__':
 
     psu_version = None
+    psu_version_source = None
+    probe_psu = False
 
     # ----------------------------------------------------------------------------------------------------------------
     # cmd...
@@ -357,33 +413,113 @@ if __name__ == '__main__':
     # ----------------------------------------------------------------------------------------------------------------
     # run...
 
-    if psu:
+    if psu and cmd.psu_age is not None:
+        try:
+            report_age = time.time() - os.path.getmtime(PSUVersion.filename(Host))
+        except OSError:
+            report_age = None                           # no report
+
+        logger.info("psu_version report age: %s" % (None if report_age is None else round(report_age, 1)))
+
+        if report_age is not None and report_age <= cmd.psu_age:
+            psu_version = PSUVersion.load(Host)
+            psu_version_source = 'report'
+
+    if psu and psu_version is None:
+        probe_psu = True
+
         try:
             psu.open()
             psu_version = psu.version()
+            psu_version_source = 'psu'
         except LockTimeout:
             psu_version = PSUVersion.load(Host)         # a report will be present if psu_monitor is running
+            psu_version_source = 'report'
         except OSError:
             psu_version = None                          # PSU fault
 
+    logger.info("psu_version source: %s" % psu_version_source)
+
     try:
         if cmd.save():
-            conf = Configuration.construct_from_jstr(cmd.configuration)
+            try:
+                update = json.loads(cmd.configuration, object_pairs_hook=OrderedDict)
+            except ValueError:
+                update = None
 
-            if conf is None:
+            if not isinstance(update, dict):
                 logger.error('invalid configuration: %s' % cmd.configuration)
                 exit(2)
 
-            try:
-                conf.save(Host)
-            except ValueError as ex:
-                logger.error(repr(ex))
+            report = ConfigurationUpdate(Host, ConfigurationSection.sections()).apply(update)
+            logger.info(JSONify.dumps(report))
+
+            if report.has_failures():
+                for name in report.names(ConfigurationUpdateReport.FAILED):
+                    logger.error("%s: %s" % (name, report.reason(name)))
+
                 exit(1)
 
-        configuration = Configuration.load(Host, psu_version=psu_version, exclude_sim=cmd.exclude_sim)
+        if cmd.by_section():
+            sections = ConfigurationSection.sections(psu_version=psu_version, exclude_sim=cmd.exclude_sim)
+            cache = ConfigurationCache.load(Host) if cmd.cache else None
+
+            if cache is not None:
+                sections = cache.sections(Host, sections)
+
+            max_workers = 1 if cmd.parallel is None else ConfigurationCollector.DEFAULT_MAX_WORKERS
+            collector = ConfigurationCollector(Host, sections, timeout=cmd.parallel, max_workers=max_workers)
+
+            if cmd.stream:
+                stream = ConfigurationStream(system_id.message_tag(), LocalizedDatetime.now().utc(),
+                                             Configuration.VERSION, table=cmd.table)
+                stream.write_header()
+
+                for report in collector.stream():
+                    stream.write(report.name, report.value)
+
+                logger.info(stream)
+                jdict = None
+
+            else:
+                jdict = collector.collect()
+
+            for report in collector.reports:
+                logger.info(report)
+
+            logger.info(collector)
+
+            if cache is not None:
+                cache.save()
+                logger.info(cache)
+
+            if jdict is None:
+                exit(0)
+
+            configuration = Configuration.construct_from_jdict(json.loads(JSONify.dumps(jdict)))
+
+        else:
+            configuration = Configuration.load(Host, psu_version=psu_version, exclude_sim=cmd.exclude_sim)
+
         sample = ConfigurationSample(system_id.message_tag(), LocalizedDatetime.now().utc(), configuration)
 
-        if cmd.table:
+        if cmd.patch():
+            current = json.loads(JSONify.dumps(configuration), object_pairs_hook=OrderedDict)
+            base = EmittedConfiguration.load(Host)
+
+            if base is not None and cmd.since is not None and ConfigurationPatch.digest(base) != cmd.since:
+                logger.info("base document does not match: %s" % cmd.since)
+                base = None
+
+            patch = ConfigurationPatch.construct(sample.tag, sample.rec, base, current)
+            logger.info(patch)
+
+            print(JSONify.dumps(patch, indent=cmd.indent, separators=None if cmd.indent else (',', ':')))
+
+            if base is None or patch.base != patch.hash:
+                EmittedConfiguration.save(Host, current)
+
+        elif cmd.table:
             for row in sample.as_table():
                 print(row)
 
@@ -394,5 +530,5 @@ if __name__ == '__main__':
             print(JSONify.dumps(sample, separators=(',', ':')))         # maximum compactness
 
     finally:
-        if psu:
+        if probe_psu:
             psu.close()
@@ -21,11 +21,22 @@ By default, output is in the form of a sequence of JSON documents, separated by
 selected, output is in the form of a JSON array - the output opens with a '[' character, documents are separated by
 the ',' character, and the output is terminated by a ']' character.
 
+Rows are converted in blocks, and the documents of each block are written in a single buffered operation. If the
+--line-buffered flag is set, rows are converted one at a time, and stdout is flushed after every document - this
+mode should be used where a downstream process must receive each document as soon as its row is available.
+
+If the --jobs flag is set, the named files are converted concurrently by a pool of JOBS worker processes. Each file
+is converted to a temporary spool file, and the spool files are written to stdout in the order in which the files
+were named, or - if the --unordered flag is set - in the order in which their conversions complete. In verbose mode,
+the row count and elapsed time of each conversion are reported to stderr. The --jobs flag cannot be used with stdin
+input, or in --line-buffered mode.
+
 SYNOPSIS
-csv_reader.py [-s] [-n] [-l LIMIT] [-a] [-v] [FILENAME_1 .. FILENAME_N]
+csv_reader.py [-s] [-n] [-l LIMIT] [-a] [{ -b | -j JOBS [-u] }] [-v] [FILENAME_1 .. FILENAME_N]
 
 EXAMPLES
 csv_reader.py -v scs-ph1-10-status-2019-07-*.csv
+csv_reader.py -v -j 8 scs-ph1-10-status-2019-07-*.csv > scs-ph1-10-status-2019-07.json
 
 DOCUMENT EXAMPLE - INPUT
 tag,rec,val.hmd,val.tmp
@@ -45,13 +56,20 @@ SEE ALSO
 scs_analysis/csv_writer
 """
 
+import shutil
 import sys
+import tempfile
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
-from scs_core.csv.csv_reader import CSVReader, CSVReaderException
+from scs_core.csv.csv_reader import CSVReaderException
 from scs_core.csv.csv_dict import CSVHeaderError
 
 from scs_mfr.cmd.cmd_csv_reader import CmdCSVReader
 
+from scs_mfr.tabular.csv_batch_reader import CSVBatchReader
+from scs_mfr.tabular.csv_conversion import CSVConversion
+
 
 # --------------------------------------------------------------------------------------------------------------------
 
@@ -61,12 +79,17 @@ if __name__ == '__main__':
     total_rows = 0
 
     reader = None
+    spool_dir = None
 
     # ----------------------------------------------------------------------------------------------------------------
     # cmd...
 
     cmd = CmdCSVReader()
 
+    if not cmd.is_valid():
+        cmd.print_help(sys.stderr)
+        exit(2)
+
     if cmd.verbose:
         print("csv_reader: %s" % cmd, file=sys.stderr)
 
@@ -74,73 +97,120 @@ if __name__ == '__main__':
         print('[', end='')
 
     try:
-        for filename in cmd.filenames:
+        if cmd.jobs is not None:
+            spool_dir = tempfile.mkdtemp(prefix='csv_reader-')
 
-            file_count += 1
-            rows = 0
+            with ProcessPoolExecutor(max_workers=cmd.jobs) as executor:
+                futures = [executor.submit(CSVConversion(filename, cast=cmd.cast, nullify=cmd.nullify,
+                                                         limit=cmd.limit).spool, spool_dir)
+                           for filename in cmd.filenames]
 
-            # --------------------------------------------------------------------------------------------------------
-            # resources...
+                try:
+                    for future in as_completed(futures) if cmd.unordered else futures:
+                        conversion = future.result()
+                        file_count += 1
 
-            try:
-                reader = CSVReader.construct_for_file(filename, cast=cmd.cast, nullify=cmd.nullify)
+                        if conversion.fatal:
+                            print("csv_reader: %s" % conversion.error, file=sys.stderr)
+                            exit(1)
 
-            except FileNotFoundError:
-                print("csv_reader: file not found: %s" % filename, file=sys.stderr)
-                exit(1)
+                        if conversion.error and cmd.verbose:
+                            print("csv_reader: %s" % conversion.error, file=sys.stderr)
 
-            except KeyError as ex:
-                print("csv_reader: empty header cell in: %s." % ex, file=sys.stderr)
-                exit(1)
+                        with open(conversion.spool_filename) as spool:
+                            if cmd.array:
+                                for line in spool:
+                                    sys.stdout.write(('' if total_rows == 0 else ', ') + line.rstrip('\n'))
+                                    total_rows += 1
+                            else:
+                                shutil.copyfileobj(spool, sys.stdout)
+                                total_rows += conversion.rows
 
-            except ValueError as ex:
-                print("csv_reader: duplicate column names in: %s." % ex, file=sys.stderr)
-                exit(1)
+                        conversion.discard()
 
-            if cmd.verbose:
-                print("csv_reader: %s" % reader, file=sys.stderr)
-                sys.stderr.flush()
+                        if cmd.verbose:
+                            print("csv_reader: %s: rows: %d elapsed: %0.3f" %
+                                  (conversion.filename, conversion.rows, conversion.elapsed), file=sys.stderr)
 
+                finally:
+                    for future in futures:
+                        future.cancel()                             # pending conversions are not started on exit
 
-            # --------------------------------------------------------------------------------------------------------
-            # run...
+        else:
+            for filename in cmd.filenames:
 
-            try:
-                for datum in reader.rows():
-                    if cmd.limit is not None and rows >= cmd.limit:
-                        break
+                file_count += 1
+                rows = 0
 
-                    if cmd.array:
-                        if rows == 0:
-                            print(datum, end='')
+                # ----------------------------------------------------------------------------------------------------
+                # resources...
 
-                        else:
-                            print(", %s" % datum, end='')
+                try:
+                    batch_size = 1 if cmd.line_buffered else CSVBatchReader.DEFAULT_BATCH_SIZE
+
+                    if cmd.limit is not None:
+                        batch_size = max(min(batch_size, cmd.limit), 1)
 
-                    else:
-                        print(datum)
+                    reader = CSVBatchReader.construct_for_file(filename, cast=cmd.cast, nullify=cmd.nullify,
+                                                               batch_size=batch_size)
 
-                    sys.stdout.flush()
+                except FileNotFoundError:
+                    print("csv_reader: file not found: %s" % filename, file=sys.stderr)
+                    exit(1)
 
-                    rows += 1
+                except KeyError as ex:
+                    print("csv_reader: empty header cell in: %s." % ex, file=sys.stderr)
+                    exit(1)
 
-            except CSVHeaderError as ex:
-                print("csv_reader: clashing column names: '%s' and '%s'" % (ex.left, ex.right), file=sys.stderr)
-                exit(1)
+                except ValueError as ex:
+                    print("csv_reader: duplicate column names in: %s." % ex, file=sys.stderr)
+                    exit(1)
 
-            except CSVReaderException as ex:
                 if cmd.verbose:
-                    print("csv_reader: ending file on row %d: %s" % (rows, ex), file=sys.stderr)
-                    continue
+                    print("csv_reader: %s" % reader, file=sys.stderr)
+                    sys.stderr.flush()
+
+
+                # ----------------------------------------------------------------------------------------------------
+                # run...
+
+                try:
+                    for block in reader.blocks():
+                        if cmd.limit is not None:
+                            block = block[:max(cmd.limit - rows, 0)]
 
-            finally:
-                if reader is not None:
-                    reader.close()
+                        if not block:
+                            break
 
-            if cmd.verbose:
-                print("csv_reader: rows: %d" % rows, file=sys.stderr)
+                        if cmd.array:
+                            separator = '' if total_rows + rows == 0 else ', '
+                            sys.stdout.write(separator + ', '.join(block))
 
-            total_rows += rows
+                        else:
+                            sys.stdout.write('\n'.join(block) + '\n')
+
+                        if cmd.line_buffered:
+                            sys.stdout.flush()
+
+                        rows += len(block)
+
+                except CSVHeaderError as ex:
+                    print("csv_reader: clashing column names: '%s' and '%s'" % (ex.left, ex.right), file=sys.stderr)
+                    exit(1)
+
+                except CSVReaderException as ex:
+                    if cmd.verbose:
+                        print("csv_reader: ending file on row %d: %s" % (rows, ex), file=sys.stderr)
+                        continue
+
+                finally:
+                    if reader is not None:
+                        reader.close()
+
+                if cmd.verbose:
+                    print("csv_reader: rows: %d" % rows, file=sys.stderr)
+
+                total_rows += rows
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -150,6 +220,9 @@ if __name__ == '__main__':
         print(file=sys.stderr)
 
     finally:
+        if spool_dir is not None:
+            shutil.rmtree(spool_dir, ignore_errors=True)
+
         if cmd.array:
             print(']')
 
@@ -23,17 +23,53 @@ All the leaf nodes of the first JSON document are included in the CSV. If subseq
 contain fields that were not in this first document, these extra fields are ignored. If subsequent JSON documents
 do not contain a field that is in the header, then this field is given the null value.
 
+In the default and spooled header-scan modes, the layout of each distinct document shape is worked out once and
+cached, so that documents of a known shape are flattened without walking their paths.
+
 header-scan mode:
 
 All input documents are scanned in order to build an inclusive hearer row. Any documents that do not contain a header
 fields are given a null value for that field. Any values bound to paths that become internal nodes are discarded.
 Warning: the header-scan mode requires memory proportional to the size of its input.
 
+spooled header-scan mode:
+
+If the --spool flag is set with --header-scan, input documents are written to a temporary file instead of being held
+in memory, and only the header row is built in memory. The output is the same as for the header-scan mode, and
+memory use does not depend on the size of the input. The temporary file is created in the directory named by the
+TMPDIR environment variable, or in /tmp by default, and is deleted when the utility terminates. Scalar documents
+have no named columns, and are skipped - the number skipped is reported in verbose mode.
+
+batched output:
+
+In the default mode, rows written to stdout are normally flushed one at a time. If --batch-rows is set, rows are
+held and written in batches of the given size; if --flush-interval is set, held rows are written at least every
+given number of seconds, so that a slow input does not hold rows indefinitely. The --fsync policy determines
+whether written data are committed to storage: never (the default), after every batch, or once on close.
+Held rows are always written when the input ends, or when the utility is interrupted or terminated.
+Batched output is not available in the header-scan modes, which write all their rows on close.
+
+columnar mode:
+
+If the --columnar flag is set, an Apache Parquet file is written to FILENAME instead of CSV. The columns are named
+and selected as in the default mode, but hold typed values - the type of each column is inferred from its first
+row group - so that analysis tools can read only the columns that they need, without parsing text. Row groups are
+compressed, and include min / max statistics for each column. The columnar mode requires the pyarrow package.
+
+No value is rounded to fit its column: integers outside the int64 range are held as strings. If a later row group
+holds the first values of a column, float values in an integer column, or integers too large for it, the column is
+widened and the file is rewritten. If a value cannot be represented exactly by the type of its column, the utility
+reports the column and terminates with exit status 1 - the rows of previous row groups are kept.
+
 SYNOPSIS
-csv_writer.py [{ -a | -x | -s }] [-q] [-e] [-v] [FILENAME]
+csv_writer.py { [{ -a | -x | -s [-p] }] [-q] [-b ROWS] [-i INTERVAL] [-f { never | batch | close }] |
+-c [-g ROWS] [-z COMPRESSION] } [-e] [-v] [FILENAME]
 
 EXAMPLES
 socket_receiver.py | csv_writer.py temp.csv -e
+TMPDIR=/srv/removable_data_storage csv_writer.py -s -p capture.csv < capture.json
+socket_receiver.py | csv_writer.py -b 100 -i 5.0 -f batch climate.csv
+csv_writer.py -c -z zstd climate.parquet < climate.json
 
 DOCUMENT EXAMPLE - INPUT
 {"tag": "scs-ap1-6", "rec": "2018-04-04T14:50:27.641+00:00", "val": {"hmd": 59.6, "tmp": 23.8}}
@@ -47,18 +83,26 @@ scs_analysis/csv_logger
 scs_analysis/csv_reader
 """
 
+import signal
 import sys
 
 from scs_core.csv.csv_writer import CSVWriter
 
 from scs_mfr.cmd.cmd_csv_writer import CmdCSVWriter
 
+from scs_mfr.tabular.batched_output import BatchedOutput
+from scs_mfr.tabular.columnar_writer import ColumnarWriter, ColumnarTypeError
+from scs_mfr.tabular.fast_csv_writer import FastCSVWriter
+from scs_mfr.tabular.spooled_csv_writer import SpooledCSVWriter
+
 
 # --------------------------------------------------------------------------------------------------------------------
 
 if __name__ == '__main__':
 
     writer = None
+    echo = None
+    echo_write = None
 
     document_count = 0
     processed_count = 0
@@ -76,16 +120,45 @@ if __name__ == '__main__':
         print("csv_writer: %s" % cmd, file=sys.stderr)
         sys.stderr.flush()
 
+    # terminate via the finally clause, so that held rows are written...
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
     try:
         # ------------------------------------------------------------------------------------------------------------
         # resources...
 
-        writer = CSVWriter(filename=cmd.filename, append=cmd.append, exclude_header=cmd.exclude_header,
-                           header_scan=cmd.header_scan, quote_all=cmd.quote_all)
+        if cmd.columnar:
+            if not ColumnarWriter.is_available():
+                print("csv_writer: the columnar mode requires the pyarrow package.", file=sys.stderr)
+                exit(1)
+
+            row_group = ColumnarWriter.DEFAULT_ROW_GROUP_SIZE if cmd.row_group is None else cmd.row_group
+
+            writer = ColumnarWriter(cmd.filename, row_group_size=row_group, compression=cmd.compression)
+
+        elif cmd.spool:
+            writer = SpooledCSVWriter(filename=cmd.filename, quote_all=cmd.quote_all)
+
+        elif cmd.header_scan:
+            writer = CSVWriter(filename=cmd.filename, header_scan=True, quote_all=cmd.quote_all)
+
+        else:
+            writer = FastCSVWriter(filename=cmd.filename, append=cmd.append, exclude_header=cmd.exclude_header,
+                                   quote_all=cmd.quote_all, batch_rows=cmd.batch_rows,
+                                   flush_interval=cmd.flush_interval, fsync=cmd.fsync)
 
         if cmd.verbose:
             print("csv_writer: %s" % writer, file=sys.stderr)
 
+        # echo shares the output of the writer, if both are written to stdout...
+        if cmd.echo and cmd.is_batched() and cmd.filename is None:
+            echo = writer.output
+            echo_write = echo.hold                                  # echoed lines are not counted as batch rows
+
+        elif cmd.echo and (cmd.batch_rows is not None or cmd.flush_interval is not None):
+            echo = BatchedOutput(sys.stdout, batch_rows=cmd.batch_rows, flush_interval=cmd.flush_interval)
+            echo_write = echo.write
+
 
         # ------------------------------------------------------------------------------------------------------------
         # run...
@@ -99,7 +172,10 @@ if __name__ == '__main__':
                 continue
 
             # echo...
-            if cmd.echo:
+            if echo is not None:
+                echo_write(jstr + '\n')
+
+            elif cmd.echo:
                 print(jstr)
                 sys.stdout.flush()
 
@@ -112,9 +188,26 @@ if __name__ == '__main__':
     except KeyboardInterrupt:
         print(file=sys.stderr)
 
+    except ColumnarTypeError as ex:
+        print("csv_writer: column %s is %s, and cannot hold its %s values exactly." %
+              (ex.path, ex.column_type, ex.value_types), file=sys.stderr)
+        exit(1)
+
     finally:
+        if echo is not None:
+            echo.close()
+
         if writer is not None:
-            writer.close()
+            try:
+                writer.close()
+
+            except ColumnarTypeError as ex:
+                print("csv_writer: column %s is %s, and cannot hold its %s values exactly." %
+                      (ex.path, ex.column_type, ex.value_types), file=sys.stderr)
+                exit(1)
 
         if cmd.verbose:
+            if (cmd.columnar or cmd.spool) and writer is not None:
+                print("csv_writer: %s" % writer, file=sys.stderr)
+
             print("csv_writer: documents: %d processed: %d" % (document_count, processed_count), file=sys.stderr)
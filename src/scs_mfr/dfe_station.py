@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: South Coast Science (contact@southcoastscience.com)
+
+DESCRIPTION
+The dfe_station utility is used to run the dfe_test utility on many test jigs at once, so that the throughput of a
+test station grows with the number of jigs. Each jig is a host with one DFE attached, and is named as
+[USER@]HOST:DFE_SERIAL_NUMBER, or as DFE_SERIAL_NUMBER alone for the host on which dfe_station is run. Jigs may be
+given on the command line, or in a FILE, one per line. Each host may appear only once.
+
+dfe_test is run on each remote host over SSH, which must be set up for login by key, and on the local host as a
+subprocess. All of the runs proceed in parallel, or at most WORKERS at a time. The --eeprom, --gps, --rtc and
+--sequential flags are passed to dfe_test.
+
+As each run completes, its test record is written to stdout, and a tally of passed, failed and unfinished runs is
+written to stderr. A run that gives no test record - for example, because its host is unreachable, or because it
+took longer than TIMEOUT seconds - is counted as an error, and reported on stderr. The output may be aggregated by
+the dfe_test_summary utility.
+
+The utility exits with status 0 if every board passed, and 1 otherwise.
+
+SYNOPSIS
+dfe_station.py [-f FILE] [-c COMMAND] [-e] [-g] [-r] [-s] [-w WORKERS] [-t TIMEOUT] [-v] [JIG_1 .. JIG_N]
+
+EXAMPLES
+./dfe_station.py -g -r -c ~/SCS/scs_mfr/src/scs_mfr/dfe_test.py pi@jig-1:123 pi@jig-2:124 pi@jig-3:125 > tests.json
+
+SEE ALSO
+scs_mfr/dfe_test
+scs_mfr/dfe_test_summary
+"""
+
+import json
+import sys
+
+from scs_core.sys.logging import Logging
+
+from scs_mfr.cmd.cmd_dfe_station import CmdDFEStation
+
+from scs_mfr.station.dfe_station import DFEStation, DFEStationTally
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    tally = None
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # cmd...
+
+    cmd = CmdDFEStation()
+
+    if not cmd.is_valid():
+        cmd.print_help(sys.stderr)
+        exit(2)
+
+    Logging.config('dfe_station', verbose=cmd.verbose)
+    logger = Logging.getLogger()
+
+    logger.info(cmd)
+
+    try:
+        # ------------------------------------------------------------------------------------------------------------
+        # resources...
+
+        try:
+            jigs = cmd.jigs()
+
+        except (OSError, ValueError) as ex:
+            logger.error("invalid jigs: %s" % ex)
+            exit(2)
+
+        station = DFEStation(jigs, test_args=cmd.test_args(), command=cmd.command, max_workers=cmd.workers,
+                             timeout=cmd.timeout)
+        logger.info(station)
+
+        tally = DFEStationTally(len(jigs))
+
+
+        # ------------------------------------------------------------------------------------------------------------
+        # run...
+
+        for result in station.run():
+            tally.add(result)
+
+            if result.datum is not None:
+                print(json.dumps(result.datum))
+                sys.stdout.flush()
+
+            else:
+                logger.error("%s: %s" % (result.jig, result.error))
+
+            print("dfe_station: %s: %s - %s" % (result.jig, result.result, tally), file=sys.stderr)
+            sys.stderr.flush()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # end...
+
+    except KeyboardInterrupt:
+        print(file=sys.stderr)
+
+    exit(0 if tally is not None and tally.is_all_passed() else 1)
@@ -9,12 +9,27 @@ DESCRIPTION
 The dfe_test utility is used to perform a quality control test on South Coast Science digital front-end (DFE) boards.
 The test exercises the ADCs and connectors.
 
-The output of the test is a JSON document, summarising the result of each of a series of tests.
+The output of the test is a JSON document, summarising the result of each of a series of tests. Its timing field
+gives the wall time of the whole run and, for each test, its wall time, the time it spent waiting for buses held by
+other tests, and the number of times that it held each bus and for how long, all in seconds. Timing records may be
+aggregated with the dfe_test_summary utility.
+
+Tests that do not share a bus are run concurrently: for example, the RTC test waits for the clock to tick, while the
+OPC powers up and the GPS module acquires a fix. A test holds a bus only while it uses it. The --sequential flag
+runs the tests one at a time, in the order in which they are reported.
+
+All of the tests share one session, which opens each bus and loads each configuration document once, and closes the
+buses when the tests are complete, or if the utility is interrupted.
+
+The RTC test measures the drift of the RTC against the host clock, in parts per million, from the edges of its
+seconds tick, over a window of one to three seconds. The drift and its uncertainty are reported in the rtc field.
+The RTC fails if it does not tick, if its calendar does not follow its seconds, or if its drift is certainly more
+than 10000 ppm.
 
 Ideally, a standard resistor load should be attached to the AFE connector of the DFE before the test is run.
 
 SYNOPSIS
-dfe_test.py [-e] [-g] [-r] [-v] DFE_SERIAL_NUMBER
+dfe_test.py [-e] [-g] [-r] [-s] [-v] DFE_SERIAL_NUMBER
 
 EXAMPLES
 ./dfe_test.py -g -r -v 123
@@ -22,12 +37,19 @@ EXAMPLES
 DOCUMENT EXAMPLE - OUTPUT
 {"tag": "scs-ap1-6", "rec": "2018-04-06T16:08:45.037+00:00",
 "val": {"host-sn": "0000000040d4d158", "dfe-sn": "123", "result": "FAIL",
-"subjects": {"RTC": "-", "BoardTemp": "OK", "OPC": "FAIL", "GPS": "-", "Int SHT": "OK", "Ext SHT": "OK",
+"subjects": {"RTC": "OK", "BoardTemp": "OK", "OPC": "FAIL", "GPS": "-", "Int SHT": "OK", "Ext SHT": "OK",
 "Pt1000": "OK", "AFE": "FAIL", "EEPROM": "OK"}, "afe": {"pt1": {"v": 0.323286, "tmp": 22.8},
 "sns": {"CO": {"weV": 0.339005, "aeV": 0.257254, "weC": 0.042188, "cnc": 155.1},
 "SO2": {"weV": 0.267942, "aeV": 0.275942, "weC": -0.009696, "cnc": -26.4},
 "H2S": {"weV": 0.296192, "aeV": 0.285754, "weC": 0.026254, "cnc": 19.4},
-"VOC": {"weV": 0.102627, "weC": 0.102037, "cnc": 1300.9}}}}}
+"VOC": {"weV": 0.102627, "weC": 0.102037, "cnc": 1300.9}}},
+"rtc": {"ticks": 1, "window": 1.001, "drift": -641.1, "uncertainty": 2401.4},
+"timing": {"total": 4.871, "tests": {"OPC": {"time": 4.855, "wait": 0.0, "buses": {"i2c-sensors": {"holds": 2,
+"time": 0.012}, "spi": {"holds": 2, "time": 4.821}}}, "Int SHT": {"time": 0.112, "wait": 0.007,
+"buses": {"i2c-sensors": {"holds": 1, "time": 0.104}}}, ...}}}}
+
+SEE ALSO
+scs_mfr/dfe_test_summary
 """
 
 import sys
@@ -52,7 +74,10 @@ from scs_mfr.test.eeprom_test import EEPROMTest
 from scs_mfr.test.gps_test import GPSTest
 from scs_mfr.test.opc_test import OPCTest
 from scs_mfr.test.pt1000_test import Pt1000Test
+from scs_mfr.test.resources import TestResources
 from scs_mfr.test.rtc_test import RTCTest
+from scs_mfr.test.scheduler import TestScheduler
+from scs_mfr.test.session import TestSession
 from scs_mfr.test.sht_test import SHTTest
 
 
@@ -102,138 +127,47 @@ if __name__ == '__main__':
     # run...
 
     afe_datum = None
+    rtc_datum = None
 
+    buses = [TestResources.I2C_SENSORS]
 
-    # ----------------------------------------------------------------------------------------------------------------
-    # UUID...
-
-
-    # ----------------------------------------------------------------------------------------------------------------
-    # RTC...
-
-    if cmd.ignore_rtc:
-        reporter.report_ignore("RTC")
-
-    else:
-        try:
-            test = RTCTest(interface, cmd.verbose)
-
-            test_ok = test.conduct()
-            reporter.report_test("RTC", test_ok)
-
-        except Exception as ex:
-            reporter.report_exception("RTC", ex)
-
-
-    # ----------------------------------------------------------------------------------------------------------------
-    # OPC...
-
-    try:
-        test = OPCTest(interface, cmd.verbose)
-
-        test_ok = test.conduct()
-        reporter.report_test("OPC", test_ok)
-
-    except Exception as ex:
-        reporter.report_exception("OPC", ex)
-
-
-    # ----------------------------------------------------------------------------------------------------------------
-    # GPS...
+    if not cmd.ignore_eeprom:
+        buses.append(TestResources.I2C_EEPROM)
 
-    if cmd.ignore_gps:
-        reporter.report_ignore("GPS")
+    with TestSession(Host, *buses) as session:
+        scheduler = TestScheduler(session, max_workers=1 if cmd.sequential else None)
 
-    else:
-        try:
-            test = GPSTest(interface, cmd.verbose)
+        scheduler.add("RTC", None if cmd.ignore_rtc else lambda: RTCTest(interface, cmd.verbose))
+        scheduler.add("OPC", lambda: OPCTest(interface, cmd.verbose))
+        scheduler.add("GPS", None if cmd.ignore_gps else lambda: GPSTest(interface, cmd.verbose))
+        scheduler.add("Int SHT", lambda: SHTTest("Int SHT", session.conf(SHTConf).int_sht(), interface, cmd.verbose))
+        scheduler.add("Ext SHT", lambda: SHTTest("Ext SHT", session.conf(SHTConf).ext_sht(), interface, cmd.verbose))
+        scheduler.add("Pt1000", lambda: Pt1000Test(interface, cmd.verbose))
+        scheduler.add("AFE", lambda: AFETest(interface, cmd.verbose))
+        scheduler.add("EEPROM", None if cmd.ignore_eeprom else lambda: EEPROMTest(interface, cmd.verbose))
 
-            test_ok = test.conduct()
-            reporter.report_test("GPS", test_ok)
+        scheduled_tests = scheduler.run()
 
-        except Exception as ex:
-            reporter.report_exception("GPS", ex)
-
-
-    # ----------------------------------------------------------------------------------------------------------------
-    # NDIR...
-
-
-    # ----------------------------------------------------------------------------------------------------------------
-    # Int SHT...
+        if cmd.verbose:
+            print(session, file=sys.stderr)
 
-    try:
-        sht_conf = SHTConf.load(Host)
-        sht = sht_conf.int_sht()
+    for scheduled in scheduled_tests:
+        if scheduled.ignored:
+            reporter.report_ignore(scheduled.subject)
 
-        test = SHTTest("Int SHT", sht, interface, cmd.verbose)
-
-        test_ok = test.conduct()
-        reporter.report_test("Int SHT", test_ok)
-
-    except Exception as ex:
-        reporter.report_exception("Int SHT", ex)
-
-
-    # ----------------------------------------------------------------------------------------------------------------
-    # Ext SHT...
-
-    try:
-        sht_conf = SHTConf.load(Host)
-        sht = sht_conf.ext_sht()
-
-        test = SHTTest("Ext SHT", sht, interface, cmd.verbose)
-
-        test_ok = test.conduct()
-        reporter.report_test("Ext SHT", test_ok)
-
-    except Exception as ex:
-        reporter.report_exception("Ext SHT", ex)
-
-
-    # ----------------------------------------------------------------------------------------------------------------
-    # Pt1000...
-
-    try:
-        test = Pt1000Test(interface, cmd.verbose)
-
-        test_ok = test.conduct()
-        reporter.report_test("Pt1000", test_ok)
-
-    except Exception as ex:
-        reporter.report_exception("Pt1000", ex)
-
-
-    # ----------------------------------------------------------------------------------------------------------------
-    # AFE...
-
-    try:
-        test = AFETest(interface, cmd.verbose)
-
-        test_ok = test.conduct()
-        reporter.report_test("AFE", test_ok)
-
-        afe_datum = test.datum
-
-    except Exception as ex:
-        reporter.report_exception("AFE", ex)
-
-
-    # ----------------------------------------------------------------------------------------------------------------
-    # EEPROM...
+        elif scheduled.exception is not None:
+            reporter.report_exception(scheduled.subject, scheduled.exception, metrics=scheduled.metrics)
 
-    if cmd.ignore_eeprom:
-        reporter.report_ignore("EEPROM")
+        else:
+            reporter.report_test(scheduled.subject, scheduled.ok, metrics=scheduled.metrics)
 
-    else:
-        try:
-            test = EEPROMTest(interface, cmd.verbose)
+        if scheduled.subject == "AFE" and scheduled.test is not None:
+            afe_datum = scheduled.test.datum
 
-            test_ok = test.conduct()
-            reporter.report_test("EEPROM", test_ok)
+        if scheduled.subject == "RTC" and scheduled.test is not None:
+            rtc_datum = scheduled.test.datum
 
-        except Exception as ex:
-            reporter.report_exception("EEPROM", ex)
+    reporter.report_elapsed(scheduler.elapsed)
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -242,6 +176,7 @@ if __name__ == '__main__':
     if cmd.verbose:
         print(reporter, file=sys.stderr)
         print(reporter.result, file=sys.stderr)
+        print(scheduler, file=sys.stderr)
         print("-", file=sys.stderr)
 
 
@@ -250,6 +185,7 @@ if __name__ == '__main__':
 
     recorded = LocalizedDatetime.now().utc()
     datum = DFETestDatum(system_id.message_tag(), recorded, Host.serial_number(), cmd.dfe_serial_number,
-                         reporter.subjects, afe_datum, reporter.result)
+                         reporter.subjects, afe_datum, reporter.result, rtc=rtc_datum,
+                         timing=reporter.timing)
 
     print(JSONify.dumps(datum))
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: South Coast Science (contact@southcoastscience.com)
+
+DESCRIPTION
+The dfe_test_summary utility is used to find the slowest stages of DFE production testing. It reads dfe_test output
+documents from stdin, one per line, and aggregates the timing field of each by stage. Each test subject is a stage,
+and the whole test run is the stage "total".
+
+For each stage, a document is written to stdout, giving the number of records, the number in which the stage did not
+pass, and the mean, median, 90th percentile and maximum wall time, in seconds. Where the records give them, the
+mean time spent waiting for buses held by other tests, and the mean number of holds and hold time of each bus, are
+also given. The total is reported first, followed by the stages in order of mean wall time, slowest first.
+
+Lines that are not valid test records are ignored, and counted in verbose mode. Records written by versions of
+dfe_test without timing are counted, but not otherwise used.
+
+SYNOPSIS
+dfe_test_summary.py [-n STAGES] [-i INDENT] [-v]
+
+EXAMPLES
+cat dfe_tests.json | ./dfe_test_summary.py -v -n 3
+
+DOCUMENT EXAMPLE - OUTPUT
+{"stage": "OPC", "count": 2318, "fails": 12, "time": {"mean": 4.861, "median": 4.85, "p90": 4.97, "max": 9.212},
+"wait": 0.004, "buses": {"i2c-sensors": {"holds": 2.0, "time": 0.012}, "spi": {"holds": 2.0, "time": 4.823}}}
+
+SEE ALSO
+scs_mfr/dfe_test
+"""
+
+import json
+import sys
+
+from scs_core.data.json import JSONify
+
+from scs_core.sys.logging import Logging
+
+from scs_mfr.cmd.cmd_dfe_test_summary import CmdDFETestSummary
+
+from scs_mfr.report.dfe_test_summary import DFETestSummary
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    rejected_count = 0
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # cmd...
+
+    cmd = CmdDFETestSummary()
+
+    if not cmd.is_valid():
+        cmd.print_help(sys.stderr)
+        exit(2)
+
+    Logging.config('dfe_test_summary', verbose=cmd.verbose)
+    logger = Logging.getLogger()
+
+    logger.info(cmd)
+
+    try:
+        # ------------------------------------------------------------------------------------------------------------
+        # run...
+
+        summary = DFETestSummary()
+
+        for line in sys.stdin:
+            try:
+                jdict = json.loads(line)
+                summary.add(jdict)
+
+            except (AttributeError, TypeError, ValueError):
+                rejected_count += 1
+
+        logger.info(summary)
+
+        if rejected_count:
+            logger.info("rejected: %d" % rejected_count)
+
+        for stage in summary.stages(limit=cmd.stages):
+            print(JSONify.dumps(stage, indent=cmd.indent))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # end...
+
+    except KeyboardInterrupt:
+        print(file=sys.stderr)
@@ -0,0 +1,182 @@
+"""
+Created on 18 Oct 2026
+
+@author: South Coast Science (contact@southcoastscience.com)
+
+A persistent snapshot of the file-backed sections of the configuration document. Each entry is keyed on the path,
+modification time and size of its backing file - a section is only re-read and re-parsed when its key changes.
+
+The snapshot is held in the host's tmp directory, so that polling does not add to flash wear. It is written only
+when an entry has changed.
+
+example document:
+{"afe-baseline": {"path": "/home/scs/SCS/conf/afe_baseline.json", "mtime": 1675860759000000000, "size": 342,
+"value": {"sn1": {"calibrated-on": "2023-02-08T12:52:39Z", "offset": 10, "env": null}, ...}}, ...}
+"""
+
+import json
+import os
+import threading
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONify
+
+from scs_mfr.estate.configuration_section import ConfigurationSection
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ConfigurationCache(object):
+    """
+    classdocs
+    """
+
+    __FILENAME = "configuration_cache.json"
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def load(cls, manager):
+        filename = os.path.join(manager.tmp_dir(), cls.__FILENAME)
+
+        try:
+            with open(filename) as f:
+                entries = json.load(f, object_hook=OrderedDict)
+
+        except (FileNotFoundError, ValueError):
+            entries = OrderedDict()
+
+        return cls(filename, entries)
+
+
+    @staticmethod
+    def backing_file(manager, section):
+        if section.conf_class is None:
+            return None
+
+        try:
+            dirname, filename = section.conf_class.persistence_location()
+        except (NotImplementedError, TypeError):
+            return None
+
+        return os.path.join(manager.scs_path(), dirname, filename)
+
+
+    @staticmethod
+    def file_key(path):
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return path, None, None
+
+        return path, stat.st_mtime_ns, stat.st_size
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, filename, entries):
+        """
+        Constructor
+        """
+        self.__filename = filename                          # string
+        self.__entries = entries                            # dict of string: dict
+
+        self.__hits = 0                                     # int
+        self.__misses = 0                                   # int
+        self.__dirty = False                                # bool
+
+        self.__lock = threading.Lock()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def sections(self, manager, sections):
+        return tuple(self.section(manager, section) for section in sections)
+
+
+    def section(self, manager, section):
+        path = self.backing_file(manager, section)
+
+        if path is None:
+            return section                                  # not file-backed - always gathered
+
+        return ConfigurationSection(section.name, lambda m: self.__value(m, section, path),
+                                    conf_class=section.conf_class, settable=section.settable)
+
+
+    def save(self):
+        if not self.__dirty:
+            return
+
+        tmp_filename = '.'.join((self.__filename, str(os.getpid())))
+
+        with self.__lock:
+            jstr = json.dumps(self.__entries, separators=(',', ':'))
+
+        os.makedirs(os.path.dirname(self.__filename), exist_ok=True)
+
+        with open(tmp_filename, 'w') as f:
+            f.write(jstr + '\n')
+
+        os.rename(tmp_filename, self.__filename)            # atomic operation
+
+        self.__dirty = False
+
+
+    def clear(self):
+        with self.__lock:
+            self.__entries = OrderedDict()
+            self.__dirty = True
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __value(self, manager, section, path):
+        path, mtime, size = self.file_key(path)
+
+        with self.__lock:
+            entry = self.__entries.get(section.name)
+
+            if entry is not None and (entry['path'], entry['mtime'], entry['size']) == (path, mtime, size):
+                self.__hits += 1
+                return entry['value']
+
+            self.__misses += 1
+
+        value = json.loads(JSONify.dumps(section.load(manager)), object_hook=OrderedDict)
+
+        with self.__lock:
+            self.__entries[section.name] = OrderedDict([('path', path), ('mtime', mtime), ('size', size),
+                                                        ('value', value)])
+            self.__dirty = True
+
+        return value
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def filename(self):
+        return self.__filename
+
+
+    @property
+    def hits(self):
+        return self.__hits
+
+
+    @property
+    def misses(self):
+        return self.__misses
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __len__(self):
+        return len(self.__entries)
+
+
+    def __str__(self, *args, **kwargs):
+        return "ConfigurationCache:{filename:%s, entries:%s, hits:%s, misses:%s, dirty:%s}" % \
+               (self.filename, len(self), self.hits, self.misses, self.__dirty)
@@ -0,0 +1,275 @@
+"""
+Created on 18 Oct 2026
+
+@author: South Coast Science (contact@southcoastscience.com)
+
+Gathers the sections of the configuration document concurrently, using a pool of worker threads. Each section is
+given TIMEOUT seconds from the moment that its loader starts. A section that overruns is reported as 'TIMEOUT' and
+given the null value - its worker is abandoned, and replaced so that the pool does not shrink. If TIMEOUT is None,
+each section is given as long as it needs.
+
+Workers are daemon threads, so that an abandoned loader cannot prevent the process from exiting.
+
+collect() returns the whole document, in section order. stream() yields each section report as soon as the section
+is complete or abandoned, in order of completion - the value held by a report is released once the next report is
+requested, so that the whole document is never held in memory.
+"""
+
+import threading
+import time
+
+from collections import OrderedDict
+from queue import Queue, Empty
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ConfigurationCollector(object):
+    """
+    classdocs
+    """
+
+    DEFAULT_TIMEOUT =       10.0                # seconds
+    DEFAULT_MAX_WORKERS =   8
+
+    __POLL_INTERVAL =       0.1                 # seconds
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, manager, sections, timeout=DEFAULT_TIMEOUT, max_workers=DEFAULT_MAX_WORKERS):
+        """
+        Constructor
+        """
+        self.__manager = manager                                    # PersistenceManager
+        self.__sections = sections                                  # iterable of ConfigurationSection
+        self.__timeout = None if timeout is None else float(timeout)    # float or None
+        self.__max_workers = int(max_workers)                       # int
+
+        self.__reports = OrderedDict()                              # dict of string: ConfigurationSectionReport
+        self.__elapsed = None                                       # float
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def collect(self):
+        jdict = OrderedDict((section.name, None) for section in self.__sections)
+
+        for report in self.stream():
+            jdict[report.name] = report.value
+
+        return jdict
+
+
+    def stream(self):
+        start_time = time.time()
+
+        self.__reports = OrderedDict()
+        tasks = Queue()
+        completed = Queue()
+
+        for section in self.__sections:
+            self.__reports[section.name] = ConfigurationSectionReport(section.name, completed)
+            tasks.put(section)
+
+        for _ in range(min(self.__max_workers, len(self.__reports))):
+            self.__start_worker(tasks)
+
+        outstanding = len(self.__reports)
+
+        while outstanding > 0:
+            try:
+                report = completed.get(timeout=self.__wait_time())
+
+            except Empty:
+                for overdue in self.__reports.values():
+                    if overdue.is_overdue(self.__timeout) and overdue.abandon():
+                        self.__start_worker(tasks)
+                continue
+
+            outstanding -= 1
+
+            yield report
+
+            report.release()
+
+        self.__elapsed = time.time() - start_time
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __wait_time(self):
+        if self.__timeout is None:
+            return None
+
+        deadlines = [report.start_time + self.__timeout for report in self.__reports.values() if report.is_running()]
+
+        if not deadlines:
+            return self.__POLL_INTERVAL                             # no section has started yet
+
+        return max(min(deadlines) - time.time(), 0.0)
+
+
+    def __start_worker(self, tasks):
+        worker = threading.Thread(target=self.__work, args=(tasks, ), daemon=True)
+        worker.start()
+
+
+    def __work(self, tasks):
+        while True:
+            try:
+                section = tasks.get_nowait()
+            except Empty:
+                return
+
+            report = self.__reports[section.name]
+            report.start()
+
+            try:
+                report.complete(section.load(self.__manager))
+
+            except Exception as ex:
+                report.fail(ex)
+
+            if report.is_abandoned():
+                return                                  # a replacement worker has taken over the queue
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def timeout(self):
+        return self.__timeout
+
+
+    @property
+    def max_workers(self):
+        return self.__max_workers
+
+
+    @property
+    def reports(self):
+        return list(self.__reports.values())
+
+
+    @property
+    def elapsed(self):
+        return self.__elapsed
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "ConfigurationCollector:{timeout:%s, max_workers:%s, elapsed:%s}" % \
+               (self.timeout, self.max_workers, self.elapsed)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ConfigurationSectionReport(object):
+    """
+    classdocs
+    """
+
+    TIMEOUT =       'TIMEOUT'
+    OK =            'OK'
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, name, completed):
+        """
+        Constructor
+        """
+        self.__name = name                                  # string
+        self.__completed = completed                        # Queue of ConfigurationSectionReport
+
+        self.__value = None                                 # JSONable
+        self.__status = None                                # string
+        self.__start_time = None                            # float
+        self.__elapsed = None                               # float
+
+        self.__lock = threading.Lock()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def start(self):
+        self.__start_time = time.time()
+
+
+    def complete(self, value):
+        self.__finish(value, self.OK)
+
+
+    def fail(self, exception):
+        self.__finish(None, exception.__class__.__name__)
+
+
+    def abandon(self):
+        return self.__finish(None, self.TIMEOUT)
+
+
+    def release(self):
+        self.__value = None
+
+
+    def __finish(self, value, status):
+        with self.__lock:
+            if self.__status is not None:
+                return False                                # too late - the section has already been reported
+
+            self.__value = value
+            self.__status = status
+            self.__elapsed = time.time() - self.__start_time
+
+        self.__completed.put(self)
+
+        return True
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_running(self):
+        return self.__start_time is not None and self.__status is None
+
+
+    def is_overdue(self, timeout):
+        return self.is_running() and time.time() >= self.__start_time + timeout
+
+
+    def is_abandoned(self):
+        return self.__status == self.TIMEOUT
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def name(self):
+        return self.__name
+
+
+    @property
+    def value(self):
+        return self.__value
+
+
+    @property
+    def status(self):
+        return self.__status
+
+
+    @property
+    def start_time(self):
+        return self.__start_time
+
+
+    @property
+    def elapsed(self):
+        return self.__elapsed
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        elapsed = None if self.elapsed is None else round(self.elapsed, 3)
+
+        return "ConfigurationSectionReport:{name:%s, status:%s, elapsed:%s}" % (self.name, self.status, elapsed)
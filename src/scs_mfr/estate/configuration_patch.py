@@ -0,0 +1,238 @@
+"""
+Created on 18 Oct 2026
+
+@author: South Coast Science (contact@southcoastscience.com)
+
+An RFC 6902 style JSON patch that carries a configuration document from a base version to its current version, at
+the granularity of whole sections. The base and the result are identified by the SHA-256 digest of their canonical
+JSON form (sorted keys, no whitespace), so that a receiver can check that it holds the right base before applying
+the patch, and that its reconstruction matches the device.
+
+If no base is available, the patch replaces the whole document.
+
+https://datatracker.ietf.org/doc/html/rfc6902
+https://datatracker.ietf.org/doc/html/rfc6901
+
+example document:
+{"tag": "scs-bgx-431", "rec": "2023-02-28T12:25:24Z",
+"base": "0b1c...", "hash": "9f3a...",
+"patch": [{"op": "replace", "path": "/sim", "value": {"imsi": "234301951432536", "iccid": "8944303382697124815",
+"operator-code": "23430", "operator-name": "EE"}}]}
+"""
+
+import copy
+import hashlib
+import json
+import os
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONable
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ConfigurationPatch(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def digest(jdict):
+        jstr = json.dumps(jdict, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+
+        return hashlib.sha256(jstr.encode()).hexdigest()
+
+
+    @staticmethod
+    def pointer(name):
+        return '/' + name.replace('~', '~0').replace('/', '~1')
+
+
+    @staticmethod
+    def name(pointer):
+        return pointer[1:].replace('~1', '/').replace('~0', '~')
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct(cls, tag, rec, base, current):
+        if base is None:
+            return cls(tag, rec, None, cls.digest(current), [cls.__operation('replace', '', current)])
+
+        operations = []
+
+        for name, value in current.items():
+            if name not in base:
+                operations.append(cls.__operation('add', cls.pointer(name), value))
+
+            elif base[name] != value:
+                operations.append(cls.__operation('replace', cls.pointer(name), value))
+
+        for name in base.keys():
+            if name not in current:
+                operations.append(cls.__operation('remove', cls.pointer(name)))
+
+        return cls(tag, rec, cls.digest(base), cls.digest(current), operations)
+
+
+    @classmethod
+    def construct_from_jdict(cls, jdict):
+        if not jdict:
+            return None
+
+        return cls(jdict.get('tag'), jdict.get('rec'), jdict.get('base'), jdict.get('hash'), jdict.get('patch'))
+
+
+    @staticmethod
+    def __operation(op, path, value=None):
+        operation = OrderedDict()
+
+        operation['op'] = op
+        operation['path'] = path
+
+        if op != 'remove':
+            operation['value'] = value
+
+        return operation
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, tag, rec, base, hash, patch):
+        """
+        Constructor
+        """
+        self.__tag = tag                                    # string
+        self.__rec = rec                                    # LocalizedDatetime
+        self.__base = base                                  # string (hex digest) or None
+        self.__hash = hash                                  # string (hex digest)
+        self.__patch = patch                                # list of dict
+
+
+    def __len__(self):
+        return len(self.__patch)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def apply(self, base):
+        if self.base is not None and (base is None or self.digest(base) != self.base):
+            raise ValueError("base document does not match: %s" % self.base)
+
+        document = OrderedDict() if base is None else copy.deepcopy(base)
+
+        for operation in self.patch:
+            op = operation['op']
+            path = operation['path']
+
+            if path == '':
+                document = copy.deepcopy(operation['value'])
+
+            elif op == 'remove':
+                del document[self.name(path)]
+
+            elif op in ('add', 'replace'):
+                document[self.name(path)] = copy.deepcopy(operation['value'])
+
+            else:
+                raise ValueError("unsupported operation: %s" % op)
+
+        if self.digest(document) != self.hash:
+            raise ValueError("result document does not match: %s" % self.hash)
+
+        return document
+
+
+    def is_complete(self):
+        return self.base is None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        jdict['tag'] = self.tag
+        jdict['rec'] = self.rec
+        jdict['base'] = self.base
+        jdict['hash'] = self.hash
+        jdict['patch'] = self.patch
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def tag(self):
+        return self.__tag
+
+
+    @property
+    def rec(self):
+        return self.__rec
+
+
+    @property
+    def base(self):
+        return self.__base
+
+
+    @property
+    def hash(self):
+        return self.__hash
+
+
+    @property
+    def patch(self):
+        return self.__patch
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "ConfigurationPatch:{tag:%s, rec:%s, base:%s, hash:%s, patch:%s}" % \
+               (self.tag, self.rec, self.base, self.hash, [op['path'] for op in self.patch])
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class EmittedConfiguration(object):
+    """
+    the last configuration document that was emitted, held in the host's tmp directory
+    """
+
+    __FILENAME = "configuration_emitted.json"
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def filename(cls, manager):
+        return os.path.join(manager.tmp_dir(), cls.__FILENAME)
+
+
+    @classmethod
+    def load(cls, manager):
+        try:
+            with open(cls.filename(manager)) as f:
+                return json.load(f, object_hook=OrderedDict)
+
+        except (FileNotFoundError, ValueError):
+            return None
+
+
+    @classmethod
+    def save(cls, manager, jdict):
+        filename = cls.filename(manager)
+        tmp_filename = '.'.join((filename, str(os.getpid())))
+
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+
+        with open(tmp_filename, 'w') as f:
+            f.write(json.dumps(jdict, separators=(',', ':'), ensure_ascii=False) + '\n')
+
+        os.rename(tmp_filename, filename)                   # atomic operation
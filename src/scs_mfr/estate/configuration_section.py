@@ -0,0 +1,173 @@
+"""
+Created on 18 Oct 2026
+
+@author: South Coast Science (contact@southcoastscience.com)
+
+A named component of the configuration document, together with the means of gathering it. Sections that are
+backed by a PersistentJSONable class also know the class, so that the backing file can be located and the section
+can be reconstructed and, if it is settable, saved.
+
+The catalogue of sections follows the field order of the configuration document.
+"""
+
+import os
+import socket
+
+from scs_core.aws.config.project import Project
+from scs_core.aws.greengrass.aws_group_configuration import AWSGroupConfiguration
+
+from scs_core.climate.mpl115a2_calib import MPL115A2Calib
+from scs_core.climate.pressure_conf import PressureConf
+
+from scs_core.comms.mqtt_conf import MQTTConf
+
+from scs_core.csv.csv_logger_conf import CSVLoggerConf
+
+from scs_core.display.display_conf import DisplayConf
+
+from scs_core.estate.package_version import PackageVersions
+
+from scs_core.gas.afe.pt1000_calib import Pt1000Calib
+from scs_core.gas.afe_baseline import AFEBaseline
+from scs_core.gas.afe_id import AFEId
+from scs_core.gas.ndir.ndir_conf import NDIRConf
+from scs_core.gas.scd30.scd30_baseline import SCD30Baseline
+
+from scs_core.location.timezone_conf import TimezoneConf
+
+from scs_core.model.gas.gas_baseline import GasBaseline
+from scs_core.model.gas.gas_model_conf import GasModelConf
+from scs_core.model.gas.vcal_baseline import VCalBaseline
+from scs_core.model.pmx.pmx_model_conf import PMxModelConf
+
+from scs_core.particulate.opc_version import OPCVersion
+
+from scs_core.sync.schedule import Schedule
+
+from scs_core.sys.system_id import SystemID
+
+from scs_dfe.climate.sht_conf import SHTConf
+from scs_dfe.gas.scd30.scd30_conf import SCD30Conf
+from scs_dfe.gps.gps_conf import GPSConf
+from scs_dfe.interface.interface_conf import InterfaceConf
+from scs_dfe.particulate.opc_conf import OPCConf
+
+try:
+    from scs_psu.psu.psu_conf import PSUConf
+except ImportError:
+    from scs_core.psu.psu_conf import PSUConf
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ConfigurationSection(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def sections(cls, psu_version=None, exclude_sim=False):
+        return (
+            cls('hostname', lambda manager: socket.gethostname()),
+            cls('os', lambda manager: cls.__os_report()),
+            cls('packs', lambda manager: PackageVersions.construct_from_installation(manager.scs_path(), manager)),
+
+            cls.persistent('afe-baseline', AFEBaseline),
+            cls.persistent('afe-id', AFEId, settable=False),
+            cls.persistent('aws-group-config', AWSGroupConfiguration),
+            cls.persistent('aws-project', Project),
+            cls('data-log', cls.__data_log_report),
+            cls.persistent('display-conf', DisplayConf),
+            cls.persistent('vcal-baseline', VCalBaseline),
+            cls.persistent('gas-baseline', GasBaseline),
+            cls.persistent('gas-model-conf', GasModelConf),
+            cls.persistent('gps-conf', GPSConf),
+            cls.persistent('interface-conf', InterfaceConf),
+            cls.persistent('mpl115a2-calib', MPL115A2Calib),
+            cls.persistent('mqtt-conf', MQTTConf),
+            cls.persistent('ndir-conf', NDIRConf),
+            cls.persistent('opc-conf', OPCConf),
+            cls.persistent('opc-version', OPCVersion, settable=False),
+            cls.persistent('pmx-model-conf', PMxModelConf),
+            cls.persistent('pressure-conf', PressureConf),
+            cls.persistent('psu-conf', PSUConf),
+            cls('psu-version', lambda manager: psu_version),
+            cls.persistent('pt1000-calib', Pt1000Calib),
+            cls.persistent('scd30-baseline', SCD30Baseline),
+            cls.persistent('scd30-conf', SCD30Conf),
+            cls.persistent('schedule', Schedule),
+            cls.persistent('sht-conf', SHTConf),
+
+            cls('networks', lambda manager: manager.networks()),
+            cls('modem', lambda manager: manager.modem()),
+            cls('sim', lambda manager: None if exclude_sim else manager.sim()),
+
+            cls.persistent('system-id', SystemID),
+            cls.persistent('timezone-conf', TimezoneConf)
+        )
+
+
+    @classmethod
+    def persistent(cls, name, conf_class, settable=True):
+        return cls(name, conf_class.load, conf_class=conf_class, settable=settable)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def __os_report():
+        uname = os.uname()
+
+        return {'rel': uname.release, 'vers': uname.version}
+
+
+    @staticmethod
+    def __data_log_report(manager):
+        csv_logger_conf = CSVLoggerConf.load(manager)
+
+        return None if csv_logger_conf is None else csv_logger_conf.filesystem_report()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, name, loader, conf_class=None, settable=False):
+        """
+        Constructor
+        """
+        self.__name = name                                  # string
+        self.__loader = loader                              # callable(manager)
+        self.__conf_class = conf_class                      # PersistentJSONable class or None
+        self.__settable = bool(settable)                    # bool
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def load(self, manager):
+        return self.__loader(manager)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def name(self):
+        return self.__name
+
+
+    @property
+    def conf_class(self):
+        return self.__conf_class
+
+
+    @property
+    def settable(self):
+        return self.__settable
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        conf_class = None if self.conf_class is None else self.conf_class.__name__
+
+        return "ConfigurationSection:{name:%s, conf_class:%s, settable:%s}" % (self.name, conf_class, self.settable)
@@ -0,0 +1,384 @@
+"""
+Created on 18 Oct 2026
+
+@author: South Coast Science (contact@southcoastscience.com)
+
+A columnar store of the configuration documents of a fleet of devices. Each device is a row, identified by its tag -
+only the most recent document for each tag is held. Each leaf path of the configuration document (without the 'val.'
+prefix) is a column, holding the value for every device that reports that path.
+
+Columns are indexed on first use: an equality index maps each value to its rows, and ordered indexes of the numeric
+and string values are searched by bisection. Indexes are discarded when a column changes, so that a query costs
+only the index look-up once the store has been built.
+
+The store is held as a single JSON document, so that it need not be rebuilt from the source documents for each query.
+
+example document:
+{"tags": ["scs-bgx-431", "scs-bgx-432"], "recs": ["2023-02-28T12:25:24Z", "2023-02-28T12:26:01Z"],
+"columns": {"opc-version.firmware": {"0": "OPC-N3 Iss1.1 FirmwareVer=1.17a", "1": "OPC-N3 Iss1.1 FirmwareVer=1.18"},
+"afe-baseline.sn2.offset": {"0": 48, "1": 103}}}
+"""
+
+import json
+import os
+import re
+
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+
+from scs_core.data.json import JSONable
+from scs_core.data.path_dict import PathDict
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ConfigurationStore(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def load(cls, filename):
+        try:
+            with open(filename) as f:
+                jdict = json.load(f)
+
+        except FileNotFoundError:
+            return cls()
+
+        return cls.construct_from_jdict(jdict)
+
+
+    @classmethod
+    def construct_from_jdict(cls, jdict):
+        if not jdict:
+            return cls()
+
+        columns = OrderedDict()
+
+        for path, cells in jdict.get('columns', {}).items():
+            columns[path] = ConfigurationColumn(OrderedDict((int(row), value) for row, value in cells.items()))
+
+        return cls(tags=jdict.get('tags'), recs=jdict.get('recs'), columns=columns)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, tags=None, recs=None, columns=None):
+        """
+        Constructor
+        """
+        self.__tags = [] if tags is None else tags                      # list of string
+        self.__recs = [] if recs is None else recs                      # list of ISO 8601 string
+        self.__columns = OrderedDict() if columns is None else columns  # dict of path: ConfigurationColumn
+
+        self.__rows = dict((tag, row) for row, tag in enumerate(self.__tags))
+
+
+    def __len__(self):
+        return len(self.__tags)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def insert(self, sample):
+        tag = sample.get('tag')
+        rec = sample.get('rec')
+        val = sample.get('val')
+
+        if tag is None or not isinstance(val, dict):
+            raise ValueError("not a configuration sample")
+
+        row = self.__rows.get(tag)
+
+        if row is None:
+            row = len(self.__tags)
+
+            self.__rows[tag] = row
+            self.__tags.append(tag)
+            self.__recs.append(rec)
+
+        elif rec is not None and self.__recs[row] is not None and rec <= self.__recs[row]:
+            return False                                    # we already hold a document that is as recent
+
+        else:
+            self.__recs[row] = rec
+
+            for column in self.__columns.values():
+                column.remove(row)
+
+        path_dict = PathDict(val)
+
+        for path in path_dict.paths():
+            if path not in self.__columns:
+                self.__columns[path] = ConfigurationColumn()
+
+            self.__columns[path].insert(row, path_dict.node(path))
+
+        return True
+
+
+    def save(self, filename):
+        tmp_filename = '.'.join((filename, str(os.getpid())))
+
+        with open(tmp_filename, 'w') as f:
+            f.write(json.dumps(self.as_json(), separators=(',', ':')) + '\n')
+
+        os.rename(tmp_filename, filename)                   # atomic operation
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def query(self, predicates):
+        rows = None
+
+        for predicate in sorted(predicates, key=lambda p: len(self.column(p.path))):
+            matches = predicate.rows(self.column(predicate.path))
+            rows = matches if rows is None else rows & matches
+
+            if not rows:
+                break
+
+        return sorted(range(len(self)) if rows is None else rows)
+
+
+    def column(self, path):
+        return self.__columns.get(path, ConfigurationColumn())
+
+
+    def tag(self, row):
+        return self.__tags[row]
+
+
+    def rec(self, row):
+        return self.__recs[row]
+
+
+    def paths(self):
+        return list(self.__columns.keys())
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        jdict['tags'] = self.__tags
+        jdict['recs'] = self.__recs
+        jdict['columns'] = OrderedDict((path, column.as_json()) for path, column in self.__columns.items())
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "ConfigurationStore:{devices:%s, columns:%s}" % (len(self), len(self.__columns))
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ConfigurationColumn(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def key(value):
+        return json.dumps(value, sort_keys=True)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, cells=None):
+        """
+        Constructor
+        """
+        self.__cells = OrderedDict() if cells is None else cells        # dict of row: value
+
+        self.__equality = None                                          # dict of key: set of row
+        self.__numbers = None                                           # (list of number, list of row)
+        self.__strings = None                                           # (list of string, list of row)
+
+
+    def __len__(self):
+        return len(self.__cells)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def insert(self, row, value):
+        self.__cells[row] = value
+        self.__invalidate()
+
+
+    def remove(self, row):
+        if self.__cells.pop(row, self) is not self:
+            self.__invalidate()
+
+
+    def rows(self):
+        return set(self.__cells.keys())
+
+
+    def value(self, row):
+        return self.__cells.get(row)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def equal(self, value):
+        if self.__equality is None:
+            self.__equality = {}
+
+            for row, cell in self.__cells.items():
+                self.__equality.setdefault(self.key(cell), set()).add(row)
+
+        return set(self.__equality.get(self.key(value), ()))
+
+
+    def between(self, lower=None, upper=None, include_lower=True, include_upper=True):
+        bound = lower if lower is not None else upper
+        keys, rows = self.__numeric_index() if self.is_number(bound) else self.__string_index()
+
+        start = 0 if lower is None else (bisect_left if include_lower else bisect_right)(keys, lower)
+        end = len(keys) if upper is None else (bisect_right if include_upper else bisect_left)(keys, upper)
+
+        return set(rows[start:end])
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def is_number(value):
+        return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+    def __numeric_index(self):
+        if self.__numbers is None:
+            self.__numbers = self.__ordered_index(lambda cell: self.is_number(cell))
+
+        return self.__numbers
+
+
+    def __string_index(self):
+        if self.__strings is None:
+            self.__strings = self.__ordered_index(lambda cell: isinstance(cell, str))
+
+        return self.__strings
+
+
+    def __ordered_index(self, accept):
+        entries = sorted((cell, row) for row, cell in self.__cells.items() if accept(cell))
+
+        return [cell for cell, _ in entries], [row for _, row in entries]
+
+
+    def __invalidate(self):
+        self.__equality = None
+        self.__numbers = None
+        self.__strings = None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        return OrderedDict((str(row), value) for row, value in self.__cells.items())
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "ConfigurationColumn:{cells:%s, indexed:%s}" % (len(self), self.__equality is not None)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ConfigurationPredicate(object):
+    """
+    classdocs
+    """
+
+    OPERATORS = ('==', '!=', '<=', '>=', '<', '>')
+
+    __EXPRESSION = re.compile(r'^\s*([^\s=!<>]+)\s*(==|!=|<=|>=|<|>)\s*(.*?)\s*$')
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_expression(cls, expression):
+        match = cls.__EXPRESSION.match(expression)
+
+        if match is None:
+            raise ValueError(expression)
+
+        path, operator, operand = match.groups()
+
+        try:
+            value = json.loads(operand)
+        except ValueError:
+            value = operand                                 # an unquoted string
+
+        return cls(path, operator, value)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, path, operator, value):
+        """
+        Constructor
+        """
+        self.__path = path                                  # string
+        self.__operator = operator                          # string
+        self.__value = value                                # JSON value
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def rows(self, column):
+        if self.operator == '==':
+            return column.equal(self.value)
+
+        if self.operator == '!=':
+            return column.rows() - column.equal(self.value)
+
+        if not (ConfigurationColumn.is_number(self.value) or isinstance(self.value, str)):
+            raise ValueError("ordered comparison with %s" % self.value)
+
+        if self.operator == '<':
+            return column.between(upper=self.value, include_upper=False)
+
+        if self.operator == '<=':
+            return column.between(upper=self.value)
+
+        if self.operator == '>':
+            return column.between(lower=self.value, include_lower=False)
+
+        return column.between(lower=self.value)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def path(self):
+        return self.__path
+
+
+    @property
+    def operator(self):
+        return self.__operator
+
+
+    @property
+    def value(self):
+        return self.__value
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "ConfigurationPredicate:{path:%s, operator:%s, value:%s}" % (self.path, self.operator, self.value)
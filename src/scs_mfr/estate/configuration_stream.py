@@ -0,0 +1,126 @@
+"""
+Created on 18 Oct 2026
+
+@author: South Coast Science (contact@southcoastscience.com)
+
+Writes the configuration document one section at a time, as each section becomes available. Each section is written
+either as a self-contained NDJSON line, or as comma-separated path,value rows matching the ConfigurationSample table
+format. The output is flushed after every section, so that a downstream process can act on the early sections while
+the slower ones are still being gathered.
+
+Sections are written in order of completion, not in document order.
+
+example NDJSON line:
+{"rec":"2023-02-28T12:25:24Z","tag":"scs-bgx-431","ver":1.3,"val":{"timezone-conf":{"set-on":"2017-08-15T12:50:05Z",
+"name":"Europe/London"}}}
+
+example table rows:
+timezone-conf.set-on,2017-08-15T12:50:05Z
+timezone-conf.name,Europe/London
+"""
+
+import json
+import sys
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONify
+from scs_core.data.path_dict import PathDict
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ConfigurationStream(object):
+    """
+    classdocs
+    """
+
+    __HIDDEN_VALUES = [
+        'aws-api-auth.api-key',
+        'shared-secret.key'
+    ]
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, tag, rec, version, table=False, file=sys.stdout):
+        """
+        Constructor
+        """
+        self.__tag = tag                                    # string
+        self.__rec = rec                                    # LocalizedDatetime
+        self.__version = version                            # float
+        self.__table = bool(table)                          # bool
+        self.__file = file                                  # text stream
+
+        self.__count = 0                                    # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def write_header(self):
+        if not self.__table:
+            return                                          # each NDJSON line carries its own header
+
+        for key, value in json.loads(JSONify.dumps(self.__header()), object_pairs_hook=OrderedDict).items():
+            print(','.join((key, str(value))), file=self.__file)
+
+        self.__file.flush()
+
+
+    def write(self, name, value):
+        if self.__table:
+            for row in self.rows(name, value):
+                print(row, file=self.__file)
+        else:
+            print(self.line(name, value), file=self.__file)
+
+        self.__file.flush()
+        self.__count += 1
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def line(self, name, value):
+        jdict = self.__header()
+        jdict['val'] = OrderedDict([(name, value)])
+
+        return JSONify.dumps(jdict, separators=(',', ':'))
+
+
+    def rows(self, name, value):
+        path_dict = PathDict(json.loads(JSONify.dumps({name: value}), object_pairs_hook=OrderedDict))
+
+        for path in path_dict.paths():
+            node = path_dict.node(path)
+            setting = '######' if path in self.__HIDDEN_VALUES else ('' if node is None else node)
+
+            yield ','.join((path, str(setting)))
+
+
+    def __header(self):
+        jdict = OrderedDict()
+
+        jdict['rec'] = self.__rec
+        jdict['tag'] = self.__tag
+        jdict['ver'] = round(self.__version, 1)
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def table(self):
+        return self.__table
+
+
+    @property
+    def count(self):
+        return self.__count
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "ConfigurationStream:{tag:%s, rec:%s, version:%s, table:%s, count:%s}" % \
+               (self.__tag, self.__rec, self.__version, self.table, self.count)
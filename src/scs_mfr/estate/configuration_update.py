@@ -0,0 +1,218 @@
+"""
+Created on 18 Oct 2026
+
+@author: South Coast Science (contact@southcoastscience.com)
+
+Applies a multi-section configuration update as a single transaction.
+
+In the first phase, each named section is constructed from the update and compared with the section as currently
+saved - nothing is written if any section is invalid. In the second phase, only the sections that differ are saved,
+and each is verified by loading it back. If any save or verification fails, the sections that have already been
+saved are restored to their previous state.
+
+The persistence manager writes each file to a temporary name and then renames it, so every individual save is atomic.
+
+example report:
+{"gps-conf": {"status": "applied", "reason": null}, "schedule": {"status": "unchanged", "reason": null},
+"packs": {"status": "failed", "reason": "section is not settable"}}
+"""
+
+import json
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONable, JSONify
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ConfigurationUpdate(object):
+    """
+    classdocs
+    """
+
+    __IGNORED = ('hostname', )                                  # silently ignored, as documented
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def as_jdict(obj):
+        return json.loads(JSONify.dumps(obj), object_pairs_hook=OrderedDict)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, manager, sections):
+        """
+        Constructor
+        """
+        self.__manager = manager                                # PersistenceManager
+        self.__sections = OrderedDict((section.name, section) for section in sections)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def apply(self, update):
+        report = ConfigurationUpdateReport()
+        changes = []                                            # list of (section, previous, obj)
+
+        # prepare...
+        for name, value in update.items():
+            if name in self.__IGNORED or value is None:
+                continue
+
+            section = self.__sections.get(name)
+
+            if section is None:
+                report.fail(name, "unknown section")
+                continue
+
+            if section.conf_class is None or not section.settable:
+                report.fail(name, "section is not settable")
+                continue
+
+            try:
+                obj = section.conf_class.construct_from_jdict(value)
+                previous = section.load(self.__manager)
+
+            except Exception as ex:
+                report.fail(name, repr(ex))
+                continue
+
+            if obj is None:
+                report.fail(name, "invalid section")
+                continue
+
+            if previous is not None and self.as_jdict(previous) == self.as_jdict(obj):
+                report.unchanged(name)
+                continue
+
+            changes.append((section, previous, obj))
+
+        if report.has_failures():
+            for section, _, _ in changes:
+                report.abort(section.name)
+
+            return report
+
+        # save and verify...
+        saved = []
+
+        for section, previous, obj in changes:
+            try:
+                obj.save(self.__manager)
+                saved.append((section, previous))
+
+                if self.as_jdict(section.load(self.__manager)) != self.as_jdict(obj):
+                    raise ValueError("verification failed")
+
+                report.apply(section.name)
+
+            except Exception as ex:
+                report.fail(section.name, repr(ex))
+                break
+
+        if report.has_failures():
+            self.__roll_back(saved)
+
+            for section, _, _ in changes:
+                if report.status(section.name) != ConfigurationUpdateReport.FAILED:
+                    report.abort(section.name)
+
+        return report
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __roll_back(self, saved):
+        for section, previous in reversed(saved):
+            if previous is None:
+                section.conf_class.delete(self.__manager)
+            else:
+                previous.save(self.__manager)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "ConfigurationUpdate:{sections:%s}" % list(self.__sections.keys())
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ConfigurationUpdateReport(JSONable):
+    """
+    classdocs
+    """
+
+    APPLIED =       'applied'
+    UNCHANGED =     'unchanged'
+    FAILED =        'failed'
+    ABORTED =       'aborted'
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__sections = OrderedDict()                         # dict of string: (string, string)
+
+
+    def __len__(self):
+        return len(self.__sections)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def apply(self, name):
+        self.__sections[name] = (self.APPLIED, None)
+
+
+    def unchanged(self, name):
+        self.__sections[name] = (self.UNCHANGED, None)
+
+
+    def fail(self, name, reason):
+        self.__sections[name] = (self.FAILED, reason)
+
+
+    def abort(self, name):
+        self.__sections[name] = (self.ABORTED, "another section failed")
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def status(self, name):
+        return self.__sections[name][0] if name in self.__sections else None
+
+
+    def reason(self, name):
+        return self.__sections[name][1] if name in self.__sections else None
+
+
+    def names(self, status):
+        return [name for name, (section_status, _) in self.__sections.items() if section_status == status]
+
+
+    def has_failures(self):
+        return bool(self.names(self.FAILED))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        for name, (status, reason) in self.__sections.items():
+            jdict[name] = OrderedDict([('status', status), ('reason', reason)])
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "ConfigurationUpdateReport:{applied:%s, unchanged:%s, failed:%s, aborted:%s}" % \
+               (self.names(self.APPLIED), self.names(self.UNCHANGED), self.names(self.FAILED),
+                self.names(self.ABORTED))
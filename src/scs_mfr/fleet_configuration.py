@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: South Coast Science (contact@southcoastscience.com)
+
+DESCRIPTION
+The fleet_configuration utility is used to compare the configurations of a fleet of devices. It ingests
+ConfigurationSample documents, as produced by the configuration utility, and builds a columnar store, indexed by
+device tag and configuration path. Only the most recent document for each device is retained.
+
+Documents may be read from stdin, as a sequence of JSON documents separated by newlines, or from the named files. A
+file may hold a single JSON document, or a sequence of documents separated by newlines. If a directory is named, all
+of its .json files are read.
+
+If a STORE file is given, the store is loaded from it before any documents are ingested, and saved to it afterwards -
+subsequent queries can then be answered without reading the source documents again.
+
+Each query EXPRESSION takes the form PATH OPERATOR VALUE, where PATH is a path into the configuration document
+(without the 'val.' prefix), OPERATOR is one of ==, !=, <, <=, > or >=, and VALUE is a JSON value or an unquoted
+string. Numeric values are compared numerically, and strings lexically. Devices that do not report the PATH never
+match. If several queries are given, devices must match all of them.
+
+For each matching device, the tag, the rec of its most recent document and the values of the queried paths are
+written to stdout as a JSON document. In verbose mode, the number of matching devices and the query time are reported
+to stderr.
+
+SYNOPSIS
+fleet_configuration.py [-f STORE] [-s] [-q EXPRESSION [-q EXPRESSION ...]] [-v] [PATH_1 .. PATH_N]
+
+EXAMPLES
+./fleet_configuration.py -v -f ~/fleet.json ~/configurations/
+./fleet_configuration.py -f ~/fleet.json -q 'opc-version.firmware != OPC-N3 Iss1.1 FirmwareVer=1.17a'
+./fleet_configuration.py -f ~/fleet.json -q 'afe-baseline.sn2.offset > 100' -q 'system-id.model-id == BGX'
+
+DOCUMENT EXAMPLE - OUTPUT
+{"tag": "scs-bgx-432", "rec": "2023-02-28T12:26:01Z", "val": {"afe-baseline.sn2.offset": 103,
+"system-id.model-id": "BGX"}}
+
+SEE ALSO
+scs_mfr/configuration
+"""
+
+import json
+import os
+import sys
+import time
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONify
+
+from scs_core.sys.logging import Logging
+
+from scs_mfr.cmd.cmd_fleet_configuration import CmdFleetConfiguration
+
+from scs_mfr.estate.configuration_store import ConfigurationStore, ConfigurationPredicate
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+def documents(file):
+    jstr = file.read()
+
+    try:
+        jdict = json.loads(jstr)
+        yield from jdict if isinstance(jdict, list) else [jdict]
+        return
+
+    except ValueError:
+        pass
+
+    for line in jstr.splitlines():
+        if line.strip():
+            yield json.loads(line)
+
+
+def filenames(paths):
+    for path in paths:
+        if not os.path.isdir(path):
+            yield path
+            continue
+
+        for filename in sorted(os.listdir(path)):
+            if filename.endswith('.json'):
+                yield os.path.join(path, filename)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    ingested = 0
+    updated = 0
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # cmd...
+
+    cmd = CmdFleetConfiguration()
+
+    if not cmd.is_valid():
+        cmd.print_help(sys.stderr)
+        exit(2)
+
+    # logging...
+    Logging.config('fleet_configuration', verbose=cmd.verbose)
+    logger = Logging.getLogger()
+
+    logger.info(cmd)
+
+    try:
+        predicates = [ConfigurationPredicate.construct_from_expression(query) for query in cmd.queries]
+    except ValueError as ex:
+        logger.error("invalid query: %s" % ex)
+        exit(2)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # resources...
+
+    try:
+        store = ConfigurationStore() if cmd.file is None else ConfigurationStore.load(cmd.file)
+
+    except ValueError as ex:
+        logger.error("invalid store: %s" % ex)
+        exit(1)
+
+    logger.info(store)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # run...
+
+    try:
+        # ingest...
+        try:
+            for filename in filenames(cmd.paths):
+                with open(filename) as f:
+                    for document in documents(f):
+                        ingested += 1
+                        updated += store.insert(document)
+
+            if cmd.stdin:
+                for line in sys.stdin:
+                    if line.strip():
+                        ingested += 1
+                        updated += store.insert(json.loads(line))
+
+        except FileNotFoundError as ex:
+            logger.error("file not found: %s" % ex.filename)
+            exit(1)
+
+        except (AttributeError, ValueError) as ex:
+            logger.error("invalid configuration document (%d): %s" % (ingested, ex))
+            exit(1)
+
+        if ingested:
+            logger.info("ingested: %d updated: %d" % (ingested, updated))
+            logger.info(store)
+
+        if cmd.file is not None and updated:
+            store.save(cmd.file)
+
+        # query...
+        if predicates:
+            start_time = time.time()
+            rows = store.query(predicates)
+            elapsed = time.time() - start_time
+
+            for row in rows:
+                jdict = OrderedDict()
+
+                jdict['tag'] = store.tag(row)
+                jdict['rec'] = store.rec(row)
+                jdict['val'] = OrderedDict((p.path, store.column(p.path).value(row)) for p in predicates)
+
+                print(JSONify.dumps(jdict))
+
+            logger.info("matches: %d elapsed: %0.3f ms" % (len(rows), elapsed * 1000.0))
+
+    except KeyboardInterrupt:
+        print(file=sys.stderr)
@@ -17,25 +17,41 @@ an ozone sensor is identified as Ox.
 
 Note that the scs_dev/gasses_sampler and greengrass processes must be restarted for changes to take effect.
 
+Every change is also appended to the baseline history, so that the offset in force at any past time can be found
+with the baseline_history utility.
+
+If the --file flag is set, the corrections listed in the given JSON or CSV file are applied together - the baseline
+document is loaded and saved once, however many corrections are listed. Corrections that name another device tag are
+ignored, so that one list may be used for a fleet. Each correction gives a gas and exactly one of set, offset or
+correct and reported values, and may give the rec, hmd and tmp of its sample. If any correction cannot be applied,
+no change is saved. The old and new offset of each corrected gas are written to stdout.
+
 WARNING:
 
 SYNOPSIS
 gas_baseline.py [{ -b GAS  | { { -s | -o } GAS VALUE | -c GAS CORRECT REPORTED }
-[-r SAMPLE_REC -t SAMPLE_TEMP -m SAMPLE_HUMID] | -z | -d }] [-i INDENT] [-v]
+[-r SAMPLE_REC -t SAMPLE_TEMP -m SAMPLE_HUMID] | -f FILE | -z | -d }] [-i INDENT] [-v]
 
 EXAMPLES
 ./baseline.py -c NO2 10 23
+./gas_baseline.py -v -f ~/colocation/corrections.json
+
+CORRECTIONS EXAMPLE
+[{"tag": "scs-bgx-431", "gas": "NO2", "correct": 10, "reported": 23}, {"tag": "scs-bgx-431", "gas": "CO", "offset": -4}]
 
 DOCUMENT EXAMPLE
 {"CO": {"calibrated-on": "2021-01-19T10:07:27Z", "offset": 2},
 "NO2": {"calibrated-on": "2021-01-19T10:07:27Z", "offset": 1}}
 
 FILES
-~/SCS/conf/baseline.json
+~/SCS/conf/gas_baseline.json
+~/SCS/conf/baseline_history.json
 
 SEE ALSO
 scs_dev/gases_sampler
 scs_mfr/afe_calib
+scs_mfr/baseline_colocation
+scs_mfr/baseline_history
 """
 
 import sys
@@ -48,10 +64,13 @@ from scs_core.gas.sensor_baseline import SensorBaseline, SensorBaselineSample
 from scs_core.model.gas.gas_baseline import GasBaseline
 
 from scs_core.sys.logging import Logging
+from scs_core.sys.system_id import SystemID
 
-from scs_host.bus.i2c import I2C
 from scs_host.sys.host import Host
 
+from scs_mfr.baseline.baseline_correction import BaselineCorrection, BaselineCorrectionReport
+from scs_mfr.baseline.baseline_history import BaselineHistory
+
 from scs_mfr.cmd.cmd_baseline import CmdBaseline
 
 
@@ -59,9 +78,6 @@ from scs_mfr.cmd.cmd_baseline import CmdBaseline
 
 if __name__ == '__main__':
 
-    sht = None
-    barometer = None
-
     now = LocalizedDatetime.now().utc()
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -84,12 +100,17 @@ if __name__ == '__main__':
 
 
     try:
-        I2C.Sensors.open()
-
         # ------------------------------------------------------------------------------------------------------------
         # resources...
 
         baseline = GasBaseline.load(Host, skeleton=True)
+        history = BaselineHistory(BaselineHistory.filename(Host))
+
+        try:
+            corrections = None if cmd.file is None else BaselineCorrection.load_file(cmd.file)
+        except (OSError, ValueError) as ex:
+            logger.error("corrections: %s" % ex)
+            exit(1)
 
 
         # ------------------------------------------------------------------------------------------------------------
@@ -115,8 +136,36 @@ if __name__ == '__main__':
             baseline.set_sensor_baseline(cmd.gas_name(), SensorBaseline(now, new_offset, sample=sample))
             baseline.save(Host)
 
+            history.record(now, 'gas', {cmd.gas_name(): baseline.sensor_baseline(cmd.gas_name())})
+
             logger.info("%s: was: %s now: %s" % (cmd.gas_name(), old_offset, new_offset))
 
+        # batch...
+        if corrections is not None:
+            system_id = SystemID.load(Host)
+            report = BaselineCorrectionReport(None if system_id is None else system_id.message_tag())
+
+            for correction in corrections:
+                if not correction.applies_to(report.tag):
+                    report.skip()
+                    continue
+
+                old_offset = baseline.sensor_offset(correction.gas)
+                new_offset = correction.new_offset(old_offset)
+
+                baseline.set_sensor_baseline(correction.gas, SensorBaseline(now, new_offset, sample=correction.sample))
+                report.add(correction.gas, old_offset, new_offset)
+
+                logger.info("%s: was: %s now: %s" % (correction.gas, old_offset, new_offset))
+
+            if len(report) > 0:
+                baseline.save(Host)
+
+                history.record(now, 'gas', dict((gas, baseline.sensor_baseline(gas)) for gas in report.gases()))
+
+            print(JSONify.dumps(report, indent=cmd.indent))
+            baseline = None
+
         # baseline...
         if cmd.baseline:
             gas_name = cmd.gas_name()
@@ -135,8 +184,12 @@ if __name__ == '__main__':
 
             baseline.save(Host)
 
+            history.record(now, 'gas', dict((gas, baseline.sensor_baseline(gas)) for gas in baseline.gases()))
+
         # delete...
         if cmd.delete:
+            history.record(now, 'gas', dict((gas, None) for gas in baseline.gases()))
+
             GasBaseline.delete(Host)
             baseline = None
 
@@ -150,6 +203,3 @@ if __name__ == '__main__':
 
     except KeyboardInterrupt:
         print(file=sys.stderr)
-
-    finally:
-        I2C.Sensors.close()
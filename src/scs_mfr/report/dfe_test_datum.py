@@ -20,7 +20,8 @@ class DFETestDatum(Sample):
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    def __init__(self, tag, rec, host_serial_number, dfe_serial_number, subjects, afe, result, version=None):
+    def __init__(self, tag, rec, host_serial_number, dfe_serial_number, subjects, afe, result, rtc=None,
+                 timing=None, version=None):
         """
         Constructor
         """
@@ -34,6 +35,8 @@ class DFETestDatum(Sample):
         self.__subjects = subjects                                      # dict of string: string
         self.__afe = afe                                                # HostStatus
         self.__result = result                                          # string
+        self.__rtc = rtc                                                # RTCDrift
+        self.__timing = timing                                          # dict of total and per-test seconds
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -55,6 +58,12 @@ class DFETestDatum(Sample):
         jdict['subjects'] = self.subjects
         jdict['afe'] = self.afe
 
+        if self.rtc is not None:
+            jdict['rtc'] = self.rtc
+
+        if self.timing is not None:
+            jdict['timing'] = self.timing
+
         return jdict
 
 
@@ -85,10 +94,20 @@ class DFETestDatum(Sample):
         return self.__result
 
 
+    @property
+    def rtc(self):
+        return self.__rtc
+
+
+    @property
+    def timing(self):
+        return self.__timing
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     def __str__(self, *args, **kwargs):
         return "StatusSample:{tag:%s, rec:%s, src:%s, host_serial_number:%s, dfe_serial_number:%s, " \
-               "subjects:%s,  afe:%s, result:%s}" % \
+               "subjects:%s,  afe:%s, result:%s, rtc:%s, timing:%s}" % \
             (self.tag, self.rec, self.src, self.host_serial_number, self.dfe_serial_number,
-             self.subjects, self.afe, self.result)
+             self.subjects, self.afe, self.result, self.rtc, self.timing)
@@ -26,6 +26,8 @@ class DFETestReporter(object):
 
         self.__passed = True
         self.__subjects = OrderedDict()
+        self.__metrics = OrderedDict()                              # dict of subject: TestMetrics
+        self.__elapsed = None                                       # float - seconds
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -34,10 +36,11 @@ class DFETestReporter(object):
         self.__subjects[subject] = '-'
 
 
-    def report_test(self, subject, ok):
+    def report_test(self, subject, ok, metrics=None):
         report = 'OK' if ok else 'FAIL'
 
         self.__subjects[subject] = report
+        self.__report_metrics(subject, metrics)
 
         if self.__verbose:
             print(report, file=sys.stderr)
@@ -47,12 +50,13 @@ class DFETestReporter(object):
             self.__passed = False
 
 
-    def report_exception(self, subject, exception):
+    def report_exception(self, subject, exception, metrics=None):
         # print(exception, file=sys.stderr)
 
         report = exception.__class__.__name__
 
         self.__subjects[subject] = report
+        self.__report_metrics(subject, metrics)
 
         if self.__verbose:
             print(report, file=sys.stderr)
@@ -61,6 +65,20 @@ class DFETestReporter(object):
         self.__passed = False
 
 
+    def report_elapsed(self, elapsed):
+        self.__elapsed = elapsed
+
+
+    def __report_metrics(self, subject, metrics):
+        if metrics is None:
+            return
+
+        self.__metrics[subject] = metrics
+
+        if self.__verbose:
+            print(metrics, file=sys.stderr)
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     @property
@@ -78,6 +96,19 @@ class DFETestReporter(object):
         return 'OK' if self.__passed else 'FAIL'
 
 
+    @property
+    def timing(self):
+        if self.__elapsed is None and not self.__metrics:
+            return None
+
+        jdict = OrderedDict()
+
+        jdict['total'] = None if self.__elapsed is None else round(self.__elapsed, 3)
+        jdict['tests'] = self.__metrics
+
+        return jdict
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     def __str__(self, *args, **kwargs):
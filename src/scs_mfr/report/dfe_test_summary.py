@@ -0,0 +1,228 @@
+"""
+Created on 18 Oct 2026
+
+@author: South Coast Science (contact@southcoastscience.com)
+
+The timing of many DFE test records, aggregated by stage. Each test subject is a stage, and the run as a whole is
+the stage "total". For each stage, the wall times are summarised by their mean, median, 90th percentile and maximum,
+together with the mean time spent waiting for buses, the mean number of holds and hold time of each bus, and the
+number of records in which the stage did not pass.
+
+Records may be DFETestDatum documents, or their val fields. Records without a timing field are counted, but not
+otherwise used.
+
+example document:
+{"stage": "OPC", "count": 2318, "fails": 12, "time": {"mean": 4.861, "median": 4.85, "p90": 4.97, "max": 9.212},
+"wait": 0.004, "buses": {"i2c-sensors": {"holds": 2.0, "time": 0.012}, "spi": {"holds": 2.0, "time": 4.823}}}
+"""
+
+import math
+import statistics
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONable
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class DFETestSummary(object):
+    """
+    classdocs
+    """
+
+    TOTAL = 'total'
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__stages = OrderedDict()                               # dict of stage: DFETestStageSummary
+
+        self.__record_count = 0                                     # int
+        self.__untimed_count = 0                                    # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def add(self, jdict):
+        """
+        Add the timing of a record. Raise ValueError if the timing is malformed.
+        """
+        values = jdict.get('val', jdict)
+        timing = values.get('timing')
+
+        tests = {} if not timing else timing.get('tests') or {}
+
+        for subject, metrics in tests.items():
+            if not isinstance(metrics, dict):
+                raise ValueError("malformed timing for %s" % subject)
+
+        self.__record_count += 1
+
+        if not timing:
+            self.__untimed_count += 1
+            return
+
+        subjects = values.get('subjects') or {}
+
+        self.__stage(self.TOTAL).add(timing.get('total'), None, None, values.get('result'))
+
+        for subject, metrics in tests.items():
+            self.__stage(subject).add(metrics.get('time'), metrics.get('wait'), metrics.get('buses'),
+                                      subjects.get(subject))
+
+
+    def __stage(self, name):
+        if name not in self.__stages:
+            self.__stages[name] = DFETestStageSummary(name)
+
+        return self.__stages[name]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def stages(self, limit=None):
+        """
+        Return the total, then the stages in order of mean time, slowest first - or only the slowest limit stages.
+        """
+        stages = [stage for name, stage in self.__stages.items() if name != self.TOTAL]
+        stages.sort(key=lambda stage: -1 if stage.mean is None else stage.mean, reverse=True)
+
+        if limit is not None:
+            stages = stages[:limit]
+
+        total = self.__stages.get(self.TOTAL)
+
+        return stages if total is None else [total] + stages
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def record_count(self):
+        return self.__record_count
+
+
+    @property
+    def untimed_count(self):
+        return self.__untimed_count
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "DFETestSummary:{stages:%s, record_count:%s, untimed_count:%s}" % \
+               (len(self.__stages), self.record_count, self.untimed_count)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class DFETestStageSummary(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def percentile(ordered, fraction):
+        index = max(0, math.ceil(fraction * len(ordered)) - 1)      # nearest rank
+
+        return ordered[index]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, name):
+        """
+        Constructor
+        """
+        self.__name = name                                          # string
+
+        self.__count = 0                                            # int
+        self.__fails = 0                                            # int
+        self.__times = []                                           # list of float
+        self.__waits = []                                           # list of float
+        self.__holds = OrderedDict()                                # dict of bus: total holds
+        self.__held = OrderedDict()                                 # dict of bus: total seconds
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def add(self, elapsed, wait, buses, result):
+        self.__count += 1
+
+        if result is not None and result not in ('OK', '-'):
+            self.__fails += 1
+
+        if elapsed is not None:
+            self.__times.append(float(elapsed))
+
+        if wait is not None:
+            self.__waits.append(float(wait))
+
+        for bus, use in (buses or {}).items():
+            self.__holds[bus] = self.__holds.get(bus, 0) + int(use.get('holds', 0))
+            self.__held[bus] = self.__held.get(bus, 0.0) + float(use.get('time', 0.0))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        ordered = sorted(self.__times)
+
+        jdict = OrderedDict()
+
+        jdict['stage'] = self.name
+        jdict['count'] = self.count
+        jdict['fails'] = self.fails
+
+        if ordered:
+            jdict['time'] = OrderedDict([('mean', round(self.mean, 3)),
+                                         ('median', round(statistics.median(ordered), 3)),
+                                         ('p90', round(self.percentile(ordered, 0.9), 3)),
+                                         ('max', round(ordered[-1], 3))])
+        else:
+            jdict['time'] = None
+
+        if self.__waits:
+            jdict['wait'] = round(statistics.mean(self.__waits), 3)
+
+        if self.__holds:
+            jdict['buses'] = OrderedDict((bus, OrderedDict([('holds', round(holds / self.count, 1)),
+                                                            ('time', round(self.__held[bus] / self.count, 3))]))
+                                         for bus, holds in self.__holds.items())
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def name(self):
+        return self.__name
+
+
+    @property
+    def count(self):
+        return self.__count
+
+
+    @property
+    def fails(self):
+        return self.__fails
+
+
+    @property
+    def mean(self):
+        return statistics.mean(self.__times) if self.__times else None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "DFETestStageSummary:{name:%s, count:%s, fails:%s, mean:%s}" % \
+               (self.name, self.count, self.fails, self.mean)
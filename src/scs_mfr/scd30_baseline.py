@@ -13,21 +13,31 @@ The date / time of any change is recorded.
 
 Note that the scs_dev/gasses_sampler process must be restarted for changes to take effect.
 
+If the --file flag is set, the corrections listed in the given JSON or CSV file are applied together, with one load
+and one save of the baseline document. Corrections that name another device tag are ignored, so that one list may be
+used for a fleet. Each correction gives the gas CO2 and exactly one of set, offset or correct and reported values,
+and may give the hmd, tmp and pA of its sample. If any correction cannot be applied, no change is saved. The old and
+new offset are written to stdout.
+
 SYNOPSIS
-scd30_baseline.py [{ { { -s | -o } VALUE | -c CORRECT REPORTED } [-t TEMP -m HUMID [-p PRESS]] | -z  | -d }] [-v]
+scd30_baseline.py [{ { { -s | -o } VALUE | -c CORRECT REPORTED } [-t TEMP -m HUMID [-p PRESS]] | -f FILE | -z  |
+-d }] [-v]
 
 EXAMPLES
 ./baseline.py -c 10 23
+./scd30_baseline.py -f ~/colocation/corrections.csv
 
 DOCUMENT EXAMPLE
 {"CO2": {"calibrated-on": "2022-03-21T12:46:52Z", "offset": 321, "env": {"hmd": 54.3, "tmp": 21.3, "pA": 99.6}}}
 
 FILES
 ~/SCS/conf/baseline.json
+~/SCS/conf/baseline_history.json
 
 SEE ALSO
 scs_dev/gases_sampler
 scs_mfr/scd30_conf
+scs_mfr/baseline_history
 """
 
 import sys
@@ -39,10 +49,13 @@ from scs_core.gas.scd30.scd30_baseline import SCD30Baseline
 from scs_core.gas.sensor_baseline import SensorBaseline, SensorBaselineSample
 
 from scs_core.sys.logging import Logging
+from scs_core.sys.system_id import SystemID
 
-from scs_host.bus.i2c import I2C
 from scs_host.sys.host import Host
 
+from scs_mfr.baseline.baseline_correction import BaselineCorrection, BaselineCorrectionReport
+from scs_mfr.baseline.baseline_history import BaselineHistory
+
 from scs_mfr.cmd.cmd_scd30_baseline import CmdSCD30Baseline
 
 
@@ -50,9 +63,6 @@ from scs_mfr.cmd.cmd_scd30_baseline import CmdSCD30Baseline
 
 if __name__ == '__main__':
 
-    sht = None
-    barometer = None
-
     now = LocalizedDatetime.now().utc()
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -70,12 +80,17 @@ if __name__ == '__main__':
     logger.info(cmd)
 
     try:
-        I2C.Sensors.open()
-
         # ------------------------------------------------------------------------------------------------------------
         # resources...
 
         baseline = SCD30Baseline.load(Host)
+        history = BaselineHistory(BaselineHistory.filename(Host))
+
+        try:
+            corrections = None if cmd.file is None else BaselineCorrection.load_file(cmd.file)
+        except (OSError, ValueError) as ex:
+            logger.error("corrections: %s" % ex)
+            exit(1)
 
 
         # ------------------------------------------------------------------------------------------------------------
@@ -105,15 +120,54 @@ if __name__ == '__main__':
             print("baseline: %s" % baseline)
             baseline.save(Host)
 
+            history.record(now, 'scd30', {'CO2': baseline.sensor_baseline})
+
             logger.info("was: %s now: %s" % (old_offset, new_offset))
 
+        # batch...
+        elif corrections is not None:
+            baseline = SCD30Baseline.load(Host, skeleton=True)
+
+            system_id = SystemID.load(Host)
+            report = BaselineCorrectionReport(None if system_id is None else system_id.message_tag())
+
+            for correction in corrections:
+                if not correction.applies_to(report.tag):
+                    report.skip()
+                    continue
+
+                if correction.gas != 'CO2':
+                    logger.error("%s: the SCD30 baseline is for CO2 only." % correction.gas)
+                    exit(2)
+
+                old_offset = baseline.sensor_baseline.offset
+                new_offset = correction.new_offset(old_offset)
+
+                baseline = SCD30Baseline(SensorBaseline(now, new_offset, sample=correction.sample))
+                report.add(correction.gas, old_offset, new_offset)
+
+                logger.info("was: %s now: %s" % (old_offset, new_offset))
+
+            if len(report) > 0:
+                baseline.save(Host)
+
+                history.record(now, 'scd30', {'CO2': baseline.sensor_baseline})
+
+            print(JSONify.dumps(report, indent=cmd.indent))
+            baseline = None
+
         # zero...
         elif cmd.zero:
             baseline = SCD30Baseline(SensorBaseline(now, 0))
             baseline.save(Host)
 
+            history.record(now, 'scd30', {'CO2': baseline.sensor_baseline})
+
         # delete...
         if cmd.delete:
+            if baseline is not None:
+                history.record(now, 'scd30', {'CO2': None})
+
             SCD30Baseline.delete(Host)
             baseline = None
 
@@ -127,6 +181,3 @@ if __name__ == '__main__':
 
     except KeyboardInterrupt:
         print(file=sys.stderr)
-
-    finally:
-        I2C.Sensors.close()
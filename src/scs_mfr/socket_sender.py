@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: South Coast Science (contact@southcoastscience.com)
+
+DESCRIPTION
+The socket_sender utility is used to send documents from stdin to a TCP socket on a remote host. Each document is
+sent as one line of text, terminated by a newline character.
+
+All documents are sent over a single connection, which is held open for the life of the utility. Documents are held
+in a queue, and all the documents that are waiting are sent in a single write, so that the sender keeps up with a
+fast input without a network operation per document.
+
+If the connection cannot be made, or is lost, it is re-established with an exponential backoff of up to 30 seconds,
+and documents are held in the queue meanwhile. When the queue is full, the utility stops reading stdin until there
+is space - so that upstream utilities are held back rather than losing data - unless the --discard-oldest flag is
+set, in which case the oldest waiting documents are discarded. A write that fails part-way is repeated in full, so
+the receiver may see a document twice after a reconnection. Because TCP does not confirm delivery, documents that
+had been written to a connection shortly before it was lost may be lost with it.
+
+At the end of input, or on SIGTERM or keyboard interrupt, the utility waits up to TIMEOUT seconds for queued
+documents to be sent. The exit status is 1 if any document was discarded or left unsent.
+
+SYNOPSIS
+socket_sender.py HOSTNAME [-p PORT] [-q SIZE] [-d] [-t TIMEOUT] [-e] [-v]
+
+EXAMPLES
+csv_reader.py climate.csv | socket_sender.py -v -q 50000 analysis.local
+
+SEE ALSO
+scs_analysis/socket_receiver
+scs_mfr/csv_writer
+"""
+
+import signal
+import sys
+
+from scs_mfr.cmd.cmd_socket_sender import CmdSocketSender
+
+from scs_mfr.comms.buffered_socket_sender import BufferedSocketSender
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    sender = None
+
+    document_count = 0
+    unsent_count = 0
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # cmd...
+
+    cmd = CmdSocketSender()
+
+    if not cmd.is_valid():
+        cmd.print_help(sys.stderr)
+        exit(2)
+
+    if cmd.verbose:
+        print("socket_sender: %s" % cmd, file=sys.stderr)
+        sys.stderr.flush()
+
+    # terminate as on an interrupt, so that queued documents are sent, and unsent documents set the exit status...
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+
+    try:
+        # ------------------------------------------------------------------------------------------------------------
+        # resources...
+
+        sender = BufferedSocketSender(cmd.hostname, cmd.port, queue_size=cmd.queue,
+                                      discard_oldest=cmd.discard_oldest)
+
+        if cmd.verbose:
+            print("socket_sender: %s" % sender, file=sys.stderr)
+            sys.stderr.flush()
+
+
+        # ------------------------------------------------------------------------------------------------------------
+        # run...
+
+        for line in sys.stdin:
+            message = line.strip()
+
+            if not message:
+                continue
+
+            sender.write(message)
+            document_count += 1
+
+            if cmd.echo:
+                print(message)
+                sys.stdout.flush()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # end...
+
+    except KeyboardInterrupt:
+        print(file=sys.stderr)
+
+    finally:
+        if sender is not None:
+            unsent_count = sender.close(timeout=cmd.timeout)
+
+            if cmd.verbose:
+                print("socket_sender: %s" % sender, file=sys.stderr)
+
+        if cmd.verbose:
+            print("socket_sender: documents: %d unsent: %d" % (document_count, unsent_count), file=sys.stderr)
+
+    if unsent_count > 0 or (sender is not None and sender.discarded_count > 0):
+        exit(1)
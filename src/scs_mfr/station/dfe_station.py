@@ -0,0 +1,293 @@
+"""
+Created on 18 Oct 2026
+
+@author: South Coast Science (contact@southcoastscience.com)
+
+A test station: runs dfe_test on many jigs in parallel. Each jig is a host with one DFE attached, named as
+[USER@]HOST:DFE_SERIAL_NUMBER, or as DFE_SERIAL_NUMBER alone for the local host. A serial number is made of letters,
+digits, '.', '_' and '-'. dfe_test is run on a remote host over SSH, in batch mode so that a missing key fails rather
+than prompting, and on the local host as a subprocess.
+
+Each run is a separate process, so runs proceed in parallel without sharing an interpreter; the station's threads
+only wait for them. Results are returned in order of completion. A run that exits without a test record - because
+the host could not be reached, or the utility failed, or the timeout expired - gives a result with an error.
+"""
+
+import json
+import re
+import shlex
+import subprocess
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class DFEStation(object):
+    """
+    classdocs
+    """
+
+    DEFAULT_COMMAND = 'dfe_test.py'
+    DEFAULT_TIMEOUT = 300.0                                         # seconds
+
+    SSH_OPTIONS = ('-o', 'BatchMode=yes', '-o', 'ConnectTimeout=10')
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, jigs, test_args=(), command=DEFAULT_COMMAND, max_workers=None, timeout=DEFAULT_TIMEOUT):
+        """
+        Constructor
+        """
+        self.__jigs = jigs                                          # list of DFEJig
+        self.__test_args = tuple(test_args)                         # tuple of string - dfe_test flags
+        self.__command = command                                    # string
+        self.__max_workers = max_workers                            # int or None (one worker per jig)
+        self.__timeout = timeout                                    # float - seconds
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def run(self):
+        """
+        Yield a DFEStationResult for each jig, as each run completes.
+        """
+        if not self.__jigs:
+            return
+
+        with ThreadPoolExecutor(max_workers=self.__max_workers or len(self.__jigs)) as executor:
+            futures = [executor.submit(self.__conduct, jig) for jig in self.__jigs]
+
+            for future in as_completed(futures):
+                yield future.result()
+
+
+    def __conduct(self, jig):
+        try:
+            completed = subprocess.run(self.args(jig), stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                       timeout=self.__timeout, universal_newlines=True)
+
+        except subprocess.TimeoutExpired:
+            return DFEStationResult(jig, None, "timeout after %s seconds" % self.__timeout)
+
+        except OSError as ex:
+            return DFEStationResult(jig, None, repr(ex))
+
+        lines = [line for line in completed.stdout.splitlines() if line.strip()]
+
+        try:
+            datum = json.loads(lines[-1], object_pairs_hook=OrderedDict)
+
+            if not isinstance(datum, dict) or not isinstance(datum.get('val'), dict):
+                raise ValueError(lines[-1])
+
+        except (IndexError, ValueError):
+            stderr = completed.stderr.strip().splitlines()
+            error = "exit %d: %s" % (completed.returncode, stderr[-1] if stderr else "no output")
+
+            return DFEStationResult(jig, None, error)
+
+        return DFEStationResult(jig, datum, None)
+
+
+    def args(self, jig):
+        test_args = [self.__command] + list(self.__test_args) + [jig.dfe_serial_number]
+
+        if jig.is_local():
+            return test_args
+
+        return ['ssh'] + list(self.SSH_OPTIONS) + [jig.host, ' '.join(shlex.quote(arg) for arg in test_args)]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def jigs(self):
+        return self.__jigs
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "DFEStation:{jigs:%s, test_args:%s, command:%s, max_workers:%s, timeout:%s}" % \
+               ([str(jig) for jig in self.jigs], self.__test_args, self.__command, self.__max_workers,
+                self.__timeout)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class DFEJig(object):
+    """
+    classdocs
+    """
+
+    __SERIAL_NUMBER = re.compile(r'[\w.-]+')                         # so that USER@HOST alone is rejected
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_spec(cls, spec):
+        """
+        Return the jig named by [USER@]HOST:DFE_SERIAL_NUMBER or DFE_SERIAL_NUMBER. Raise ValueError if malformed.
+        """
+        host, _, dfe_serial_number = spec.rpartition(':')
+
+        if spec.count(':') > 0 and not host:
+            raise ValueError(spec)
+
+        if not cls.__SERIAL_NUMBER.fullmatch(dfe_serial_number):
+            raise ValueError(spec)
+
+        return cls(host if host else None, dfe_serial_number)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, host, dfe_serial_number):
+        """
+        Constructor
+        """
+        self.__host = host                                          # string or None (the local host)
+        self.__dfe_serial_number = dfe_serial_number                # string
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_local(self):
+        return self.host is None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def host(self):
+        return self.__host
+
+
+    @property
+    def dfe_serial_number(self):
+        return self.__dfe_serial_number
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return self.dfe_serial_number if self.is_local() else "%s:%s" % (self.host, self.dfe_serial_number)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class DFEStationResult(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, jig, datum, error):
+        """
+        Constructor
+        """
+        self.__jig = jig                                            # DFEJig
+        self.__datum = datum                                        # dict - the DFETestDatum document, or None
+        self.__error = error                                        # string or None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def jig(self):
+        return self.__jig
+
+
+    @property
+    def datum(self):
+        return self.__datum
+
+
+    @property
+    def error(self):
+        return self.__error
+
+
+    @property
+    def result(self):
+        return 'ERROR' if self.datum is None else self.datum['val'].get('result')
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "DFEStationResult:{jig:%s, result:%s, error:%s}" % (self.jig, self.result, self.error)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class DFEStationTally(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, total):
+        """
+        Constructor
+        """
+        self.__total = total                                        # int
+
+        self.__passed = 0                                           # int
+        self.__failed = 0                                           # int
+        self.__errors = 0                                           # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def add(self, result):
+        if result.datum is None:
+            self.__errors += 1
+
+        elif result.result == 'OK':
+            self.__passed += 1
+
+        else:
+            self.__failed += 1
+
+
+    def is_all_passed(self):
+        return self.passed == self.total
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def total(self):
+        return self.__total
+
+
+    @property
+    def passed(self):
+        return self.__passed
+
+
+    @property
+    def failed(self):
+        return self.__failed
+
+
+    @property
+    def errors(self):
+        return self.__errors
+
+
+    @property
+    def remaining(self):
+        return self.total - (self.passed + self.failed + self.errors)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "passed: %d failed: %d errors: %d remaining: %d" % \
+               (self.passed, self.failed, self.errors, self.remaining)
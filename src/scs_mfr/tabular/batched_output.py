@@ -0,0 +1,170 @@
+"""
+Created on 18 Oct 2026
+
+@author: South Coast Science (contact@southcoastscience.com)
+
+A write-batching layer for a text stream. Each write is taken to be one row. Rows are held in memory, and are passed
+to the stream in a single write - followed by a flush - when BATCH_ROWS rows are held, or when FLUSH_INTERVAL
+seconds have passed since the last flush. The interval is enforced by a daemon thread, so that rows are not held
+indefinitely when the input is slow.
+
+The fsync policy determines whether the data are committed to storage:
+never: the stream is flushed to the operating system, but never synchronised
+batch: the stream is synchronised after every batch
+close: the stream is synchronised once, when the output is closed
+
+Text held by hold(..) - such as echoed input that shares the stream - is written in order with the rows, but is not
+counted towards BATCH_ROWS.
+
+Closing the output always writes any rows that are held.
+"""
+
+import os
+import threading
+import time
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class BatchedOutput(object):
+    """
+    classdocs
+    """
+
+    FSYNC_NEVER =       'never'
+    FSYNC_BATCH =       'batch'
+    FSYNC_CLOSE =       'close'
+
+    FSYNC_POLICIES = (FSYNC_NEVER, FSYNC_BATCH, FSYNC_CLOSE)
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, stream, batch_rows=None, flush_interval=None, fsync=FSYNC_NEVER):
+        """
+        Constructor
+        """
+        if fsync not in self.FSYNC_POLICIES:
+            raise ValueError(fsync)
+
+        self.__stream = stream                                      # text stream
+        self.__batch_rows = batch_rows                              # int or None
+        self.__flush_interval = flush_interval                      # float or None
+        self.__fsync = fsync                                        # string
+
+        self.__rows = []                                            # list of string
+        self.__row_count = 0                                        # int
+        self.__last_flush = time.time()                             # float
+        self.__batch_count = 0                                      # int
+        self.__closed = False                                       # bool
+
+        self.__lock = threading.RLock()
+
+        if flush_interval is not None:
+            threading.Thread(target=self.__run, daemon=True).start()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def write(self, row):
+        with self.__lock:
+            self.__rows.append(row)
+            self.__row_count += 1
+
+            if self.__batch_rows is not None and self.__row_count >= self.__batch_rows:
+                self.flush()
+
+        return len(row)
+
+
+    def hold(self, text):
+        with self.__lock:
+            self.__rows.append(text)
+
+        return len(text)
+
+
+    def flush(self):
+        with self.__lock:
+            if self.__rows:
+                rows = self.__rows                                  # released before the write, so that an exit
+                self.__rows = []                                    # during the write cannot repeat the batch
+                self.__row_count = 0
+
+                self.__stream.write(''.join(rows))
+                self.__batch_count += 1
+
+            self.__stream.flush()
+            self.__last_flush = time.time()
+
+            if self.__fsync == self.FSYNC_BATCH:
+                self.__sync()
+
+
+    def close(self):
+        with self.__lock:
+            if self.__closed:
+                return
+
+            self.flush()
+
+            if self.__fsync == self.FSYNC_CLOSE:
+                self.__sync()
+
+            self.__closed = True
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __sync(self):
+        try:
+            os.fsync(self.__stream.fileno())
+        except (AttributeError, OSError, ValueError):
+            pass                                                    # not a file, or a pipe or terminal
+
+
+    def __run(self):
+        while True:
+            with self.__lock:
+                if self.__closed:
+                    return
+
+                remaining = self.__last_flush + self.__flush_interval - time.time()
+
+                if remaining <= 0:
+                    if self.__rows:
+                        self.flush()
+                    else:
+                        self.__last_flush = time.time()
+
+                    remaining = self.__flush_interval
+
+            time.sleep(remaining)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def batch_rows(self):
+        return self.__batch_rows
+
+
+    @property
+    def flush_interval(self):
+        return self.__flush_interval
+
+
+    @property
+    def fsync(self):
+        return self.__fsync
+
+
+    @property
+    def batch_count(self):
+        return self.__batch_count
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "BatchedOutput:{batch_rows:%s, flush_interval:%s, fsync:%s, batch_count:%s}" % \
+               (self.batch_rows, self.flush_interval, self.fsync, self.batch_count)
@@ -0,0 +1,352 @@
+"""
+Created on 18 Oct 2026
+
+@author: South Coast Science (contact@southcoastscience.com)
+
+A columnar (Apache Parquet) writer, for the output of the csv_writer default mode. Columns are named by the same
+paths as the CSV header, and hold typed values, so that readers need neither parse text nor read the columns that
+they do not use.
+
+Rows are held until ROW_GROUP_SIZE rows are present, then written as one compressed row group, with min / max
+statistics for each column. The type of each column - bool, int64, float64 or string - is inferred from the first
+row group: a column holding both int and float values is float64, a column holding any other mixture is string,
+and a column holding no values is null. No value is ever changed to fit its column: a column holding integers
+outside the int64 range, or - with floats - integers that a float64 cannot represent exactly, is string.
+
+A later row group may widen a null column to any type, an int64 column to string, and an int64 column to float64 if
+each of its integers is exactly representable. The file is then rewritten with the widened schema, by way of a
+temporary file in the same directory. A string column accepts values of any type, written as by the CSV writer.
+Any other value that cannot be represented exactly by the type of its column raises a ColumnarTypeError - no value
+is written as null, or rounded, in its place.
+
+The writer requires the pyarrow package, which is an optional dependency.
+
+example reader:
+pyarrow.parquet.read_table('climate.parquet', columns=['rec', 'val.tmp'])
+"""
+
+import json
+import os
+import tempfile
+
+from scs_mfr.tabular.csv_flattener import CSVFlattener
+
+try:
+    import pyarrow
+    import pyarrow.parquet as parquet
+except ImportError:
+    pyarrow = None
+    parquet = None
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ColumnarWriter(object):
+    """
+    classdocs
+    """
+
+    DEFAULT_ROW_GROUP_SIZE = 10000                                  # rows
+
+    COMPRESSIONS = ('snappy', 'gzip', 'zstd', 'none')
+    DEFAULT_COMPRESSION = 'snappy'
+
+    __INT64_MIN = -2 ** 63
+    __INT64_MAX = 2 ** 63 - 1
+
+    __FLOAT64_MAX_INT = 2 ** 53                                     # integers of greater magnitude may be rounded
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def is_available():
+        return pyarrow is not None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, filename, row_group_size=DEFAULT_ROW_GROUP_SIZE, compression=DEFAULT_COMPRESSION):
+        """
+        Constructor
+        """
+        if pyarrow is None:
+            raise ImportError("the columnar format requires the pyarrow package")
+
+        if compression not in self.COMPRESSIONS:
+            raise ValueError(compression)
+
+        self.__filename = filename                                  # string
+        self.__row_group_size = row_group_size                      # int
+        self.__compression = compression                            # string
+
+        self.__flattener = CSVFlattener()                           # CSVFlattener
+
+        self.__rows = []                                            # list of tuple
+        self.__schema = None                                        # pyarrow.Schema
+        self.__writer = None                                        # pyarrow.parquet.ParquetWriter
+
+        self.__row_count = 0                                        # int
+        self.__row_group_count = 0                                  # int
+        self.__rewrite_count = 0                                    # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def write(self, jstr):
+        if jstr is None:
+            return False
+
+        try:
+            document = self.__flattener.loads(jstr)
+        except ValueError:
+            return False
+
+        if not isinstance(document, (dict, list)):
+            return False                                            # a scalar document has no named columns
+
+        if not self.__flattener.header:
+            self.__flattener.header = self.__flattener.paths(document)
+
+        self.__rows.append(self.__flattener.row(document))
+
+        if len(self.__rows) >= self.__row_group_size:
+            self.__write_row_group()
+
+        return True
+
+
+    def close(self):
+        try:
+            if self.__rows:
+                self.__write_row_group()
+
+        finally:
+            if self.__writer is not None:
+                self.__writer.close()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __write_row_group(self):
+        rows = self.__rows
+        self.__rows = []                                            # rows that cannot be written are discarded
+
+        columns = list(zip(*rows))
+
+        if self.__schema is None:
+            schema = pyarrow.schema([pyarrow.field(path, self.__type(column))
+                                     for path, column in zip(self.__flattener.header, columns)])
+        else:
+            schema = pyarrow.schema([pyarrow.field(field.name, self.__widened(field, column))
+                                     for field, column in zip(self.__schema, columns)])
+
+        arrays = [pyarrow.array(self.__cells(field, column), type=field.type)
+                  for field, column in zip(schema, columns)]
+
+        if self.__schema is None:
+            self.__open(schema)
+
+        elif not schema.equals(self.__schema):
+            self.__rewrite(schema, columns)
+
+        self.__writer.write_table(pyarrow.Table.from_arrays(arrays, schema=self.__schema),
+                                  row_group_size=len(rows))
+
+        self.__row_count += len(rows)
+        self.__row_group_count += 1
+
+
+    def __open(self, schema, filename=None):
+        compression = None if self.__compression == 'none' else self.__compression
+
+        self.__schema = schema
+        self.__writer = parquet.ParquetWriter(self.__filename if filename is None else filename, schema,
+                                              compression=compression, write_statistics=True)
+
+
+    def __rewrite(self, schema, columns):
+        self.__writer.close()
+
+        table = parquet.read_table(self.__filename)
+        arrays = []
+
+        for field, widened, array, column in zip(self.__schema, schema, table.columns, columns):
+            try:
+                arrays.append(array.cast(widened.type, safe=True))  # raises if any value would be changed
+
+            except pyarrow.ArrowInvalid:
+                raise ColumnarTypeError(field.name, field.type, self.__kinds(column))
+
+        table = pyarrow.Table.from_arrays(arrays, schema=schema)
+
+        fd, filename = tempfile.mkstemp(suffix='.parquet', dir=os.path.dirname(os.path.abspath(self.__filename)))
+        os.close(fd)
+
+        try:
+            self.__open(schema, filename=filename)
+            self.__writer.write_table(table, row_group_size=self.__row_group_size)
+
+            os.replace(filename, self.__filename)                   # the writer continues with the renamed file
+
+        except BaseException:
+            os.remove(filename)
+            raise
+
+        self.__rewrite_count += 1
+
+
+    def __widened(self, field, column):
+        column_type = self.__type(column)
+
+        if column_type == pyarrow.null() or column_type == field.type or field.type == pyarrow.string():
+            return field.type
+
+        if field.type == pyarrow.null():
+            return column_type
+
+        if field.type == pyarrow.int64() and column_type in (pyarrow.float64(), pyarrow.string()):
+            return column_type                                      # the written values are checked on rewrite
+
+        if field.type == pyarrow.float64() and column_type == pyarrow.int64():
+            return field.type                                       # the values are checked as cells
+
+        raise ColumnarTypeError(field.name, field.type, self.__kinds(column))
+
+
+    def __type(self, column):
+        kinds = set(type(cell) for cell in column if cell is not None)
+
+        if not kinds:
+            return pyarrow.null()                                   # no values - nothing to infer
+
+        if kinds == {bool}:
+            return pyarrow.bool_()
+
+        if kinds == {int}:
+            return pyarrow.int64() if all(self.__is_int64(cell) for cell in column if cell is not None) else \
+                pyarrow.string()
+
+        if kinds == {int, float} or kinds == {float}:
+            return pyarrow.float64() if all(self.__is_float64(cell) for cell in column if type(cell) is int) else \
+                pyarrow.string()
+
+        return pyarrow.string()
+
+
+    def __cells(self, field, column):
+        if field.type == pyarrow.float64():
+            if not all(self.__is_float64(cell) for cell in column if type(cell) is int):
+                raise ColumnarTypeError(field.name, field.type, self.__kinds(column))
+
+            return [None if cell is None else float(cell) for cell in column]
+
+        if field.type == pyarrow.string():
+            return [self.__string(cell) for cell in column]
+
+        return column                                               # the values are of the type of the column
+
+
+    @staticmethod
+    def __kinds(column):
+        return ', '.join(sorted(set(type(cell).__name__ for cell in column if cell is not None)))
+
+
+    @staticmethod
+    def __string(cell):
+        if cell is None or isinstance(cell, str):
+            return cell
+
+        if isinstance(cell, (dict, list)):
+            return json.dumps(cell)                                 # an empty container at a leaf
+
+        return str(cell)                                            # as the CSV writer
+
+
+    @classmethod
+    def __is_int64(cls, value):
+        return cls.__INT64_MIN <= value <= cls.__INT64_MAX
+
+
+    @classmethod
+    def __is_float64(cls, value):
+        return -cls.__FLOAT64_MAX_INT <= value <= cls.__FLOAT64_MAX_INT
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def filename(self):
+        return self.__filename
+
+
+    @property
+    def flattener(self):
+        return self.__flattener
+
+
+    @property
+    def row_count(self):
+        return self.__row_count
+
+
+    @property
+    def row_group_count(self):
+        return self.__row_group_count
+
+
+    @property
+    def rewrite_count(self):
+        return self.__rewrite_count
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "ColumnarWriter:{filename:%s, row_group_size:%s, compression:%s, row_count:%s, " \
+               "row_group_count:%s, rewrite_count:%s, flattener:%s}" % \
+               (self.filename, self.__row_group_size, self.__compression, self.row_count,
+                self.row_group_count, self.rewrite_count, self.flattener)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ColumnarTypeError(ValueError):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, path, column_type, value_types):
+        """
+        Constructor
+        """
+        super().__init__(path, column_type, value_types)
+
+        self.__path = path                                          # string
+        self.__column_type = column_type                            # pyarrow.DataType
+        self.__value_types = value_types                            # string - the names of the Python types
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def path(self):
+        return self.__path
+
+
+    @property
+    def column_type(self):
+        return self.__column_type
+
+
+    @property
+    def value_types(self):
+        return self.__value_types
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "ColumnarTypeError:{path:%s, column_type:%s, value_types:%s}" % \
+               (self.path, self.column_type, self.value_types)
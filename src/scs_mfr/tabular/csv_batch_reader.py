@@ -0,0 +1,287 @@
+"""
+Created on 18 Oct 2026
+
+@author: South Coast Science (contact@southcoastscience.com)
+
+A CSV reader that converts rows to JSON documents a block at a time, so that each block is written in a single
+operation.
+
+Casting and nullification follow the rules of the scs_core CSVReader, cell by cell: a cell becomes an int, a float or
+a bool if it can, and otherwise remains a string. As for the CSVReader, a row whose number of cells does not match
+the header raises a ValueError, once the rows that precede it have been returned.
+
+The header is compiled once into a CSVTemplate, which builds each document directly from the cells of its row. Named
+files are memory-mapped, and decoded in large chunks rather than line by line.
+"""
+
+import csv
+import io
+import itertools
+import locale
+import mmap
+import sys
+
+from scs_core.csv.csv_reader import CSVReaderException
+
+from scs_core.data.json import JSONify
+from scs_core.data.str import Str
+
+from scs_mfr.tabular.csv_template import CSVTemplate
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CSVBatchReader(object):
+    """
+    classdocs
+    """
+
+    DEFAULT_BATCH_SIZE = 1000                                       # rows
+
+    __REPRESENTATIONS_OF_NULL = ('', 'NULL')
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def recast(value):
+        if value is None:
+            return None
+
+        try:
+            return int(value)
+        except ValueError:
+            pass
+
+        try:
+            return float(value)
+        except ValueError:
+            pass
+
+        if value.upper() == 'TRUE':
+            return True
+
+        if value.upper() == 'FALSE':
+            return False
+
+        return value
+
+
+    @classmethod
+    def renullify(cls, value):
+        try:
+            return None if value.upper() in cls.__REPRESENTATIONS_OF_NULL else value
+        except AttributeError:
+            return value
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_for_file(cls, filename, cast=True, nullify=False, batch_size=DEFAULT_BATCH_SIZE):
+        iterable = sys.stdin if filename is None else CSVMappedFile.open(filename)
+
+        return cls(iterable, filename=filename, cast=cast, nullify=nullify, batch_size=batch_size)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, iterable, filename=None, cast=True, nullify=False, batch_size=DEFAULT_BATCH_SIZE):
+        """
+        Constructor
+        """
+        self.__iterable = iterable                                  # iterable
+        self.__filename = filename                                  # string
+        self.__cast = bool(cast)                                    # bool
+        self.__nullify = bool(nullify)                              # bool
+        self.__batch_size = int(batch_size)                         # int
+
+        try:
+            self.__reader = csv.reader(iterable, quoting=csv.QUOTE_ALL, skipinitialspace=True)
+
+            try:
+                paths = next(self.__reader)
+            except StopIteration:                                   # no input
+                paths = []
+
+            self.__read_count = 0                                   # int
+
+            self.__template = CSVTemplate.construct_from_paths(paths)   # CSVTemplate
+
+        except csv.Error as ex:
+            raise CSVReaderException(ex)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def close(self):
+        if self.__filename is None:
+            return
+
+        self.__iterable.close()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def blocks(self):
+        width = len(self.__template)
+
+        if width == 0:
+            return
+
+        while True:
+            rows = []
+            unmatched = None
+            exhausted = True
+            error = None
+
+            try:
+                for row in itertools.islice(self.__reader, self.__batch_size):
+                    exhausted = False
+
+                    if len(row) == 0:
+                        continue
+
+                    if len(row) != width:
+                        unmatched = row
+                        break
+
+                    rows.append(row)
+
+            except csv.Error as ex:
+                error = CSVReaderException(ex)                      # typically on the last line of a badly-closed file
+
+            if rows:
+                yield [JSONify.dumps(self.__template.as_dict(self.__cells(row))) for row in rows]
+
+                self.__read_count += len(rows)
+
+            if unmatched is not None:
+                raise ValueError("unmatched lengths: header: %s row: %s" %
+                                 (list(self.header.paths()), self.__cells(unmatched)))
+
+            if error is not None:
+                raise error
+
+            if exhausted:
+                return
+
+
+    def rows(self):
+        for block in self.blocks():
+            yield from block
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __cells(self, row):
+        if self.__nullify:
+            row = [self.renullify(cell) for cell in row]
+
+        if self.__cast:
+            row = [self.recast(cell) for cell in row]
+
+        return row
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def filename(self):
+        return self.__filename
+
+
+    @property
+    def batch_size(self):
+        return self.__batch_size
+
+
+    @property
+    def read_count(self):
+        return self.__read_count
+
+
+    @property
+    def header(self):
+        return self.__template.header
+
+
+    @property
+    def template(self):
+        return self.__template
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        iterable = self.__iterable.__class__.__name__
+
+        return "CSVBatchReader:{iterable:%s, filename:%s, cast:%s, nullify:%s, batch_size:%s, " \
+               "read_count:%s, template:%s, header:%s}" % \
+               (iterable, self.filename, self.__cast, self.__nullify, self.batch_size,
+                self.read_count, self.template, Str.collection(list(self.header.paths())))
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CSVMappedFile(object):
+    """
+    a memory-mapped text file, iterated by line - lines are split on newline characters only, and are decoded
+    CHUNK_SIZE bytes at a time
+    """
+
+    CHUNK_SIZE = 1 << 20                                            # bytes
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def open(cls, filename, encoding=None):
+        file = open(filename, 'rb')
+
+        try:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            mapped = None                                           # an empty file cannot be mapped
+
+        return cls(file, mapped, locale.getpreferredencoding(False) if encoding is None else encoding)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, file, mapped, encoding):
+        """
+        Constructor
+        """
+        self.__file = file                                          # binary file
+        self.__mapped = mapped                                      # mmap or None
+        self.__encoding = encoding                                  # string
+
+
+    def __iter__(self):
+        if self.__mapped is None:
+            return
+
+        size = len(self.__mapped)
+        start = 0
+
+        while start < size:
+            end = self.__mapped.find(b'\n', min(start + self.CHUNK_SIZE, size) - 1)
+            end = size if end < 0 else end + 1
+
+            yield from io.StringIO(self.__mapped[start:end].decode(self.__encoding), newline='\n')
+
+            start = end
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def close(self):
+        if self.__mapped is not None:
+            self.__mapped.close()
+
+        self.__file.close()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "CSVMappedFile:{name:%s, encoding:%s}" % (self.__file.name, self.__encoding)
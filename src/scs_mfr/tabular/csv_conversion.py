@@ -0,0 +1,161 @@
+"""
+Created on 18 Oct 2026
+
+@author: South Coast Science (contact@southcoastscience.com)
+
+The conversion of a single CSV file to a sequence of JSON documents, written to a spool file in the given
+directory. Conversions are independent of one another, so that they may be run in separate worker processes - the
+conversion object is returned by the worker with its spool filename, row count, elapsed time and any error. Errors
+are held as messages, so that the result can always be passed back to the parent process.
+"""
+
+import os
+import tempfile
+import time
+
+from scs_core.csv.csv_dict import CSVHeaderError
+from scs_core.csv.csv_reader import CSVReaderException
+
+from scs_mfr.tabular.csv_batch_reader import CSVBatchReader
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CSVConversion(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, filename, cast=True, nullify=False, limit=None):
+        """
+        Constructor
+        """
+        self.__filename = filename                          # string
+        self.__cast = bool(cast)                            # bool
+        self.__nullify = bool(nullify)                      # bool
+        self.__limit = limit                                # int or None
+
+        self.__spool = None                                 # string
+        self.__rows = 0                                     # int
+        self.__elapsed = None                               # float
+        self.__error = None                                 # string
+        self.__fatal = False                                # bool
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def spool(self, dirname):
+        start_time = time.time()
+
+        fd, self.__spool = tempfile.mkstemp(suffix='.json', dir=dirname)
+
+        with os.fdopen(fd, 'w') as file:
+            self.__convert(file)
+
+        self.__elapsed = time.time() - start_time
+
+        return self
+
+
+    def discard(self):
+        if self.__spool is None:
+            return
+
+        try:
+            os.remove(self.__spool)
+        except FileNotFoundError:
+            pass
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __convert(self, file):
+        batch_size = CSVBatchReader.DEFAULT_BATCH_SIZE
+
+        if self.__limit is not None:
+            batch_size = max(min(batch_size, self.__limit), 1)
+
+        try:
+            reader = CSVBatchReader.construct_for_file(self.__filename, cast=self.__cast, nullify=self.__nullify,
+                                                       batch_size=batch_size)
+
+        except FileNotFoundError:
+            self.__fail("file not found: %s" % self.__filename)
+            return
+
+        except KeyError as ex:
+            self.__fail("empty header cell in: %s." % ex)
+            return
+
+        except ValueError as ex:
+            self.__fail("duplicate column names in: %s." % ex)
+            return
+
+        try:
+            for block in reader.blocks():
+                if self.__limit is not None:
+                    block = block[:max(self.__limit - self.__rows, 0)]
+
+                if not block:
+                    break
+
+                file.write('\n'.join(block) + '\n')
+
+                self.__rows += len(block)
+
+        except CSVHeaderError as ex:
+            self.__fail("clashing column names: '%s' and '%s'" % (ex.left, ex.right))
+
+        except CSVReaderException as ex:
+            self.__error = "ending file on row %d: %s" % (self.__rows, ex)         # not fatal
+
+        finally:
+            reader.close()
+
+
+    def __fail(self, error):
+        self.__error = error
+        self.__fatal = True
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def filename(self):
+        return self.__filename
+
+
+    @property
+    def spool_filename(self):
+        return self.__spool
+
+
+    @property
+    def rows(self):
+        return self.__rows
+
+
+    @property
+    def elapsed(self):
+        return self.__elapsed
+
+
+    @property
+    def error(self):
+        return self.__error
+
+
+    @property
+    def fatal(self):
+        return self.__fatal
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        elapsed = None if self.elapsed is None else round(self.elapsed, 3)
+
+        return "CSVConversion:{filename:%s, cast:%s, nullify:%s, limit:%s, rows:%s, elapsed:%s, error:%s}" % \
+               (self.filename, self.__cast, self.__nullify, self.__limit, self.rows, elapsed, self.error)
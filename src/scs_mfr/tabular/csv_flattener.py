@@ -0,0 +1,258 @@
+"""
+Created on 18 Oct 2026
+
+@author: South Coast Science (contact@southcoastscience.com)
+
+Flattens JSON documents into CSV rows. The layout of each distinct document shape - its leaf paths, and the
+subscripts that reach them - is worked out once and cached. For each header, the subscripts of each column are
+resolved once per shape, so that a document of a known shape is flattened without walking or splitting any path.
+
+The rules are those of the scs_core CSVDict and PathDict: leaf paths are given in document order, dictionary
+fields are separated by '.' and list members by ':', and a header path that is not a leaf of the document yields
+the null value. A null document is empty, and a scalar document has the single leaf path None.
+
+Documents are parsed with the standard json module, as by the CSVDict, so that integers of any size are preserved.
+"""
+
+import json
+import re
+
+from collections import OrderedDict
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CSVFlattener(object):
+    """
+    classdocs
+    """
+
+    MAX_SHAPES = 256                                    # the cache is cleared if the number of shapes exceeds this
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def loads(jstr):
+        document = json.loads(jstr)                     # ValueError if jstr is not valid JSON
+
+        return OrderedDict() if document is None else document
+
+
+    @classmethod
+    def shape(cls, node):
+        if isinstance(node, dict):
+            return 'd', tuple((key, cls.shape(value)) for key, value in node.items())
+
+        if isinstance(node, list):
+            return 'l', tuple(cls.shape(value) for value in node)
+
+        return None                                     # a leaf
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, header=None):
+        """
+        Constructor
+        """
+        self.__header = None if header is None else tuple(header)     # tuple of string
+        self.__layouts = {}                                         # dict of shape: CSVLayout
+
+        self.__hits = 0                                             # int
+        self.__misses = 0                                           # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def paths(self, document):
+        return self.__layout(document).paths
+
+
+    def row(self, document):
+        return self.__layout(document).extract(self.__header, document)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __layout(self, document):
+        shape = self.shape(document)
+        layout = self.__layouts.get(shape)
+
+        if layout is not None:
+            self.__hits += 1
+            return layout
+
+        self.__misses += 1
+
+        if len(self.__layouts) >= self.MAX_SHAPES:
+            self.__layouts = {}
+
+        layout = self.__layouts[shape] = CSVLayout.construct_from_shape(shape)
+
+        return layout
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def header(self):
+        return self.__header
+
+
+    @header.setter
+    def header(self, header):
+        self.__header = tuple(header)
+
+        for layout in self.__layouts.values():
+            layout.reset()
+
+
+    @property
+    def hits(self):
+        return self.__hits
+
+
+    @property
+    def misses(self):
+        return self.__misses
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        header = None if self.header is None else len(self.header)
+
+        return "CSVFlattener:{header:%s, shapes:%s, hits:%s, misses:%s}" % \
+               (header, len(self.__layouts), self.hits, self.misses)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CSVLayout(object):
+    """
+    the leaf paths of a document shape, with the subscripts that reach each of the header paths
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_shape(cls, shape):
+        paths = []
+
+        if shape is None:
+            paths.append(None)                          # a scalar document, as the PathDict
+        else:
+            cls.__walk(shape, '', paths)
+
+        return cls(shape, paths)
+
+
+    @classmethod
+    def __walk(cls, shape, prefix, paths):
+        if shape is None:
+            paths.append(prefix)
+            return
+
+        kind, members = shape
+
+        if kind == 'd':
+            for key, member in members:
+                cls.__walk(member, prefix + '.' + key if prefix else key, paths)
+
+        else:
+            for index, member in enumerate(members):
+                cls.__walk(member, prefix + ':' + str(index) if prefix else str(index), paths)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, shape, paths):
+        """
+        Constructor
+        """
+        self.__shape = shape                            # shape tuple
+        self.__paths = paths                            # list of string
+        self.__leaves = set(paths)                      # set of string
+        self.__lookups = None                           # list of (tuple of subscript, bool) or None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def extract(self, header, document):
+        if not header:
+            return ()
+
+        if self.__lookups is None:
+            self.__lookups = [self.__lookup(path) if path in self.__leaves else None for path in header]
+
+        return tuple(None if lookup is None else self.__node(document, *lookup) for lookup in self.__lookups)
+
+
+    def reset(self):
+        self.__lookups = None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __lookup(self, path):
+        if path is None:
+            return (), self.__shape is not None         # the whole document
+
+        # the path is split as by the PathDict, so it may reach an internal node...
+        shape = self.__shape
+        subscripts = []
+
+        for name in re.split(r'[.:]', path):
+            if shape is None:
+                raise KeyError(path)                    # the path passes through a leaf
+
+            kind, members = shape
+
+            try:
+                if kind == 'd':
+                    shape = dict(members)[name]
+                    subscripts.append(name)
+                else:
+                    index = int(name)
+                    shape = members[index]
+                    subscripts.append(index)
+
+            except (IndexError, ValueError):
+                raise KeyError(path)
+
+        return tuple(subscripts), shape is not None
+
+
+    @classmethod
+    def __node(cls, document, subscripts, is_internal):
+        node = document
+
+        for subscript in subscripts:
+            node = node[subscript]
+
+        return cls.__ordered(node) if is_internal else node
+
+
+    @classmethod
+    def __ordered(cls, node):
+        # an internal node is written as by the CSVDict, which parses into OrderedDicts...
+        if isinstance(node, dict):
+            return OrderedDict((key, cls.__ordered(value)) for key, value in node.items())
+
+        if isinstance(node, list):
+            return [cls.__ordered(value) for value in node]
+
+        return node
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def paths(self):
+        return self.__paths
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "CSVLayout:{paths:%s, resolved:%s}" % (len(self.paths), self.__lookups is not None)
@@ -0,0 +1,193 @@
+"""
+Created on 18 Oct 2026
+
+@author: South Coast Science (contact@southcoastscience.com)
+
+A CSV header, compiled once into a document template. The header paths are parsed into a tree of dictionary and
+list nodes, and each path is reduced to its column index and its key path - the subscripts of its containers, with
+the kind of each - so that the nested document for a row is built directly from its cells. No header cell is split
+or matched for each row.
+
+The template produces the same documents as CSVHeader.as_dict(..). Headers that cannot be represented as a tree -
+for example, where a path names both a leaf node and an internal node, or where the members of a list are not
+numbered contiguously from zero - are not compiled; documents are then built by the CSVHeader itself, which also
+reports the error, if any.
+
+example header:
+tag,rec,val.hmd,val.pm:0,val.pm:1
+
+example cells - (column index, container key path, leaf key):
+(0, (), 'tag'), (1, (), 'rec'), (2, (('val', False),), 'hmd'), (3, (('val', False), ('pm', True)), 0), ...
+"""
+
+import re
+
+from collections import OrderedDict
+
+from scs_core.csv.csv_dict import CSVHeader
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CSVTemplate(object):
+    """
+    classdocs
+    """
+
+    __NODE = re.compile(r'([^.:]+)([.:])?')                          # as CSVHeaderCell
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_paths(cls, paths):
+        header = CSVHeader.construct_from_paths(paths)              # raises KeyError or ValueError, as CSVReader
+
+        try:
+            cells = cls.__cells(paths)
+
+        except (TypeError, ValueError):
+            cells = None
+
+        return cls(header, cells)
+
+
+    @classmethod
+    def __cells(cls, paths):
+        root = _CSVTemplateNode(False)
+        cells = []
+
+        for index, path in enumerate(paths):
+            nodes = cls.__NODE.findall(path)
+            container = root
+            key_path = []
+
+            for i, (name, separator) in enumerate(nodes):
+                key = int(name) if container.is_list else name      # raises ValueError
+
+                if i == len(nodes) - 1:
+                    container.add_leaf(key, index)                  # raises TypeError on a clash
+                    cells.append((index, tuple(key_path), key))
+                else:
+                    container = container.add_container(key, separator == ':')
+                    key_path.append((key, container.is_list))
+
+        root.validate()                                             # raises ValueError
+
+        return cells
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, header, cells):
+        """
+        Constructor
+        """
+        self.__header = header                              # CSVHeader
+        self.__cells = cells                                # list of (int, tuple, key) or None
+
+
+    def __len__(self):
+        return len(self.__header)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_dict(self, row):
+        if self.__cells is None:
+            return self.__header.as_dict(list(row))
+
+        document = {}
+
+        for index, key_path, key in self.__cells:
+            container = document
+
+            for container_key, is_list in key_path:
+                if isinstance(container, list):
+                    if container_key == len(container):             # list members are met in order
+                        container.append([] if is_list else {})
+
+                    container = container[container_key]
+
+                else:
+                    child = container.get(container_key)
+
+                    if child is None:
+                        child = container[container_key] = [] if is_list else {}
+
+                    container = child
+
+            if isinstance(container, list):
+                container.append(row[index])
+            else:
+                container[key] = row[index]
+
+        return document
+
+
+    def is_compiled(self):
+        return self.__cells is not None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def header(self):
+        return self.__header
+
+
+    @property
+    def cells(self):
+        return self.__cells
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "CSVTemplate:{columns:%s, compiled:%s}" % (len(self), self.is_compiled())
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class _CSVTemplateNode(object):
+    """
+    an internal node of the template tree - a dictionary or a list
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, is_list):
+        """
+        Constructor
+        """
+        self.is_list = is_list                              # bool
+        self.children = OrderedDict()                       # dict of key: _CSVTemplateNode or int (column index)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def add_leaf(self, key, index):
+        if key in self.children:
+            raise TypeError(key)                            # the key already names an internal node
+
+        self.children[key] = index
+
+
+    def add_container(self, key, is_list):
+        child = self.children.get(key)
+
+        if child is None:
+            child = self.children[key] = _CSVTemplateNode(is_list)
+
+        elif not isinstance(child, _CSVTemplateNode) or child.is_list != is_list:
+            raise TypeError(key)                            # the key already names a leaf or another kind of node
+
+        return child
+
+
+    def validate(self):
+        if self.is_list and list(self.children.keys()) != list(range(len(self.children))):
+            raise ValueError("non-contiguous list")
+
+        for child in self.children.values():
+            if isinstance(child, _CSVTemplateNode):
+                child.validate()
@@ -0,0 +1,132 @@
+"""
+Created on 18 Oct 2026
+
+@author: South Coast Science (contact@southcoastscience.com)
+
+A CSV writer for the default (first-document header) mode, with the output of the scs_core CSVWriter. Documents
+are parsed and flattened by a CSVFlattener, so that the cost of flattening each document does not grow with the
+square of its number of fields, and the layout of each document shape is worked out only once.
+
+If batching is requested, rows are written through a BatchedOutput, with the given batch size, flush interval and
+fsync policy. Otherwise, rows written to stdout are flushed one by one, as by the CSVWriter.
+"""
+
+import csv
+import os
+import sys
+
+from scs_mfr.tabular.batched_output import BatchedOutput
+from scs_mfr.tabular.csv_flattener import CSVFlattener
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class FastCSVWriter(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, filename=None, append=False, exclude_header=False, quote_all=False,
+                 batch_rows=None, flush_interval=None, fsync=BatchedOutput.FSYNC_NEVER):
+        """
+        Constructor
+        """
+        self.__filename = filename                                  # string
+        self.__flattener = CSVFlattener()                           # CSVFlattener
+
+        quoting = csv.QUOTE_ALL if quote_all else csv.QUOTE_MINIMAL
+
+        if self.__filename is None:
+            self.__append = append
+
+            self.__file = sys.stdout
+        else:
+            self.__append = append and os.path.exists(self.__filename)
+
+            if self.__append:
+                self.__flattener.header = self.__read_header()
+
+            self.__file = open(self.__filename, "a" if self.__append else "w", newline='')
+
+        if batch_rows is None and flush_interval is None and fsync == BatchedOutput.FSYNC_NEVER:
+            self.__output = None
+        else:
+            batch_rows = 1 if batch_rows is None and flush_interval is None else batch_rows
+            self.__output = BatchedOutput(self.__file, batch_rows=batch_rows, flush_interval=flush_interval,
+                                          fsync=fsync)
+
+        self.__writer = csv.writer(self.__file if self.__output is None else self.__output, quoting=quoting)
+        self.__exclude_header = exclude_header
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def write(self, jstr):
+        if jstr is None:
+            return False
+
+        try:
+            document = self.__flattener.loads(jstr)
+        except ValueError:
+            return False
+
+        if not self.__flattener.header:
+            self.__flattener.header = self.__flattener.paths(document)
+
+            # write header...
+            if not self.__append and not self.__exclude_header:
+                self.__writer.writerow(self.__flattener.header)
+
+        # write row...
+        self.__writer.writerow(self.__flattener.row(document))
+
+        if self.filename is None and self.__output is None:
+            self.__file.flush()
+
+        return True
+
+
+    def close(self):
+        if self.__output is not None:
+            self.__output.close()
+
+        if self.filename is None:
+            return
+
+        self.__file.close()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __read_header(self):
+        with open(self.__filename) as file:
+            try:
+                return next(csv.reader(file))
+            except StopIteration:
+                return []                                           # no header cells present
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def filename(self):
+        return self.__filename
+
+
+    @property
+    def flattener(self):
+        return self.__flattener
+
+
+    @property
+    def output(self):
+        return self.__output
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "FastCSVWriter:{filename:%s, append:%s, exclude_header:%s, flattener:%s, output:%s}" % \
+               (self.filename, self.__append, self.__exclude_header, self.flattener, self.output)
@@ -0,0 +1,153 @@
+"""
+Created on 18 Oct 2026
+
+@author: South Coast Science (contact@southcoastscience.com)
+
+A header-scan CSV writer whose memory use does not grow with its input. In the first pass, each document is appended
+to a temporary spool file, and only the inclusive header row is held in memory. On close, the header is written,
+and the spool is read back and written out one row at a time.
+
+The header is built by the same rules as the scs_core CSVWriter in header-scan mode, and documents are parsed and
+flattened by a CSVFlattener. Scalar documents have no named columns: they are not written, and are counted as skipped.
+
+The spool is created with the tempfile module, so its location follows TMPDIR - on hosts where /tmp is a RAM disk,
+TMPDIR should name a directory on persistent storage.
+"""
+
+import csv
+import sys
+import tempfile
+
+from scs_core.data.path_dict import PathDict
+
+from scs_mfr.tabular.csv_flattener import CSVFlattener
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SpooledCSVWriter(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, filename=None, quote_all=False, spool_dir=None):
+        """
+        Constructor
+        """
+        self.__filename = filename                                  # string
+        self.__paths = []                                           # list of string
+        self.__known_paths = set()                                  # set of string
+        self.__count = 0                                            # int
+        self.__skipped = 0                                          # int
+
+        self.__flattener = CSVFlattener()                           # CSVFlattener
+
+        quoting = csv.QUOTE_ALL if quote_all else csv.QUOTE_MINIMAL
+
+        self.__file = sys.stdout if filename is None else open(filename, "w", newline='')
+        self.__writer = csv.writer(self.__file, quoting=quoting)
+
+        self.__spool_dir = tempfile.gettempdir() if spool_dir is None else spool_dir
+        self.__spool = tempfile.TemporaryFile(mode='w+', dir=self.__spool_dir, prefix='csv_writer-', suffix='.json')
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def write(self, jstr):
+        if jstr is None:
+            return False
+
+        try:
+            document = self.__flattener.loads(jstr)
+        except ValueError:
+            return False
+
+        if not isinstance(document, (dict, list)):
+            self.__skipped += 1                                     # a scalar document has no named columns
+            return False
+
+        self.__update_paths(self.__flattener.paths(document))
+
+        self.__spool.write(jstr)
+        self.__spool.write('\n')
+        self.__count += 1
+
+        return True
+
+
+    def close(self):
+        try:
+            # write header...
+            self.__writer.writerow(self.__paths)
+
+            # write rows...
+            self.__flattener.header = self.__paths
+            self.__spool.seek(0)
+
+            for line in self.__spool:
+                self.__writer.writerow(self.__flattener.row(self.__flattener.loads(line)))
+
+        finally:
+            self.__spool.close()
+
+            if self.filename is not None:
+                self.__file.close()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __update_paths(self, datum_paths):
+        if self.__known_paths.issuperset(datum_paths):
+            return                                                  # the usual case - no new paths
+
+        appended_paths = []
+
+        for i in range(len(datum_paths)):
+            if datum_paths[i] not in self.__known_paths and not self.__is_sub_path(datum_paths[i], self.__paths):
+                self.__paths.insert(i, datum_paths[i])
+                appended_paths.append(datum_paths[i])
+
+        if appended_paths:
+            for i in reversed(range(len(self.__paths))):
+                if self.__is_sub_path(self.__paths[i], appended_paths):
+                    self.__paths.pop(i)
+
+        self.__known_paths = set(self.__paths)
+
+
+    @staticmethod
+    def __is_sub_path(candidate, paths):
+        for path in paths:
+            if candidate == path:
+                return False                                        # paths are unique
+
+            if PathDict.sub_path_includes_path(candidate, path):
+                return True
+
+        return False
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def filename(self):
+        return self.__filename
+
+
+    @property
+    def count(self):
+        return self.__count
+
+
+    @property
+    def skipped(self):
+        return self.__skipped
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "SpooledCSVWriter:{filename:%s, spool_dir:%s, count:%s, skipped:%s, paths:%s}" % \
+               (self.filename, self.__spool_dir, self.count, self.skipped, len(self.__paths))
@@ -6,9 +6,9 @@ Created on 18 May 2017
 
 import sys
 
-from scs_host.bus.i2c import I2C
 from scs_host.sys.host import Host
 
+from scs_mfr.test.resources import TestResources
 from scs_mfr.test.test import Test
 
 
@@ -31,28 +31,23 @@ class AFETest(Test):
         if self.verbose:
             print("AFE...", file=sys.stderr)
 
-        try:
-            I2C.Sensors.open()
-
+        with self.hold(TestResources.I2C_SENSORS):
             # AFE...
             afe = self.interface.gas_sensors(Host)
 
             # test...
             self._datum = afe.sample()
 
-            if self.verbose:
-                print(self._datum, file=sys.stderr)
-
-            ok = True
+        if self.verbose:
+            print(self._datum, file=sys.stderr)
 
-            # test criterion...
-            for gas, sensor in self._datum.sns.items():
-                sensor_ok = 0.9 < sensor.we_v < 1.1 and 0.9 < sensor.ae_v < 1.1
+        ok = True
 
-                if not sensor_ok:
-                    ok = False
+        # test criterion...
+        for gas, sensor in self._datum.sns.items():
+            sensor_ok = 0.9 < sensor.we_v < 1.1 and 0.9 < sensor.ae_v < 1.1
 
-            return ok
+            if not sensor_ok:
+                ok = False
 
-        finally:
-            I2C.Sensors.close()
+        return ok
@@ -14,9 +14,9 @@ from scs_core.sys.eeprom_image import EEPROMImage
 
 from scs_dfe.interface.component.cat24c32 import CAT24C32
 
-from scs_host.bus.i2c import I2C
 from scs_host.sys.host import Host
 
+from scs_mfr.test.resources import TestResources
 from scs_mfr.test.test import Test
 
 
@@ -44,12 +44,10 @@ class EEPROMTest(Test):
             print("error: eeprom image not found", file=sys.stderr)
             exit(1)
 
-        try:
-            # resources...
-            # Host.enable_eeprom_access()               # TODO: test whether EEPROM access is required
-
-            I2C.EEPROM.open()
+        # resources...
+        # Host.enable_eeprom_access()                   # TODO: test whether EEPROM access is required
 
+        with self.hold(TestResources.I2C_EEPROM):
             eeprom = CAT24C32()
 
             # test...
@@ -58,6 +56,3 @@ class EEPROMTest(Test):
 
             # test criterion...
             return eeprom.image == file_image
-
-        finally:
-            I2C.EEPROM.close()
@@ -10,9 +10,9 @@ from scs_core.position.nmea.gprmc import GPRMC
 
 from scs_dfe.gps.pam_7q import PAM7Q
 
-from scs_host.bus.i2c import I2C
 from scs_host.sys.host import Host
 
+from scs_mfr.test.resources import TestResources
 from scs_mfr.test.test import Test
 
 
@@ -38,16 +38,16 @@ class GPSTest(Test):
         gps = None
 
         try:
-            I2C.Sensors.open()
-
             # GPS...
             gps = PAM7Q(self.interface, Host.gps_device())
 
-            gps.power_on()
+            with self.hold(TestResources.I2C_SENSORS):
+                gps.power_on()
+
             gps.open()
 
             # test...
-            self._datum = gps.report(GPRMC)
+            self._datum = gps.report(GPRMC)                 # on the UART - the bus is free for other tests
 
             if self.verbose:
                 print(self._datum, file=sys.stderr)
@@ -58,6 +58,6 @@ class GPSTest(Test):
         finally:
             if gps:
                 gps.close()
-                gps.power_off()
 
-            I2C.Sensors.close()
+                with self.hold(TestResources.I2C_SENSORS):
+                    gps.power_off()
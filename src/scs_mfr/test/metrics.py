@@ -0,0 +1,110 @@
+"""
+Created on 18 Oct 2026
+
+@author: South Coast Science (contact@southcoastscience.com)
+
+The cost of one DFE test: its wall time, the time that it spent waiting for buses held by other tests, and, for each
+bus, the number of times that the test held it and the time for which it was held. Each hold is one bus transaction
+of the test - for example, setting the RTC, or sampling an SHT.
+
+example document:
+{"time": 2.107, "wait": 0.003, "buses": {"i2c-sensors": {"holds": 2, "time": 0.101}}}
+"""
+
+import threading
+import time
+
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from scs_core.data.json import JSONable
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class TestMetrics(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__elapsed = None                                       # float - seconds
+        self.__wait = 0.0                                           # float - seconds
+        self.__holds = OrderedDict()                                # dict of bus: int
+        self.__held = OrderedDict()                                 # dict of bus: float - seconds
+
+        self.__lock = threading.Lock()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @contextmanager
+    def measure(self, resources, *buses):
+        """
+        Hold the buses, recording the time spent waiting for them and the time for which they are held.
+        """
+        requested = time.monotonic()
+
+        with resources.hold(*buses):
+            acquired = time.monotonic()
+
+            try:
+                yield
+
+            finally:
+                self.__record(buses, acquired - requested, time.monotonic() - acquired)
+
+
+    def __record(self, buses, wait, held):
+        with self.__lock:
+            self.__wait += wait
+
+            for bus in buses:
+                self.__holds[bus] = self.__holds.get(bus, 0) + 1
+                self.__held[bus] = self.__held.get(bus, 0.0) + held
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        jdict['time'] = None if self.elapsed is None else round(self.elapsed, 3)
+        jdict['wait'] = round(self.wait, 3)
+        jdict['buses'] = OrderedDict((bus, OrderedDict([('holds', holds), ('time', round(self.__held[bus], 3))]))
+                                     for bus, holds in self.__holds.items())
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def elapsed(self):
+        return self.__elapsed
+
+
+    @elapsed.setter
+    def elapsed(self, elapsed):
+        self.__elapsed = elapsed
+
+
+    @property
+    def wait(self):
+        return self.__wait
+
+
+    @property
+    def holds(self):
+        return self.__holds
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "TestMetrics:{elapsed:%s, wait:%s, holds:%s}" % (self.elapsed, self.wait, dict(self.holds))
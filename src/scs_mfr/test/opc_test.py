@@ -8,9 +8,9 @@ import sys
 
 from scs_dfe.particulate.opc_conf import OPCConf
 
-from scs_host.bus.i2c import I2C
 from scs_host.sys.host import Host
 
+from scs_mfr.test.resources import TestResources
 from scs_mfr.test.test import Test
 
 
@@ -35,23 +35,27 @@ class OPCTest(Test):
 
         opc = None
 
-        try:
-            I2C.Sensors.open()
+        # resources...
+        opc_conf = self.conf(OPCConf)
+
+        if opc_conf is None:
+            print("OPCConf not available - skipping.", file=sys.stderr)
+            return False
 
-            # resources...
-            opc_conf = OPCConf.load(Host)
+        # an SPI OPC leaves the sensors bus free while it powers up...
+        opc_bus = TestResources.SPI if opc_conf.uses_spi() else TestResources.I2C_SENSORS
 
-            if opc_conf is None:
-                print("OPCConf not available - skipping.", file=sys.stderr)
-                return False
+        try:
+            with self.hold(TestResources.I2C_SENSORS):
+                opc = opc_conf.opc(self.interface, Host)
 
-            opc = opc_conf.opc(self.interface, Host)
+                self.interface.power_opc(True)
 
-            self.interface.power_opc(True)
-            opc.operations_on()
+            with self.hold(opc_bus):
+                opc.operations_on()
 
-            # test...
-            self._datum = opc.firmware()
+                # test...
+                self._datum = opc.firmware()
 
             if self.verbose:
                 print(self._datum, file=sys.stderr)
@@ -61,7 +65,8 @@ class OPCTest(Test):
 
         finally:
             if opc:
-                opc.operations_off()
-                self.interface.power_opc(False)
+                with self.hold(opc_bus):
+                    opc.operations_off()
 
-            I2C.Sensors.close()
+                with self.hold(TestResources.I2C_SENSORS):
+                    self.interface.power_opc(False)
@@ -6,9 +6,9 @@ Created on 18 May 2017
 
 import sys
 
-from scs_host.bus.i2c import I2C
 from scs_host.sys.host import Host
 
+from scs_mfr.test.resources import TestResources
 from scs_mfr.test.test import Test
 
 
@@ -31,9 +31,7 @@ class Pt1000Test(Test):
         if self.verbose:
             print("Pt1000...", file=sys.stderr)
 
-        try:
-            I2C.Sensors.open()
-
+        with self.hold(TestResources.I2C_SENSORS):
             # AFE...
             if self.interface.pt1000(Host) is None:
                 print("No Pt1000 I2C address set - skipping.", file=sys.stderr)
@@ -44,11 +42,8 @@ class Pt1000Test(Test):
             # test...
             self._datum = afe.sample_pt1000()
 
-            if self.verbose:
-                print(self._datum, file=sys.stderr)
-
-            # test criterion...
-            return 0.3 < self._datum.v < 0.4
+        if self.verbose:
+            print(self._datum, file=sys.stderr)
 
-        finally:
-            I2C.Sensors.close()
+        # test criterion...
+        return 0.3 < self._datum.v < 0.4
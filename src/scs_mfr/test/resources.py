@@ -0,0 +1,67 @@
+"""
+Created on 18 Oct 2026
+
+@author: South Coast Science (contact@southcoastscience.com)
+
+The buses shared by the DFE tests. A test holds a bus only for the operations that use it, so that tests that are
+waiting - for example, for the RTC to tick, or for the OPC to power up - do not prevent others from running.
+
+Where several buses are held together, they are always acquired in the same order, so that concurrent tests cannot
+deadlock. The buses themselves are opened by the TestSession, for the duration of all of the tests.
+"""
+
+import threading
+
+from contextlib import contextmanager
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class TestResources(object):
+    """
+    classdocs
+    """
+
+    I2C_SENSORS = 'i2c-sensors'
+    I2C_EEPROM = 'i2c-eeprom'
+    SPI = 'spi'
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__locks = {}                                           # dict of string: RLock
+        self.__lock = threading.Lock()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @contextmanager
+    def hold(self, *names):
+        locks = [self.__bus_lock(name) for name in sorted(set(names))]
+
+        for lock in locks:
+            lock.acquire()
+
+        try:
+            yield
+
+        finally:
+            for lock in reversed(locks):
+                lock.release()
+
+
+    def __bus_lock(self, name):
+        with self.__lock:
+            if name not in self.__locks:
+                self.__locks[name] = threading.RLock()
+
+            return self.__locks[name]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "TestResources:{buses:%s}" % sorted(self.__locks.keys())
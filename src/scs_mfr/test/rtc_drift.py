@@ -0,0 +1,100 @@
+"""
+Created on 18 Oct 2026
+
+@author: South Coast Science (contact@southcoastscience.com)
+
+The rate of an RTC against the host's monotonic clock, measured from the edges of its seconds tick. Each edge is
+known only to lie within a bracket of host time: for the reference edge, the write that set the clock; for later
+edges, the span from the last read that showed the old second to the end of the first read that showed the new one.
+
+The drift is given in parts per million - positive if the RTC is fast - together with its uncertainty: the sum of the
+half-widths of the two brackets, as a fraction of the window between them. The uncertainty falls as the window grows,
+and is limited by the poll interval and the I2C read time, so that a window of a few seconds resolves a stopped or
+mis-tuned oscillator, but not the tolerance of a crystal.
+
+example document:
+{"ticks": 1, "window": 0.999, "drift": 812.4, "uncertainty": 1733.1}
+"""
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONable
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class RTCDrift(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct(cls, reference, edge, ticks):
+        """
+        Return the drift given the host-time brackets (start, end) of the reference and final edges, ticks apart.
+        """
+        window = (edge[0] + edge[1]) / 2.0 - (reference[0] + reference[1]) / 2.0
+
+        if ticks < 1 or window <= 0:
+            raise ValueError("invalid window: ticks:%s window:%s" % (ticks, window))
+
+        drift = (ticks / window - 1.0) * 1e6
+        uncertainty = ((reference[1] - reference[0]) + (edge[1] - edge[0])) / 2.0 / window * 1e6
+
+        return cls(ticks, window, drift, uncertainty)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, ticks, window, drift, uncertainty):
+        """
+        Constructor
+        """
+        self.__ticks = ticks                                        # int
+        self.__window = window                                      # float - seconds of host time
+        self.__drift = drift                                        # float - ppm
+        self.__uncertainty = uncertainty                            # float - ppm
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        jdict['ticks'] = self.ticks
+        jdict['window'] = round(self.window, 3)
+        jdict['drift'] = round(self.drift, 1)
+        jdict['uncertainty'] = round(self.uncertainty, 1)
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def ticks(self):
+        return self.__ticks
+
+
+    @property
+    def window(self):
+        return self.__window
+
+
+    @property
+    def drift(self):
+        return self.__drift
+
+
+    @property
+    def uncertainty(self):
+        return self.__uncertainty
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "RTCDrift:{ticks:%s, window:%s, drift:%s, uncertainty:%s}" % \
+               (self.ticks, self.window, self.drift, self.uncertainty)
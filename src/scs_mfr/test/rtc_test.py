@@ -2,6 +2,12 @@
 Created on 18 May 2017
 
 @author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+The RTC is set from the host clock, and its seconds register is then polled, to find the edges of its tick. Since
+the DS1338 resets its countdown chain when the seconds register is written, the write that sets the clock is the
+reference edge, and the first tick follows one second later. Between edges, the bus is released, and polling resumes
+a short guard time before the next edge is due. Ticks are counted until the uncertainty of the drift falls to
+TARGET_UNCERTAINTY, or until MAX_TICKS, and the final time is read back to check the calendar registers.
 """
 
 import sys
@@ -13,8 +19,8 @@ from scs_core.data.rtc_datetime import RTCDatetime
 
 from scs_dfe.time.ds1338 import DS1338
 
-from scs_host.bus.i2c import I2C
-
+from scs_mfr.test.resources import TestResources
+from scs_mfr.test.rtc_drift import RTCDrift
 from scs_mfr.test.test import Test
 
 
@@ -25,6 +31,14 @@ class RTCTest(Test):
     test script
     """
 
+    POLL_INTERVAL =             0.001           # seconds
+    GUARD_TIME =                0.05            # seconds before an edge is due
+    TICK_TIMEOUT =              1.5             # seconds after an edge was due
+
+    TARGET_UNCERTAINTY =        5000.0          # ppm
+    MAX_TICKS =                 3
+    MAX_DRIFT =                 10000.0         # ppm
+
     # ----------------------------------------------------------------------------------------------------------------
 
     def __init__(self, interface, verbose):
@@ -37,30 +51,72 @@ class RTCTest(Test):
         if self.verbose:
             print("RTC...", file=sys.stderr)
 
-        try:
-            I2C.Sensors.open()
-
-            # resources...
+        # resources...
+        with self.hold(TestResources.I2C_SENSORS):
             now = LocalizedDatetime.now()
 
             DS1338.init()
 
             # test...
-            rtc_datetime = RTCDatetime.construct_from_localized_datetime(now)
-            DS1338.set_time(rtc_datetime)
+            set_datetime = RTCDatetime.construct_from_localized_datetime(now)
+
+            written = time.monotonic()
+            DS1338.set_time(set_datetime)
+            reference = (written, time.monotonic())
+
+        ticks = 0
+        second = set_datetime.second
+        last_old = reference[1]                             # the register is known to hold second after the write
+        rtc_datetime = None
+
+        while ticks < self.MAX_TICKS:
+            due = (reference[0] + reference[1]) / 2.0 + ticks + 1
+            edge = self.__edge(second, last_old, due)
+
+            if edge is None:
+                break
+
+            (start, end), rtc_datetime = edge
+
+            ticks += (rtc_datetime.second - second) % 60
+            second = rtc_datetime.second
+            last_old = start
+
+            self._datum = RTCDrift.construct(reference, (start, end), ticks)
+
+            if self._datum.uncertainty <= self.TARGET_UNCERTAINTY:
+                break
+
+        if self.verbose:
+            print(self._datum, file=sys.stderr)
+
+        # test criterion...
+        if self._datum is None:
+            return False                                    # the RTC is not running
+
+        zone = tzlocal.get_localzone()
+        elapsed = rtc_datetime.as_localized_datetime(zone).timestamp() - \
+            set_datetime.as_localized_datetime(zone).timestamp()
+
+        return elapsed == ticks and abs(self._datum.drift) - self._datum.uncertainty <= self.MAX_DRIFT
 
-            time.sleep(2)
 
-            rtc_datetime = DS1338.get_time()
-            localized_datetime = rtc_datetime.as_localized_datetime(tzlocal.get_localzone())
+    def __edge(self, second, last_old, due):
+        """
+        Return the host-time bracket of the next change of second, and the datetime read after it, or None.
+        """
+        time.sleep(max(0.0, due - self.GUARD_TIME - time.monotonic()))  # the bus is free for other tests
 
-            self._datum = localized_datetime - now
+        while time.monotonic() < due + self.TICK_TIMEOUT:
+            with self.hold(TestResources.I2C_SENSORS):
+                start = time.monotonic()
+                rtc_datetime = DS1338.get_time()
+                end = time.monotonic()
 
-            if self.verbose:
-                print(self._datum, file=sys.stderr)
+            if rtc_datetime.second != second:
+                return (last_old, end), rtc_datetime
 
-            # test criterion...
-            return 1 <= self._datum.seconds <= 2
+            last_old = start
+            time.sleep(self.POLL_INTERVAL)
 
-        finally:
-            I2C.Sensors.close()
+        return None
@@ -0,0 +1,170 @@
+"""
+Created on 18 Oct 2026
+
+@author: South Coast Science (contact@southcoastscience.com)
+
+Runs DFE tests concurrently. Each test is constructed and conducted on its own thread, and shares the scheduler's
+TestSession, so that tests exclude one another only while they use the same bus. With max_workers of 1, tests are
+run in sequence, in the order in which they were added.
+
+Results are reported in the order in which the tests were added, whatever the order in which they complete. The
+metrics of each test give its wall time - which includes any time spent waiting for a bus - and its use of each bus.
+"""
+
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+from scs_mfr.test.metrics import TestMetrics
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class TestScheduler(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, session, max_workers=None):
+        """
+        Constructor
+        """
+        self.__session = session                                    # TestSession
+        self.__max_workers = max_workers                            # int or None (one worker per test)
+
+        self.__tests = []                                           # list of ScheduledTest
+        self.__elapsed = None                                       # float - seconds
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def add(self, subject, constructor):
+        """
+        Add a test, to be built by calling constructor - or None, if the subject is to be ignored.
+        """
+        self.__tests.append(ScheduledTest(subject, constructor, self.__session))
+
+
+    def run(self):
+        """
+        Conduct the tests, and return them, in the order in which they were added.
+        """
+        runnable = [test for test in self.__tests if not test.ignored]
+        start = time.monotonic()
+
+        if runnable:
+            with ThreadPoolExecutor(max_workers=self.__max_workers or len(runnable)) as executor:
+                for future in [executor.submit(test.conduct) for test in runnable]:
+                    future.result()                                 # re-raises SystemExit
+
+        self.__elapsed = time.monotonic() - start
+
+        return self.__tests
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def session(self):
+        return self.__session
+
+
+    @property
+    def max_workers(self):
+        return self.__max_workers
+
+
+    @property
+    def elapsed(self):
+        return self.__elapsed
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "TestScheduler:{max_workers:%s, tests:%s, elapsed:%s}" % \
+               (self.max_workers, len(self.__tests), self.elapsed)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ScheduledTest(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, subject, constructor, session):
+        """
+        Constructor
+        """
+        self.__subject = subject                                    # string
+        self.__constructor = constructor                            # callable returning Test, or None
+        self.__session = session                                    # TestSession
+
+        self.__test = None                                          # Test
+        self.__ok = None                                            # bool
+        self.__exception = None                                     # Exception
+        self.__metrics = None                                       # TestMetrics
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def conduct(self):
+        start = time.monotonic()
+
+        try:
+            self.__test = self.__constructor()
+            self.__test.session = self.__session
+
+            self.__ok = self.__test.conduct()
+
+        except Exception as ex:
+            self.__exception = ex
+
+        finally:
+            self.__metrics = TestMetrics() if self.__test is None else self.__test.metrics
+            self.__metrics.elapsed = time.monotonic() - start
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def subject(self):
+        return self.__subject
+
+
+    @property
+    def ignored(self):
+        return self.__constructor is None
+
+
+    @property
+    def test(self):
+        return self.__test
+
+
+    @property
+    def ok(self):
+        return self.__ok
+
+
+    @property
+    def exception(self):
+        return self.__exception
+
+
+    @property
+    def metrics(self):
+        return self.__metrics
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "ScheduledTest:{subject:%s, ignored:%s, ok:%s, exception:%s, metrics:%s}" % \
+               (self.subject, self.ignored, self.ok,
+                None if self.exception is None else self.exception.__class__.__name__, self.metrics)
@@ -0,0 +1,106 @@
+"""
+Created on 18 Oct 2026
+
+@author: South Coast Science (contact@southcoastscience.com)
+
+The resources shared by the DFE tests of one board. On entry, the session opens each of the named I2C buses once;
+on exit, it closes every bus that it opened, whatever the outcome of the tests. Configuration documents are loaded
+once, on first use, and shared by all tests.
+
+example:
+with TestSession(Host, TestResources.I2C_SENSORS) as session:
+    test.session = session
+    test.conduct()
+"""
+
+import threading
+
+from scs_host.bus.i2c import I2C
+
+from scs_mfr.test.resources import TestResources
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class TestSession(object):
+    """
+    classdocs
+    """
+
+    __BUSES = {
+        TestResources.I2C_SENSORS: I2C.Sensors,
+        TestResources.I2C_EEPROM: I2C.EEPROM
+    }
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, host, *buses):
+        """
+        Constructor
+        """
+        self.__host = host                                          # Host
+        self.__buses = buses                                        # tuple of TestResources bus names
+
+        self.__resources = TestResources()
+        self.__opened = []                                          # list of I2C bus
+        self.__confs = {}                                           # dict of class: instance or None
+
+        self.__lock = threading.Lock()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __enter__(self):
+        try:
+            for name in self.__buses:
+                bus = self.__BUSES[name]
+                bus.open()
+
+                self.__opened.append(bus)
+
+        except BaseException:
+            self.close()
+            raise
+
+        return self
+
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+    def close(self):
+        while self.__opened:
+            self.__opened.pop().close()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def conf(self, conf_class):
+        """
+        Return the host's document of the given PersistentJSONable class, loading it on first use.
+        """
+        with self.__lock:
+            if conf_class not in self.__confs:
+                self.__confs[conf_class] = conf_class.load(self.__host)
+
+            return self.__confs[conf_class]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def host(self):
+        return self.__host
+
+
+    @property
+    def resources(self):
+        return self.__resources
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "TestSession:{buses:%s, opened:%s, confs:%s}" % \
+               (list(self.__buses), len(self.__opened), [conf_class.__name__ for conf_class in self.__confs])
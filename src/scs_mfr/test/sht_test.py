@@ -6,8 +6,7 @@ Created on 18 May 2017
 
 import sys
 
-from scs_host.bus.i2c import I2C
-
+from scs_mfr.test.resources import TestResources
 from scs_mfr.test.test import Test
 
 
@@ -33,22 +32,17 @@ class SHTTest(Test):
         if self.verbose:
             print("%s (0x%02x)..." % (self.__name, self.__sht.addr), file=sys.stderr)
 
-        try:
-            I2C.Sensors.open()
-
+        with self.hold(TestResources.I2C_SENSORS):
             # test...
             self.__sht.reset()
 
             self._datum = self.__sht.sample()
 
-            if self.verbose:
-                print(self._datum, file=sys.stderr)
-
-            # criterion...
-            return 10 < self._datum.humid < 90 and 10 < self._datum.temp < 50
+        if self.verbose:
+            print(self._datum, file=sys.stderr)
 
-        finally:
-            I2C.Sensors.close()
+        # criterion...
+        return 10 < self._datum.humid < 90 and 10 < self._datum.temp < 50
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -6,12 +6,14 @@ Created on 18 May 2017
 
 from abc import ABC, abstractmethod
 
+from scs_mfr.test.metrics import TestMetrics
+
 
 # --------------------------------------------------------------------------------------------------------------------
 
 class Test(ABC):
     """
-    classdocs
+    A test is conducted within a TestSession, which must be set before conduct() is called.
     """
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -19,6 +21,8 @@ class Test(ABC):
     def __init__(self, interface, verbose):
         self.__interface = interface
         self.__verbose = verbose
+        self.__session = None                                       # TestSession
+        self.__metrics = TestMetrics()
 
         self._datum = None
 
@@ -30,6 +34,20 @@ class Test(ABC):
         pass
 
 
+    def hold(self, *buses):
+        """
+        Return a context in which the named buses are used by this test only. Each hold is recorded in the metrics.
+        """
+        return self.__metrics.measure(self.__session.resources, *buses)
+
+
+    def conf(self, conf_class):
+        """
+        Return the session's document of the given class, loaded once for all tests.
+        """
+        return self.__session.conf(conf_class)
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     @property
@@ -47,6 +65,21 @@ class Test(ABC):
         return self.__verbose
 
 
+    @property
+    def metrics(self):
+        return self.__metrics
+
+
+    @property
+    def session(self):
+        return self.__session
+
+
+    @session.setter
+    def session(self, session):
+        self.__session = session
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     def __str__(self, *args, **kwargs):
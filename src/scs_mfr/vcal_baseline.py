@@ -21,21 +21,32 @@ an ozone sensor is identified as Ox.
 
 Note that the greengrass processes must be restarted for changes to take effect.
 
+If the --file flag is set, the corrections listed in the given JSON or CSV file are applied together - the baseline
+document is loaded and saved once, however many corrections are listed. Corrections that name another device tag are
+ignored, so that one list may be used for a fleet. Each correction gives a gas and exactly one of set or offset
+values, and may give the rec, hmd and tmp of its sample. Offset corrections may only be applied to gases that are
+already in the baseline document. If any correction cannot be applied, no change is saved. The old and new offset of
+each corrected gas are written to stdout.
+
 SYNOPSIS
-vcal_baseline.py [{ -b GAS  | { { -s | -o } GAS VALUE [-r SAMPLE_REC -t SAMPLE_TEMP -m SAMPLE_HUMID] } | -d }] [-v]
+vcal_baseline.py [{ -b GAS  | { { -s | -o } GAS VALUE [-r SAMPLE_REC -t SAMPLE_TEMP -m SAMPLE_HUMID] } | -f FILE |
+-d }] [-v]
 
 EXAMPLES
 ./vcal_baseline.py -o NO2 -5
+./vcal_baseline.py -f ~/colocation/vcal_corrections.csv
 
 DOCUMENT EXAMPLE
 {"NO2": {"calibrated-on": "2022-06-23T08:40:06Z", "offset": 134, "env": null}}
 
 FILES
 ~/SCS/conf/baseline.json
+~/SCS/conf/baseline_history.json
 
 SEE ALSO
 scs_dev/gases_sampler
 scs_mfr/gas_model_conf
+scs_mfr/baseline_history
 """
 
 import sys
@@ -48,9 +59,13 @@ from scs_core.gas.sensor_baseline import SensorBaseline, SensorBaselineSample
 from scs_core.model.gas.vcal_baseline import VCalBaseline
 
 from scs_core.sys.logging import Logging
+from scs_core.sys.system_id import SystemID
 
 from scs_host.sys.host import Host
 
+from scs_mfr.baseline.baseline_correction import BaselineCorrection, BaselineCorrectionReport
+from scs_mfr.baseline.baseline_history import BaselineHistory
+
 from scs_mfr.cmd.cmd_vcal_baseline import CmdVCalBaseline
 
 
@@ -86,6 +101,13 @@ if __name__ == '__main__':
         # resources...
 
         baseline = VCalBaseline.load(Host, skeleton=True)
+        history = BaselineHistory(BaselineHistory.filename(Host))
+
+        try:
+            corrections = None if cmd.file is None else BaselineCorrection.load_file(cmd.file)
+        except (OSError, ValueError) as ex:
+            logger.error("corrections: %s" % ex)
+            exit(1)
 
 
         # ------------------------------------------------------------------------------------------------------------
@@ -107,9 +129,45 @@ if __name__ == '__main__':
             baseline.set_sensor_baseline(cmd.gas_name(), SensorBaseline(now, new_offset, sample=sample))
             baseline.save(Host)
 
+            history.record(now, 'vcal', {cmd.gas_name(): baseline.sensor_baseline(cmd.gas_name())})
+
             if cmd.verbose:
                 logger.info("%s: was: %s now: %s" % (cmd.gas_name(), old_offset, new_offset))
 
+        # batch...
+        if corrections is not None:
+            system_id = SystemID.load(Host)
+            report = BaselineCorrectionReport(None if system_id is None else system_id.message_tag())
+
+            for correction in corrections:
+                if not correction.applies_to(report.tag):
+                    report.skip()
+                    continue
+
+                if correction.correct_value is not None:
+                    logger.error("%s: correct / reported values are not supported for vCal." % correction.gas)
+                    exit(2)
+
+                if correction.offset_value is not None and correction.gas not in baseline.gases():
+                    logger.error("gas '%s' not in baseline group." % correction.gas)
+                    exit(2)
+
+                old_offset = baseline.sensor_offset(correction.gas)
+                new_offset = correction.new_offset(old_offset)
+
+                baseline.set_sensor_baseline(correction.gas, SensorBaseline(now, new_offset, sample=correction.sample))
+                report.add(correction.gas, old_offset, new_offset)
+
+                logger.info("%s: was: %s now: %s" % (correction.gas, old_offset, new_offset))
+
+            if len(report) > 0:
+                baseline.save(Host)
+
+                history.record(now, 'vcal', dict((gas, baseline.sensor_baseline(gas)) for gas in report.gases()))
+
+            print(JSONify.dumps(report, indent=cmd.indent))
+            baseline = None
+
         # baseline...
         if cmd.baseline:
             gas_name = cmd.gas_name()
@@ -123,6 +181,8 @@ if __name__ == '__main__':
 
         # delete...
         if cmd.delete:
+            history.record(now, 'vcal', dict((gas, None) for gas in baseline.gases()))
+
             VCalBaseline.delete(Host)
             baseline = None
 
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: South Coast Science (contact@southcoastscience.com)
+"""
+
+import io
+
+from scs_core.data.json import JSONify
+
+from scs_mfr.baseline.baseline_correction import BaselineCorrection, BaselineCorrectionReport
+
+
+# --------------------------------------------------------------------------------------------------------------------
+# run...
+
+sources = {
+    'JSON array': '[{"tag": "scs-bgx-431", "gas": "NO2", "correct": 10, "reported": 23, '
+                  '"rec": "2023-02-08T12:00:00Z", "hmd": 51.6, "tmp": 21.8}, '
+                  '{"tag": "scs-bgx-432", "gas": "NO2", "set": -12}, '
+                  '{"gas": "Ox", "offset": -4}]',
+    'JSON lines': '{"tag": "scs-bgx-431", "gas": "NO2", "correct": 10, "reported": 23, '
+                  '"rec": "2023-02-08T12:00:00Z", "hmd": 51.6, "tmp": 21.8}\n'
+                  '{"tag": "scs-bgx-432", "gas": "NO2", "set": -12}\n'
+                  '\n'
+                  '{"gas": "Ox", "offset": -4}\n',
+    'CSV': 'tag,gas,set,offset,correct,reported,rec,hmd,tmp\n'
+           'scs-bgx-431,NO2,,,10,23,2023-02-08T12:00:00Z,51.6,21.8\n'
+           'scs-bgx-432,NO2,-12,,,,,,\n'
+           ',Ox,,-4,,,,,\n'
+}
+
+for name, text in sources.items():
+    corrections = BaselineCorrection.load(io.StringIO(text))
+    print("%s: %s" % (name, JSONify.dumps(corrections)))
+
+    assert len(corrections) == 3
+
+    assert [correction.applies_to('scs-bgx-431') for correction in corrections] == [True, False, True]
+    assert [correction.new_offset(5) for correction in corrections] == [-8, -12, 1]
+
+    assert corrections[0].sample is not None
+    assert corrections[1].sample is None
+
+print("-")
+
+# integral numbers...
+for text in ('[{"gas": "NO2", "offset": 10.0}]', 'gas,offset\nNO2,10.0\n', 'gas,offset\nNO2,-4\n'):
+    corrections = BaselineCorrection.load(io.StringIO(text))
+    print("%s: %s" % (text.strip(), JSONify.dumps(corrections)))
+
+    assert isinstance(corrections[0].offset_value, int)
+
+print("-")
+
+# malformed...
+malformed = [
+    '[{"gas": "NO2"}]',                                     # no setter
+    '[{"gas": "NO2", "set": 1, "offset": 2}]',              # two setters
+    '[{"gas": "NO2", "correct": 10}]',                      # no reported
+    '[{"set": 1}]',                                         # no gas
+    '[{"gas": "NO2", "set": "one"}]',                       # not an integer
+    '[{"gas": "NO2", "offset": 10.5}]',                     # not integral
+    '[{"gas": "NO2", "set": true}]',                        # not a number
+    'gas,correct,reported\nNO2,10.5,23\n',                # not integral
+    '[{"gas": "NO2", "set": 1, "rec": "yesterday"}]',       # invalid rec
+    '[{}]',
+    '[null]',
+    '[5]',
+    '[[1, 2]]',
+    '{"gas": "NO2", "set": 1}\n"text"\n'
+]
+
+for text in malformed:
+    try:
+        BaselineCorrection.load(io.StringIO(text))
+        print("%s: accepted" % text.strip())
+
+        assert False
+
+    except ValueError as ex:
+        print("%s: %s" % (text.strip(), ex))
+
+print("-")
+
+# report...
+report = BaselineCorrectionReport('scs-bgx-431')
+report.add('NO2', 5, -8)
+report.add('NO2', -8, -6)
+report.skip()
+
+print(JSONify.dumps(report))
+
+assert report.gases() == ['NO2']
+assert report.skipped == 1
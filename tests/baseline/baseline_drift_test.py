@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: South Coast Science (contact@southcoastscience.com)
+
+Where numpy is installed, the vectorised regressions are compared with the scalar regressions.
+"""
+
+from datetime import timedelta
+
+from scs_core.data.datetime import LocalizedDatetime
+from scs_core.data.json import JSONify
+
+from scs_mfr.baseline import baseline_drift
+from scs_mfr.baseline.baseline_drift import BaselineDrift, BaselineDriftCriteria, BaselineDriftSeries
+from scs_mfr.baseline.baseline_history import BaselineHistory, BaselineHistoryEntry
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+start = LocalizedDatetime.construct_from_iso8601("2022-03-01T12:00:00Z")
+
+
+def rec(days):
+    return start + timedelta(days=days)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+# run...
+
+history = BaselineHistory('/dev/null')
+
+# NO2: one unit per day, recorded a day after each env sample...
+for day in range(0, 50, 5):
+    env = {"rec": rec(day).as_iso8601(), "hmd": 50.0, "tmp": 20.0}
+    history.insert(BaselineHistoryEntry(rec(day + 1), 'afe', 'NO2', 10 - day, env=env))
+
+# Ox: a slow, noisy trend...
+for day in range(0, 100, 10):
+    history.insert(BaselineHistoryEntry(rec(day), 'afe', 'Ox', round(day * 0.1) + (1 if day % 20 else 0)))
+
+# CO: constant since its deletion...
+history.insert(BaselineHistoryEntry(rec(0), 'gas', 'CO', 40))
+history.insert(BaselineHistoryEntry(rec(10), 'gas', 'CO', None))
+history.insert(BaselineHistoryEntry(rec(20), 'gas', 'CO', 3))
+history.insert(BaselineHistoryEntry(rec(30), 'gas', 'CO', 3))
+
+# SO2: a single offset...
+history.insert(BaselineHistoryEntry(rec(0), 'afe', 'SO2', 7))
+
+series = BaselineDriftSeries.construct_all_from_history('scs-bgx-431', history)
+
+for item in series:
+    print(item)
+
+assert [len(item) for item in series] == [10, 10, 2, 1]
+assert series[0].times[0] == start.timestamp()              # the env sample time
+print("-")
+
+engines = ('numpy', 'python') if baseline_drift.numpy is not None else ('python',)
+numpy = baseline_drift.numpy
+
+results = {}
+
+for engine in engines:
+    baseline_drift.numpy = numpy if engine == 'numpy' else None
+
+    drifts = BaselineDrift.construct_all(series)
+
+    for drift in drifts:
+        print("%s: %s" % (engine, JSONify.dumps(drift)))
+
+    assert [drift.gas for drift in drifts] == ['NO2', 'Ox', 'CO']
+
+    assert round(drifts[0].rate, 6) == -1.0 and round(drifts[0].r2, 6) == 1.0
+    assert 0.05 < drifts[1].rate < 0.15 and 0.5 < drifts[1].r2 < 1.0
+    assert drifts[2].rate == 0.0 and drifts[2].r2 is None
+
+    results[engine] = [(round(drift.rate, 9), None if drift.r2 is None else round(drift.r2, 9)) for drift in drifts]
+
+baseline_drift.numpy = numpy
+
+assert len(set(str(result) for result in results.values())) == 1
+print("-")
+
+# assessment...
+criteria = BaselineDriftCriteria(max_rate=0.5, min_r2=0.5, budget=10)
+now = rec(120)
+
+assessments = [criteria.assess(drift, now) for drift in drifts]
+
+for assessment in assessments:
+    print(JSONify.dumps(assessment))
+
+assert assessments[0].flags == ['rate', 'due']
+assert assessments[0].due == drifts[0].end + timedelta(days=10)
+assert assessments[1].flags == [] and assessments[1].due > now
+assert assessments[2].flags == [] and assessments[2].due is None
+
+assert BaselineDriftCriteria(budget=1e300).due(drifts[1]) is None                   # beyond any foreseeable date
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: South Coast Science (contact@southcoastscience.com)
+"""
+
+import os
+import tempfile
+
+from scs_core.data.datetime import LocalizedDatetime
+from scs_core.data.json import PersistentJSONable
+
+from scs_mfr.baseline.baseline_history import BaselineHistory, BaselineHistoryEntry
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+def rec(iso):
+    return LocalizedDatetime.construct_from_iso8601(iso)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class Manager(object):
+    """
+    a stub host
+    """
+
+    def __init__(self, scs_path):
+        self.__scs_path = scs_path
+
+    def scs_path(self):
+        return self.__scs_path
+
+
+# --------------------------------------------------------------------------------------------------------------------
+# run...
+
+directory = tempfile.mkdtemp()
+filename = BaselineHistory.filename(Manager(directory))
+print(filename)
+
+assert os.path.dirname(filename) == os.path.join(directory, PersistentJSONable.conf_dir())
+
+history = BaselineHistory(filename)
+history.append([
+    BaselineHistoryEntry(rec("2022-03-01T12:00:00Z"), 'afe', 'NO2', 5),
+    BaselineHistoryEntry(rec("2022-03-10T12:00:00Z"), 'afe', 'NO2', 8, env={"rec": "2022-03-09T07:45:00Z"}),
+    BaselineHistoryEntry(rec("2022-03-05T12:00:00Z"), 'afe', 'Ox', -2),
+    BaselineHistoryEntry(rec("2022-03-20T12:00:00Z"), 'afe', 'NO2', None)
+])
+
+# damaged lines...
+with open(filename, 'a') as f:
+    f.write('null\n')
+    f.write('{}\n')
+    f.write('5\n')
+    f.write('[1, 2]\n')
+    f.write('"text"\n')
+    f.write('{"rec": "yesterday", "src": "afe", "gas": "NO2", "offset": 1}\n')
+    f.write('\n')
+    f.write('{"rec": "2022-03-15T12:00:00Z", "src": "afe", "gas": "NO2", "offset": 9}\n')      # out of order
+    f.write('{"rec": "2022-03-25T12:00:00Z", "src": "afe", "gas": "NO2", "off')                # truncated
+
+history = BaselineHistory.load(filename)
+print(history)
+
+assert len(history) == 5
+assert history.rejected_count == 7
+print("-")
+
+# look-up...
+expected = [
+    ("2022-02-28T12:00:00Z", None),
+    ("2022-03-01T12:00:00Z", 5),
+    ("2022-03-09T23:59:59Z", 5),
+    ("2022-03-10T12:00:00Z", 8),
+    ("2022-03-15T11:59:59Z", 8),
+    ("2022-03-16T00:00:00Z", 9),
+    ("2022-03-21T00:00:00Z", None)                  # the baseline was deleted
+]
+
+for iso, offset in expected:
+    print("NO2 at %s: %s" % (iso, history.offset_at('afe', 'NO2', rec(iso))))
+    assert history.offset_at('afe', 'NO2', rec(iso)) == offset
+
+assert history.offset_at('afe', 'Ox', rec("2022-03-06T00:00:00Z")) == -2
+assert history.offset_at('gas', 'NO2', rec("2022-03-06T00:00:00Z")) is None
+print("-")
+
+entries = list(history.entries(source='afe', gas='NO2', start=rec("2022-03-12T00:00:00Z")))
+print("NO2 since 2022-03-12: %s" % [entry.offset for entry in entries])
+
+assert [entry.offset for entry in entries] == [8, 9, None]
+
+assert history.path == filename
+
+os.remove(filename)
+os.rmdir(os.path.dirname(filename))
+os.rmdir(directory)
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: South Coast Science (contact@southcoastscience.com)
+
+Where numpy is installed, the vectorised computation is compared with the scalar computation.
+"""
+
+import io
+import json
+
+from scs_core.data.datetime import LocalizedDatetime
+from scs_core.data.json import JSONify
+
+from scs_mfr.baseline import colocation
+from scs_mfr.baseline.colocation import ColocationOffset, ColocationSeries
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+def iso(timestamp):
+    return LocalizedDatetime.construct_from_timestamp(timestamp).utc().as_iso8601()
+
+
+# --------------------------------------------------------------------------------------------------------------------
+# run...
+
+start = 1675857600.0                                        # 2023-02-08T12:00:00Z
+
+device_lines = []
+reference_lines = []
+
+for i in range(100):
+    temp = 15.0 + i * 0.1
+    reported = 20.0 + (i % 7)
+    correct = reported + 7.0 if i % 10 else reported + 80.0     # every tenth point is a plume
+
+    device_lines.append(json.dumps({"rec": iso(start + i * 60.0 + 5.0),
+                                    "val": {"NO2": {"cnc": reported}, "sht": {"tmp": temp, "hmd": 50.0}}}))
+    reference_lines.append(json.dumps({"rec": iso(start + i * 60.0), "NO2": correct}))
+
+device_lines.append('{"rec": "yesterday", "val": {"NO2": {"cnc": 1.0}}}')
+device_lines.append('5')
+
+device = ColocationSeries.load(io.StringIO('\n'.join(device_lines)), 'val.NO2.cnc',
+                               temp_path='val.sht.tmp', humid_path='val.sht.hmd')
+
+reference = ColocationSeries.load(io.StringIO('rec,NO2\n' + '\n'.join(
+    '%s,%s' % (json.loads(line)['rec'], json.loads(line)['NO2']) for line in reference_lines)), 'NO2')
+
+print(device)
+print(reference)
+
+assert len(device) == 100 and device.rejected_count == 2
+assert len(reference) == 100
+print("-")
+
+engines = ('numpy', 'python') if colocation.numpy is not None else ('python',)
+numpy = colocation.numpy
+
+results = {}
+
+for engine in engines:
+    colocation.numpy = numpy if engine == 'numpy' else None
+
+    offset = ColocationOffset.construct(device, reference)
+    windowed = ColocationOffset.construct(device, reference, temp_window=(15.0, 19.95))
+    tight = ColocationOffset.construct(device, reference, tolerance=1.0)
+
+    print("%s: %s" % (engine, JSONify.dumps(offset)))
+    print("%s: windowed: %s" % (engine, JSONify.dumps(windowed)))
+
+    assert offset.offset == 7.0 and offset.mad == 0.0 and offset.count == 100
+    assert windowed.count == 50 and windowed.temp in (17.4, 17.5)          # the median of 15.0 .. 19.9
+    assert tight is None
+
+    results[engine] = (JSONify.dumps(offset), JSONify.dumps(windowed))
+
+colocation.numpy = numpy
+
+assert len(set(results.values())) == 1
+print("-")
+
+print(json.dumps(offset.as_correction('NO2', tag='scs-bgx-431')))
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: South Coast Science (contact@southcoastscience.com)
+"""
+
+import time
+
+from scs_core.data.json import JSONify
+
+from scs_host.sys.host import Host
+
+from scs_mfr.estate.configuration_collector import ConfigurationCollector
+from scs_mfr.estate.configuration_section import ConfigurationSection
+
+
+# --------------------------------------------------------------------------------------------------------------------
+# run...
+
+sections = ConfigurationSection.sections()
+
+for section in sections:
+    print(section)
+print("-")
+
+collector = ConfigurationCollector(Host, sections, timeout=5.0)
+print(collector)
+print("-")
+
+start_time = time.time()
+jdict = collector.collect()
+elapsed_time = time.time() - start_time
+
+print(JSONify.dumps(jdict, indent=4))
+print("-")
+
+for report in collector.reports:
+    print(report)
+print("-")
+
+print("elapsed: %0.3f" % elapsed_time)
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: South Coast Science (contact@southcoastscience.com)
+"""
+
+import time
+
+from scs_mfr.estate.configuration_store import ConfigurationStore, ConfigurationPredicate
+
+
+# --------------------------------------------------------------------------------------------------------------------
+# run...
+
+store = ConfigurationStore()
+
+for i in range(5000):
+    sample = {
+        "tag": "scs-bgx-%d" % i,
+        "rec": "2023-02-28T12:25:24Z",
+        "val": {
+            "afe-baseline": {"sn2": {"calibrated-on": "2023-02-08T12:52:42Z", "offset": i % 200}},
+            "opc-version": {"serial": str(177780000 + i), "firmware": "FirmwareVer=1.17a" if i % 3 else "1.18"},
+            "sim": None
+        }
+    }
+
+    store.insert(sample)
+
+print(store)
+print("-")
+
+queries = ['opc-version.firmware != FirmwareVer=1.17a', 'afe-baseline.sn2.offset > 100',
+           'afe-baseline.sn2.calibrated-on >= 2023-02-01', 'sim == null']
+
+for query in queries:
+    predicate = ConfigurationPredicate.construct_from_expression(query)
+    print(predicate)
+
+    start_time = time.time()
+    rows = store.query([predicate])
+    elapsed_time = time.time() - start_time
+
+    print("matches: %d elapsed: %0.3f ms" % (len(rows), elapsed_time * 1000.0))
+    print("-")
+
+predicates = [ConfigurationPredicate.construct_from_expression(query) for query in queries[:2]]
+
+start_time = time.time()
+rows = store.query(predicates)
+elapsed_time = time.time() - start_time
+
+print("combined matches: %d elapsed: %0.3f ms" % (len(rows), elapsed_time * 1000.0))
+
+updated = store.insert({"tag": "scs-bgx-0", "rec": "2023-03-01T00:00:00Z",
+                        "val": {"opc-version": {"firmware": "1.19"}}})
+print("updated: %s offset: %s" % (updated, store.column('afe-baseline.sn2.offset').value(0)))
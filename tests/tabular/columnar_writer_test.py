@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: South Coast Science (contact@southcoastscience.com)
+
+Requires the pyarrow package.
+"""
+
+import json
+import os
+import tempfile
+
+import pyarrow.parquet as parquet
+
+from scs_mfr.tabular.columnar_writer import ColumnarWriter, ColumnarTypeError
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+def write(filename, documents, row_group_size=2):
+    writer = ColumnarWriter(filename, row_group_size=row_group_size)
+
+    try:
+        for document in documents:
+            writer.write(json.dumps(document))
+
+    finally:
+        writer.close()
+
+    return writer
+
+
+# --------------------------------------------------------------------------------------------------------------------
+# run...
+
+directory = tempfile.mkdtemp()
+filename = os.path.join(directory, 'climate.parquet')
+
+# widening...
+documents = [
+    {"tag": "scs-1", "val": {"tmp": 23, "sim": None}},
+    {"tag": "scs-1", "val": {"tmp": 24, "sim": None}},
+    {"tag": "scs-1", "val": {"tmp": 23.5, "sim": 7}},
+    {"tag": "scs-1", "val": {"tmp": 25, "sim": None}},
+    {"tag": "scs-1", "val": {"tmp": 26, "sim": 8}}
+]
+
+writer = write(filename, documents)
+print(writer)
+
+table = parquet.read_table(filename)
+print(table.schema)
+
+columns = table.to_pydict()
+print("val.tmp: %s" % columns['val.tmp'])
+print("val.sim: %s" % columns['val.sim'])
+
+assert columns['val.tmp'] == [23.0, 24.0, 23.5, 25.0, 26.0]
+assert columns['val.sim'] == [None, None, 7, None, 8]
+assert str(table.schema.field('val.sim').type) == 'int64'
+assert parquet.ParquetFile(filename).metadata.num_row_groups == 3
+assert sorted(os.listdir(directory)) == ['climate.parquet']
+print("-")
+
+# incompatible...
+documents = [
+    {"tag": "scs-1", "val": {"on": True}},
+    {"tag": "scs-1", "val": {"on": False}},
+    {"tag": "scs-1", "val": {"on": 1}}
+]
+
+try:
+    write(filename, documents)
+    print("no ColumnarTypeError raised")
+
+except ColumnarTypeError as ex:
+    print(ex)
+
+rows = parquet.read_table(filename).to_pydict()
+print("rows kept: %s" % rows)
+
+assert rows['val.on'] == [True, False]
+print("-")
+
+# integers outside int64...
+documents = [
+    {"tag": "scs-1", "imei": 1},
+    {"tag": "scs-1", "imei": 12345678901234567890123},
+    {"tag": "scs-1", "imei": 353081090000001234}
+]
+
+write(filename, documents, row_group_size=1)
+
+table = parquet.read_table(filename)
+columns = table.to_pydict()
+print("imei: %s" % columns['imei'])
+
+assert columns['imei'] == ['1', '12345678901234567890123', '353081090000001234']
+assert str(table.schema.field('imei').type) == 'string'
+print("-")
+
+# integers that float64 cannot hold exactly...
+for documents in ([{"val": 2 ** 53 + 1}, {"val": 1.5}], [{"val": 1.5}, {"val": 2 ** 53 + 1}]):
+    try:
+        write(filename, documents, row_group_size=1)
+        raise AssertionError("no ColumnarTypeError raised")
+
+    except ColumnarTypeError as ex:
+        print(ex)
+
+    rows = parquet.read_table(filename).to_pydict()
+    print("rows kept: %s" % rows)
+
+    assert rows['val'] == [documents[0]['val']]
+
+os.remove(filename)
+os.rmdir(directory)
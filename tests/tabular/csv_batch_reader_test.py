@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: South Coast Science (contact@southcoastscience.com)
+
+Compares the documents of the CSVBatchReader with those of the scs_core CSVReader, for several batch sizes.
+"""
+
+import io
+
+from scs_core.csv.csv_reader import CSVReader
+
+from scs_mfr.tabular.csv_batch_reader import CSVBatchReader
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+def documents(reader):
+    rows = []
+
+    try:
+        for row in reader.rows():
+            rows.append(row)
+
+    except ValueError as ex:
+        rows.append("ValueError: %s" % ex)
+
+    return rows
+
+
+# --------------------------------------------------------------------------------------------------------------------
+# run...
+
+cases = {
+    'mixed types': 'tag,val.tmp,val.on\n'
+                   'scs-1,23,true\n'
+                   'scs-2,23.5,FALSE\n'
+                   'scs-3,24,1\n'
+                   'scs-4,x,NULL\n'
+                   'scs-5,12345678901234567890123,\n',
+    'non-ascii': 'tag,unit\n'
+                 'scs-1,°C\n'
+                 'scs-2,µg/m³\n',
+    'short row': 'a,b.c,b.d\n'
+                 '1,2,3\n'
+                 '4,5\n'
+                 '6,7,8\n',
+    'long row': 'a,b:0,b:1\n'
+                '1,2,3\n'
+                '4,5,6,7\n',
+    'empty lines': 'a,b\n'
+                   '\n'
+                   '1,2\n'
+                   '\n'
+                   '3,4\n'
+}
+
+failures = 0
+
+for name, text in cases.items():
+    for nullify in (False, True):
+        expected = documents(CSVReader(io.StringIO(text), nullify=nullify))
+
+        for batch_size in (1, 2, 1000):
+            actual = documents(CSVBatchReader(io.StringIO(text), nullify=nullify, batch_size=batch_size))
+
+            if actual == expected:
+                continue
+
+            failures += 1
+
+            print("%s: nullify:%s batch_size:%d: FAILED" % (name, nullify, batch_size))
+            print("     CSVReader: %s" % expected)
+            print("CSVBatchReader: %s" % actual)
+
+    print("%s: done" % name)
+
+print("-")
+print("failures: %d" % failures)
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: South Coast Science (contact@southcoastscience.com)
+
+Compares the output of the FastCSVWriter with that of the scs_core CSVWriter, for awkward documents.
+"""
+
+import os
+import tempfile
+
+from scs_core.csv.csv_writer import CSVWriter
+
+from scs_mfr.tabular.fast_csv_writer import FastCSVWriter
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+def output(writer_class, jstrs):
+    fd, filename = tempfile.mkstemp(suffix='.csv')
+    os.close(fd)
+
+    try:
+        writer = writer_class(filename=filename)
+
+        written = [writer.write(jstr) for jstr in jstrs]
+        writer.close()
+
+        with open(filename, 'rb') as file:
+            return written, file.read()
+
+    finally:
+        os.remove(filename)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+# run...
+
+cases = {
+    'big ints': [
+        '{"tag": "scs-opc-1", "val": {"imei": 12345678901234567890123, "n": -98765432109876543210}}',
+        '{"tag": "scs-opc-2", "val": {"imei": 353081090000001, "n": 1.5e300}}'
+    ],
+    'sub-tree header path': [
+        '{"a": {"b": {"c": 1}}, "a.b": 5, "x": [1, 2]}',
+        '{"a": {"b": {"c": 2, "d": [3, {"e": 4}]}}, "a.b": 6, "x": [1, 2]}',
+        '{"a": {"b": 7}, "a.b": 8}'
+    ],
+    'top-level scalar': [
+        '5',
+        '"text"',
+        '{"a": 1}',
+        'true'
+    ],
+    'null and empty': [
+        'null',
+        '{}',
+        '{"a": [], "b": {}, "c": [[1, 2], {"d": null}]}',
+        '{"a": [1], "c": [[1]]}'
+    ],
+    'top-level list': [
+        '[1, {"a": 2}, [3, 4]]',
+        '[5]'
+    ],
+    'malformed': [
+        '{"a": 1, "b": "unicode °C"}',
+        '{"a": ',
+        '',
+        '{"b": NaN, "a": 2}'
+    ]
+}
+
+failures = 0
+
+for name, jstrs in cases.items():
+    expected = output(CSVWriter, jstrs)
+    actual = output(FastCSVWriter, jstrs)
+
+    if actual == expected:
+        print("%s: ok" % name)
+        continue
+
+    failures += 1
+
+    print("%s: FAILED" % name)
+    print("   CSVWriter: %s" % str(expected))
+    print("FastCSVWriter: %s" % str(actual))
+
+print("-")
+print("failures: %d" % failures)
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: South Coast Science (contact@southcoastscience.com)
+"""
+
+from scs_core.data.json import JSONify
+
+from scs_mfr.test.rtc_drift import RTCDrift
+
+
+# --------------------------------------------------------------------------------------------------------------------
+# run...
+
+# an exact clock, with 1 ms brackets...
+drift = RTCDrift.construct((100.0, 100.001), (103.0, 103.001), 3)
+print(JSONify.dumps(drift))
+
+assert abs(drift.drift) < 1e-3
+assert abs(drift.uncertainty - 333.3) < 0.1
+
+# a fast clock - 3 ticks in 2.997 s...
+drift = RTCDrift.construct((100.0, 100.0), (102.997, 102.997), 3)
+print(JSONify.dumps(drift))
+
+assert abs(drift.drift - 1001.0) < 0.1
+assert drift.uncertainty == 0.0
+
+# a slow clock - 1 tick in 1.5 s, with a wide bracket...
+drift = RTCDrift.construct((100.0, 100.002), (101.45, 101.554), 1)
+print(JSONify.dumps(drift))
+
+assert drift.drift < -300000.0
+assert abs(drift.uncertainty - 35309.8) < 0.1                   # (0.002 + 0.104) / 2 / 1.501
+print("-")
+
+# invalid windows...
+for reference, edge, ticks in (((100.0, 100.0), (101.0, 101.0), 0),
+                               ((100.0, 100.0), (100.0, 100.0), 1),
+                               ((101.0, 101.0), (100.0, 100.0), 1)):
+    try:
+        RTCDrift.construct(reference, edge, ticks)
+        print("accepted: %s %s %s" % (reference, edge, ticks))
+
+        assert False
+
+    except ValueError as ex:
+        print(ex)